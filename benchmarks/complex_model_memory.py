@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""Compares the memory footprint and instantiation speed of
+:class:`spyne.model.complex.ComplexModel` and
+:class:`spyne.model.complex.CompactComplexModel` instances.
+
+Usage: ::
+
+    $ python benchmarks/complex_model_memory.py [num_instances]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+import tracemalloc
+
+from spyne import ComplexModel, CompactComplexModel, Integer, Unicode, \
+    DateTime
+
+
+def gen_class(base):
+    class Record(base):
+        id = Integer
+        name = Unicode
+        email = Unicode
+        created = DateTime
+        score = Integer
+
+    return Record
+
+
+def measure(cls, n):
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    objs = [cls(id=i, name=u'name', email=u'mail', score=i) for i in range(n)]
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(s.size_diff for s in end.compare_to(start, 'filename'))
+    del objs
+
+    t = min(timeit.repeat(lambda: cls(id=1, name=u'name', score=1),
+                                                       number=10000, repeat=3))
+    return size, t
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 100000
+
+    print("%d instances" % n)
+    for base in (ComplexModel, CompactComplexModel):
+        size, t = measure(gen_class(base), n)
+        print("%-20s %8.1f bytes/instance %8.2f usec/instantiation" %
+                              (base.__name__, size / float(n), t * 1e6 / 10000))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
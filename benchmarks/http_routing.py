@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""Compares :class:`spyne.server.http.HttpRouter` lookups to trying every
+pattern in sequence.
+
+Usage: ::
+
+    $ python benchmarks/http_routing.py [num_patterns]
+"""
+
+from __future__ import print_function
+
+import sys
+import random
+import timeit
+
+from spyne.protocol.http import HttpPattern
+from spyne.server.http import HttpRouter
+
+
+def gen_patterns(n):
+    retval = []
+    verbs = ('GET', 'POST', 'PUT', 'DELETE')
+    for i in range(n // 4):
+        for j, verb in enumerate(verbs):
+            if j % 2 == 0:
+                addr = '/api/v1/resource%d/<id>' % i
+            else:
+                addr = '/api/v1/resource%d/<id>/sub%d' % (i, j)
+            retval.append(HttpPattern(addr, verb=verb))
+
+    return list(reversed(sorted(retval, key=lambda x: (x.address, x.host))))
+
+
+def gen_requests(patterns, n):
+    rng = random.Random(42)
+    retval = []
+    for _ in range(n):
+        patt = rng.choice(patterns)
+        path = patt.address.replace('<id>', str(rng.randint(0, 10000)))
+        retval.append((patt.verb, path, 'localhost'))
+
+    # some misses, too
+    retval.append(('GET', '/api/v2/nonexistent', 'localhost'))
+    return retval
+
+
+def main(argv):
+    num_patterns = int(argv[1]) if len(argv) > 1 else 600
+    num_requests = 1000
+
+    patterns = gen_patterns(num_patterns)
+    requests = gen_requests(patterns, num_requests)
+    router = HttpRouter(patterns)
+
+    for req in requests:
+        assert router.match(*req) == router.match_linear(*req), req
+
+    def run(f):
+        for req in requests:
+            f(*req)
+
+    print("%d patterns, %d requests per run" % (len(patterns), len(requests)))
+    for name, f in (('linear', router.match_linear), ('router', router.match)):
+        t = min(timeit.repeat(lambda: run(f), number=1, repeat=3))
+        print("%-8s %10.1f usec/request" % (name, t * 1e6 / len(requests)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""Compares the throughput of :class:`spyne.server.zeromq.ZeroMQThreadPoolServer`
+and :class:`spyne.server.zeromq.ZeroMQPreforkServer` for a method whose
+response is expensive to serialize. The prefork server should scale with the
+number of cores, the thread pool can't.
+
+Usage: ::
+
+    $ python benchmarks/zeromq_prefork.py [num_workers]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import json
+import signal
+import tempfile
+
+from datetime import datetime
+from multiprocessing import Process, cpu_count
+from time import time
+
+import zmq
+
+from spyne import Application, ServiceBase, ComplexModel, Array, Integer, \
+    Unicode, Double, DateTime, srpc
+from spyne.protocol.json import JsonDocument
+from spyne.server.zeromq import ZeroMQPreforkServer, ZeroMQThreadPoolServer
+
+
+NUM_RECORDS = 200
+REQUESTS_PER_CLIENT = 50
+
+
+class Record(ComplexModel):
+    i = Integer
+    s = Unicode
+    d = Double
+    dt = DateTime
+
+
+class BenchmarkService(ServiceBase):
+    @srpc(Integer, _returns=Array(Record))
+    def get_records(n):
+        now = datetime.now()
+        return [Record(i=i, s=u'record %d' % i, d=i / 3.0, dt=now)
+                                                              for i in range(n)]
+
+
+def _get_app():
+    return Application([BenchmarkService], 'tns',
+                         in_protocol=JsonDocument(), out_protocol=JsonDocument())
+
+
+def _get_url(name):
+    return 'ipc://%s' % os.path.join(tempfile.gettempdir(),
+                               'spyne-bench-%s-%d.ipc' % (name, os.getpid()))
+
+
+def run_thread_pool(url, num_workers):
+    ZeroMQThreadPoolServer(_get_app(), url, num_workers).serve_forever()
+
+
+def run_prefork(url, num_workers):
+    ZeroMQPreforkServer(_get_app(), url, num_workers,
+                                   be_url=_get_url('backend')).serve_forever()
+
+
+def run_client(url, num_requests):
+    request = json.dumps({'get_records': {'n': NUM_RECORDS}}).encode('utf8')
+
+    ctx = zmq.Context()
+    socket = ctx.socket(zmq.REQ)
+    socket.connect(url)
+
+    for _ in range(num_requests):
+        socket.send(request)
+        socket.recv()
+
+    socket.close()
+    ctx.term()
+
+
+def _run_clients(url, num_clients, num_requests):
+    # the clients are processes too, so that they don't compete for the gil.
+    clients = [Process(target=run_client, args=(url, num_requests))
+                                                   for _ in range(num_clients)]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+
+
+def bench(target, num_workers):
+    url = _get_url('frontend')
+    server = Process(target=target, args=(url, num_workers))
+    server.start()
+
+    try:
+        # warm up and wait until all workers are ready.
+        _run_clients(url, num_workers, 2)
+
+        num_clients = num_workers * 2
+        start = time()
+        _run_clients(url, num_clients, REQUESTS_PER_CLIENT)
+        return num_clients * REQUESTS_PER_CLIENT / (time() - start)
+
+    finally:
+        os.kill(server.pid, signal.SIGTERM)
+        server.join()
+
+
+def main(argv):
+    num_workers = int(argv[1]) if len(argv) > 1 else cpu_count()
+
+    print("%d workers, %d records per response" % (num_workers, NUM_RECORDS))
+    for name, target in (('threads', run_thread_pool),
+                                                    ('prefork', run_prefork)):
+        print("%-8s %10.1f requests/sec" % (name, bench(target, num_workers)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
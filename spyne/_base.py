@@ -22,6 +22,7 @@ logger = logging.getLogger(__name__)
 
 from time import time
 from copy import copy
+from timeit import default_timer
 from collections import deque, namedtuple, defaultdict
 
 from spyne.const.xml_ns import DEFAULT_NS
@@ -133,6 +134,8 @@ class MethodContext(object):
             retval.event.parent = retval
         if retval.aux is not None:
             retval.aux.parent = retval
+        if retval.event_handler_times is not None:
+            retval.event_handler_times = dict(retval.event_handler_times)
 
         return retval
 
@@ -170,6 +173,10 @@ class MethodContext(object):
         self.udc = None
         """The user defined context. Use it to your liking."""
 
+        self.event_handler_times = None
+        """Seconds spent in event handlers for this context, keyed by event
+        name. Only populated when :attr:`EventManager.timed` is set."""
+
         self.transport = TransportContext(self, transport)
         """The transport-specific context. Transport implementors can use this
         to their liking."""
@@ -408,7 +415,7 @@ class MethodDescriptor(object):
                  aux=None, patterns=None, body_style=None, args=None,
                  operation_name=None, no_self=None, translations=None, when=None,
                  in_message_name_override=True, out_message_name_override=True,
-                 service_class=None, href=None):
+                 service_class=None, href=None, executor=None):
 
         self.__real_function = function
         """The original callable for the user code."""
@@ -534,6 +541,11 @@ class MethodDescriptor(object):
         later stages of the interface generation. Naturally, it will be up to
         you to resolve name clashes."""
 
+        self.executor = executor
+        """The name of the thread pool that runs this method, or None to run
+        it in the thread of the transport. Only some transports support this,
+        see :class:`spyne.server.twisted.TwistedWebResource`."""
+
     def translate(self, locale, default):
         """
         :param locale: locale string
@@ -580,11 +592,27 @@ class EventManager(object):
     The events are stored in an ordered set. This means that the events are ran
     in the order they were added and adding a handler twice does not cause it to
     run twice.
+
+    Handlers are compiled to a tuple per event name as they are added, so
+    firing an event that has no listeners costs only a dict lookup. This means
+    handlers must be registered via :func:`add_listener` and not by modifying
+    the ``handlers`` dict directly.
+
+    Set ``timed`` to ``True``, on an instance or on the ``EventManager`` class
+    itself to affect every event manager, to have the time spent in handlers
+    accumulated per event name in the ``event_handler_times`` dict of the
+    method context.
     """
 
+    timed = False
+    """When ``True``, time spent in event handlers is recorded to the
+    ``event_handler_times`` attribute of the context, if it has one."""
+
     def __init__(self, parent, handlers={}):
         self.parent = parent
         self.handlers = dict(handlers)
+        self._compiled = dict([(k, tuple(v)) for k, v in self.handlers.items()
+                                                                   if len(v) > 0])
 
     def add_listener(self, event_name, handler):
         """Register a handler for the given event name.
@@ -598,6 +626,7 @@ class EventManager(object):
         handlers = self.handlers.get(event_name, oset())
         handlers.add(handler)
         self.handlers[event_name] = handlers
+        self._compiled[event_name] = tuple(handlers)
 
     def fire_event(self, event_name, ctx, *args, **kwargs):
         """Run all the handlers for a given event name.
@@ -608,10 +637,32 @@ class EventManager(object):
                         stored in ctx.event attribute.
         """
 
-        handlers = self.handlers.get(event_name, oset())
+        handlers = self._compiled.get(event_name, None)
+        if handlers is None:
+            return
+
+        if self.timed:
+            self._fire_event_timed(handlers, event_name, ctx, args, kwargs)
+            return
+
         for handler in handlers:
             handler(ctx, *args, **kwargs)
 
+    @staticmethod
+    def _fire_event_timed(handlers, event_name, ctx, args, kwargs):
+        start = default_timer()
+        try:
+            for handler in handlers:
+                handler(ctx, *args, **kwargs)
+
+        finally:
+            if hasattr(ctx, 'event_handler_times'):
+                times = ctx.event_handler_times
+                if times is None:
+                    ctx.event_handler_times = times = {}
+                times[event_name] = times.get(event_name, 0.0) + \
+                                                        default_timer() - start
+
 
 class FakeContext(object):
     def __init__(self, app=None, descriptor=None,
@@ -28,6 +28,7 @@ from spyne import BODY_STYLE_WRAPPED
 from spyne.error import Fault, Redirect
 from spyne.interface import Interface
 from spyne import EventManager
+from spyne.util.aio import asyncio, get_running_loop, is_awaitable
 from spyne.util.appreg import register_application
 from spyne.error import RespawnError
 
@@ -130,6 +131,14 @@ class Application(object):
         as a native python object. If the function throws an exception, it
         returns None and sets the exception object to ctx.out_error.
 
+        If the user function returns a coroutine or an asyncio future, it's
+        scheduled on the running event loop and ``ctx.out_object`` is set to
+        a single-element list containing an asyncio future that completes
+        once the result is processed. The ``method_return_object`` or
+        ``method_exception_object`` events are fired only after that, so the
+        transport must wait for that future before using ``ctx.out_object``
+        or ``ctx.out_error``.
+
         Overriding this method would break event management. So this is not
         meant to be overridden unless you know what you're doing.
         """
@@ -148,26 +157,49 @@ class Application(object):
                 ctx.in_object = []
 
             # call user method
-            ctx.out_object = self.call_wrapper(ctx)
-
-            # out object is always a sequence of return values. see
-            # MethodContext docstrings for more info
-            if ctx.descriptor.body_style is not BODY_STYLE_WRAPPED or \
-                                len(ctx.descriptor.out_message._type_info) <= 1:
-                # if it's not a wrapped method, OR there's just one return type
-                # we wrap it ourselves
-                ctx.out_object = [ctx.out_object]
+            retval = self.call_wrapper(ctx)
 
-            # Now that the processing is switched to the outgoing message,
-            # point ctx.protocol to ctx.out_protocol
-            ctx.protocol = ctx.outprot_ctx
+            if is_awaitable(retval):
+                ctx.out_object = [self.schedule_awaitable(ctx, retval)]
+            else:
+                self.process_return_value(ctx, retval)
 
-            # fire events
-            self.event_manager.fire_event('method_return_object', ctx)
-            if ctx.service_class is not None:
-                ctx.service_class.event_manager.fire_event(
-                                                    'method_return_object', ctx)
-        except Redirect as e:
+        # we don't catch BaseException because we actually don't want to catch
+        # "system-exiting" exceptions. See:
+        # https://docs.python.org/2/library/exceptions.html#exceptions.Exception
+        except Exception as e:
+            self.process_exception(ctx, e)
+
+    def process_return_value(self, ctx, retval):
+        """Sets ``ctx.out_object`` from the return value of the user function
+        and fires the ``method_return_object`` events."""
+
+        ctx.out_object = retval
+
+        # out object is always a sequence of return values. see
+        # MethodContext docstrings for more info
+        if ctx.descriptor.body_style is not BODY_STYLE_WRAPPED or \
+                            len(ctx.descriptor.out_message._type_info) <= 1:
+            # if it's not a wrapped method, OR there's just one return type
+            # we wrap it ourselves
+            ctx.out_object = [ctx.out_object]
+
+        # Now that the processing is switched to the outgoing message,
+        # point ctx.protocol to ctx.out_protocol
+        ctx.protocol = ctx.outprot_ctx
+
+        # fire events
+        self.event_manager.fire_event('method_return_object', ctx)
+        if ctx.service_class is not None:
+            ctx.service_class.event_manager.fire_event(
+                                                'method_return_object', ctx)
+
+    def process_exception(self, ctx, e):
+        """Sets ``ctx.out_error`` from the exception raised by the user
+        function and fires the relevant events. Must be called from inside
+        the ``except`` block that caught the exception."""
+
+        if isinstance(e, Redirect):
             try:
                 e.do_redirect()
 
@@ -194,7 +226,7 @@ class Application(object):
                     ctx.service_class.event_manager.fire_event(
                                                'method_redirect_exception', ctx)
 
-        except Fault as e:
+        elif isinstance(e, Fault):
             if e.faultcode == 'Client' or e.faultcode.startswith('Client.'):
                 logger_client.exception(e)
             else:
@@ -208,10 +240,7 @@ class Application(object):
                 ctx.service_class.event_manager.fire_event(
                                                'method_exception_object', ctx)
 
-        # we don't catch BaseException because we actually don't want to catch
-        # "system-exiting" exceptions. See:
-        # https://docs.python.org/2/library/exceptions.html#exceptions.Exception
-        except Exception as e:
+        else:
             logger_server.critical(e, **{'exc_info': 1})
 
             ctx.out_error = Fault('Server', get_fault_string_from_exception(e))
@@ -222,6 +251,37 @@ class Application(object):
                 ctx.service_class.event_manager.fire_event(
                                                 'method_exception_object', ctx)
 
+    def schedule_awaitable(self, ctx, retval):
+        """Schedules the coroutine or future returned by the user function on
+        the running event loop. Returns an asyncio future that completes with
+        None once ``ctx.out_object`` or ``ctx.out_error`` is set and the
+        relevant events are fired."""
+
+        loop = get_running_loop()
+        if loop is None:
+            if hasattr(retval, 'close'):  # avoid the "never awaited" warning
+                retval.close()
+            raise RuntimeError("%r returned an awaitable but there's no "
+                               "running event loop" % ctx.descriptor.function)
+
+        retval = asyncio.ensure_future(retval, loop=loop)
+        done = loop.create_future()
+
+        def _cb_done(future):
+            try:
+                try:
+                    self.process_return_value(ctx, future.result())
+                except Exception as e:
+                    self.process_exception(ctx, e)
+
+            finally:
+                if not done.cancelled():
+                    done.set_result(None)
+
+        retval.add_done_callback(_cb_done)
+
+        return done
+
     def call_wrapper(self, ctx):
         """This method calls the call_wrapper method in the service definition.
         This can be overridden to make an application-wide custom exception
@@ -0,0 +1,340 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import logging
+logger = logging.getLogger(__name__)
+
+import os
+import threading
+
+from functools import partial
+from itertools import count
+from multiprocessing import Pool
+
+try:
+    from multiprocessing import SimpleQueue
+except ImportError: # Python 2
+    from multiprocessing.queues import SimpleQueue
+
+from spyne import MethodContext
+from spyne.auxproc import AuxProcBase
+from spyne.interface._base import _generate_method_id
+from spyne.protocol.http import HttpRpc
+from spyne.server import ServerBase
+from spyne.util import six
+
+
+class QueueFullError(Exception):
+    """Raised when an auxiliary method could not be queued because
+    ``max_pending`` methods were already waiting."""
+
+
+class WorkerError(Exception):
+    """Raised when an auxiliary method failed in the worker process. The
+    message is the string representation of the original error."""
+
+
+# The server of the worker process and the queue it reports the tasks it
+# starts to. They are set by the pool initializer.
+_server = None
+_started = None
+
+
+def _init_worker(app, app_factory, started):
+    global _server, _started
+
+    if app_factory is not None:
+        app = app_factory()
+
+    _server = _WorkerServer(app)
+    _started = started
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _process(task_id, method_id, in_string, error):
+    """Runs the auxiliary method ``method_id`` in the worker process. Returns
+    None on success or a string describing the error."""
+
+    _started.put((task_id, os.getpid()))
+
+    try:
+        initial_ctx = MethodContext(_server, MethodContext.SERVER)
+        initial_ctx.in_string = [in_string]
+
+        for ctx in _server.generate_contexts(initial_ctx):
+            if ctx.in_error is not None:
+                return repr(ctx.in_error)
+
+            d = ctx.descriptor
+            if d.aux is not None and \
+                           _generate_method_id(d.service_class, d) == method_id:
+                break
+
+        else:
+            return "Auxiliary method %r not found" % method_id
+
+        ctx.descriptor.aux.initialize_context(ctx, None, error)
+        retval = ctx.descriptor.aux.process(_server, ctx)
+        if retval is not None:
+            return repr(retval)
+
+    except Exception as e:
+        logger.exception(e)
+        return repr(e)
+
+
+class _WorkerServer(ServerBase):
+    """The server that processes auxiliary methods in the worker processes.
+    Initializing it initializes the services and the other auxiliary
+    processors of the application, but not the process pools."""
+
+    transport = 'http://spyne.io/auxproc/process'
+
+
+class ProcessAuxProc(AuxProcBase):
+    """ProcessAuxProc processes auxiliary methods asynchronously in a pool of
+    worker processes, so that cpu-bound auxiliary methods don't compete with
+    request handling for the GIL.
+
+    The request bytes are sent to the workers as they were received and
+    parsed again there with the application's ``in_protocol``. So protocols
+    that read their input from the transport, like
+    :class:`spyne.protocol.http.HttpRpc`, are not supported. The request is
+    parsed with the protocol's default charset.
+
+    Every worker builds a server for the application once when it starts,
+    which calls the ``initialize()`` method of the services and of the other
+    auxiliary processors. By default, the workers use the application instance
+    they inherit from the parent process, which needs the ``fork`` start
+    method of :mod:`multiprocessing`. Pass an ``app_factory`` to build a fresh
+    one instead. It must be picklable, e.g. a module-level function.
+
+    In the workers, ``ctx.aux.parent`` is None and ``ctx.aux.error`` is the
+    string representation of the error of the primary method, if any.
+
+    At most ``max_pending`` auxiliary methods can be queued or running at a
+    time. When that many are pending, :func:`process_context` blocks the
+    caller until one completes. It waits at most ``timeout`` seconds, or not
+    at all when ``block`` is False. Methods that can't be queued fail with
+    :class:`QueueFullError`. ``timeout`` needs Python 3.
+
+    When an auxiliary method fails, ``on_failure`` is called with its
+    context in the parent process and the error, which is either a
+    :class:`QueueFullError`, a :class:`WorkerError` or the exception that
+    prevented the method from being queued. It's called from a pool thread,
+    except for queueing errors.
+
+    When a worker process dies while running an auxiliary method, e.g. when
+    it's killed, the method fails with a :class:`WorkerError` within
+    ``poll_interval`` seconds.
+
+    :param pool_size: The number of worker processes. Defaults to the number
+        of cores.
+    :param max_pending: The max. number of auxiliary methods that can be
+        queued or running at a time.
+    :param block: Whether to wait for a free slot when ``max_pending``
+        methods are pending.
+    :param timeout: The max. number of seconds to wait for a free slot.
+        None means forever.
+    :param on_failure: A callable that takes the auxiliary method context and
+        the error.
+    :param app_factory: A picklable callable that returns the application
+        instance for the workers.
+    :param poll_interval: The number of seconds between checks for dead
+        worker processes.
+    :param process_exceptions: If false, does not execute auxiliary methods
+        when the main method throws an exception.
+    """
+
+    def __init__(self, pool_size=None, max_pending=100, block=True,
+                 timeout=None, on_failure=None, app_factory=None,
+                                 poll_interval=0.1, process_exceptions=False):
+        super(ProcessAuxProc, self).__init__(
+                                        process_exceptions=process_exceptions)
+
+        self.pool = None
+        self.max_pending = max_pending
+        self.block = block
+        self.timeout = timeout
+        self.on_failure = on_failure
+        self.app_factory = app_factory
+        self.poll_interval = poll_interval
+
+        self.__pool_size = pool_size
+        self.__slots = threading.BoundedSemaphore(max_pending)
+        self.__lock = threading.Lock()
+        self.__done = threading.Condition(self.__lock)
+        self.__task_ids = count()
+        self.__tasks = {}  # task id -> [ctx, pid of the worker or None]
+        self.__lost = False
+        self.__started = None
+        self.__stop = None
+        self.__watcher = None
+
+    @property
+    def pool_size(self):
+        return self.__pool_size
+
+    @property
+    def pending(self):
+        """The number of auxiliary methods that are queued or running."""
+
+        return len(self.__tasks)
+
+    def initialize(self, server):
+        if isinstance(server, _WorkerServer):
+            return
+
+        if isinstance(server.app.in_protocol, HttpRpc):
+            raise ValueError("%r reads requests from the transport, which "
+                    "ProcessAuxProc does not support." % server.app.in_protocol)
+
+        server.buffer_in_string = True
+
+        if self.pool is None:
+            app = None if self.app_factory is not None else server.app
+            self.__started = SimpleQueue()
+            self.pool = Pool(self.__pool_size, _init_worker,
+                                   (app, self.app_factory, self.__started))
+
+            self.__stop = threading.Event()
+            self.__watcher = threading.Thread(target=self._watch,
+                                                  name='spyne-auxproc-watcher')
+            self.__watcher.daemon = True
+            self.__watcher.start()
+
+    def process_context(self, server, ctx, *args, **kwargs):
+        if self.timeout is None or not self.block:
+            acquired = self.__slots.acquire(self.block)
+        else:
+            acquired = self.__slots.acquire(True, self.timeout)
+
+        if not acquired:
+            self._fail(ctx, QueueFullError("%d auxiliary methods are pending"
+                                                           % self.max_pending))
+            return
+
+        task_id = next(self.__task_ids)
+        with self.__lock:
+            self.__tasks[task_id] = [ctx, None]
+
+        try:
+            d = ctx.descriptor
+            error = ctx.aux.error
+            if error is not None:
+                error = repr(error)
+
+            in_string = b''.join([s for s in ctx.in_string if len(s) > 0])
+
+            kwargs = dict(callback=partial(self._on_result, task_id))
+            if not six.PY2:
+                kwargs['error_callback'] = partial(self._on_error, task_id)
+
+            self.pool.apply_async(_process,
+                            (task_id, _generate_method_id(d.service_class, d),
+                                                      in_string, error),
+                            **kwargs)
+
+        except Exception as e:
+            self._release(task_id)
+            self._fail(ctx, e)
+
+    def close(self):
+        """Waits for the pending auxiliary methods to complete and stops the
+        worker processes."""
+
+        if self.pool is None:
+            return
+
+        self.pool.close()
+
+        with self.__lock:
+            while len(self.__tasks) > 0:
+                self.__done.wait()
+
+        self.__stop.set()
+        self.__watcher.join()
+
+        # the pool waits forever for the tasks of the dead workers.
+        if self.__lost:
+            self.pool.terminate()
+        self.pool.join()
+
+        self.pool = None
+        self.__lost = False
+
+    def _watch(self):
+        while not self.__stop.wait(self.poll_interval):
+            with self.__lock:
+                while not self.__started.empty():
+                    task_id, pid = self.__started.get()
+                    if task_id in self.__tasks:
+                        self.__tasks[task_id][1] = pid
+
+                dead = [(task_id, pid)
+                        for task_id, (_, pid) in self.__tasks.items()
+                                 if pid is not None and not _is_alive(pid)]
+
+            for task_id, pid in dead:
+                self.__lost = True
+                self._on_result(task_id,
+                                      "Worker process %d died" % (pid,))
+
+    def _on_result(self, task_id, error):
+        ctx = self._release(task_id)
+        if ctx is None:
+            return
+
+        if error is not None:
+            self._fail(ctx, WorkerError(error))
+
+        ctx.close()
+
+    def _on_error(self, task_id, error):
+        self._on_result(task_id, repr(error))
+
+    def _release(self, task_id):
+        """Forgets the given task and frees its slot. Returns its context or
+        None if it was already released."""
+
+        with self.__lock:
+            task = self.__tasks.pop(task_id, None)
+            self.__done.notify_all()
+
+        if task is None:
+            return None
+
+        self.__slots.release()
+        return task[0]
+
+    def _fail(self, ctx, error):
+        logger.error("Auxiliary method %r failed: %r", ctx.method_name, error)
+
+        if self.on_failure is not None:
+            try:
+                self.on_failure(ctx, error)
+            except Exception as e:
+                logger.exception(e)
@@ -20,33 +20,249 @@
 import logging
 logger = logging.getLogger(__name__)
 
-from multiprocessing.pool import ThreadPool
+import atexit
+import threading
+
+from bisect import bisect_left
+from collections import deque
+from time import time
 
 from spyne.auxproc import AuxProcBase
+from spyne.interface._base import _generate_method_id
 
 
 class ThreadAuxProc(AuxProcBase):
-    """ThreadAuxProc processes auxiliary methods asynchronously in another
-    thread using the undocumented ``multiprocessing.pool.ThreadPool`` class.
-    This is available in Python 2.7. It's possibly there since 2.6 as well but
-    it's hard to tell since it's not documented.
+    """ThreadAuxProc processes auxiliary methods asynchronously in a pool of
+    threads that take them from a bounded queue.
+
+    When ``max_queued`` methods are waiting in the queue, ``overflow``
+    decides what happens to a new one:
+
+    * ``ThreadAuxProc.BLOCK``: :func:`process_context` waits for a free slot.
+      This slows the transport down to the pace of the auxiliary methods.
+    * ``ThreadAuxProc.DROP_OLDEST``: The method that waited the longest is
+      dropped to make room for the new one.
+    * ``ThreadAuxProc.RUN_INLINE``: The new method runs in the thread that
+      calls :func:`process_context`, i.e. the thread of the transport.
+
+    Counters, wait and run times and a histogram of run times are kept for
+    every auxiliary method. See :func:`get_stats`.
+
+    :func:`close` stops accepting new methods and waits for the queued ones
+    to complete. It's called with ``drain_timeout`` when the interpreter
+    exits.
 
     :param pool_size: Max. number of threads that can be used to process
         methods in auxiliary queue in parallel.
+    :param max_queued: Max. number of methods that can wait in the queue.
+    :param overflow: What to do with new methods when the queue is full.
+    :param latency_buckets: The upper bounds of the run time histogram
+        buckets, in seconds, in ascending order.
+    :param drain_timeout: The max. number of seconds to wait for the queue to
+        drain when the interpreter exits. None means forever.
+    :param process_exceptions: If false, does not execute auxiliary methods
+        when the main method throws an exception.
     """
 
-    def __init__(self, pool_size=1):
-        super(ThreadAuxProc, self).__init__()
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    RUN_INLINE = 'run_inline'
+
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+                                                                     5.0, 10.0)
+
+    def __init__(self, pool_size=1, max_queued=1000, overflow=BLOCK,
+                 latency_buckets=LATENCY_BUCKETS, drain_timeout=10.0,
+                                                      process_exceptions=False):
+        super(ThreadAuxProc, self).__init__(
+                                        process_exceptions=process_exceptions)
+
+        if not (overflow in (self.BLOCK, self.DROP_OLDEST, self.RUN_INLINE)):
+            raise ValueError(overflow)
+
+        self.max_queued = max_queued
+        self.overflow = overflow
+        self.latency_buckets = tuple(latency_buckets)
+        self.drain_timeout = drain_timeout
+
+        self.threads = []
+        self.stats = {}
+        """Metrics per auxiliary method. Use :func:`get_stats` to read them."""
 
-        self.pool = None
         self.__pool_size = pool_size
+        self.__queue = deque()
+        self.__lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+        self.__running = 0
+        self.__closed = False
+        self.__atexit_registered = False
 
     @property
     def pool_size(self):
         return self.__pool_size
 
     def process_context(self, server, ctx, *args, **kwargs):
-        self.pool.apply_async(self.process, (server, ctx) + args, kwargs)
+        item = (server, ctx, args, kwargs, time())
+        dropped = None
+
+        with self.__lock:
+            if self.__closed:
+                logger.warning("Dropping auxiliary method %r: %r is closed",
+                                                        ctx.method_name, self)
+                self._get_method_stats(ctx)['dropped'] += 1
+                return
+
+            if len(self.__queue) >= self.max_queued:
+                if self.overflow == self.RUN_INLINE:
+                    self._get_method_stats(ctx)['inline'] += 1
+                    item = None
+
+                elif self.overflow == self.DROP_OLDEST:
+                    dropped = self.__queue.popleft()
+                    self._get_method_stats(dropped[1])['dropped'] += 1
+
+                else:
+                    while len(self.__queue) >= self.max_queued and \
+                                                          not self.__closed:
+                        self.__not_full.wait()
+
+                    if self.__closed:
+                        self._get_method_stats(ctx)['dropped'] += 1
+                        return
+
+            if item is not None:
+                self.__queue.append(item)
+                self.__not_empty.notify()
+
+        if dropped is not None:
+            logger.warning("Dropped auxiliary method %r: queue is full",
+                                                         dropped[1].method_name)
+            dropped[1].close()
+
+        if item is None:
+            self._run((server, ctx, args, kwargs, time()))
 
     def initialize(self, server):
-        self.pool = ThreadPool(self.__pool_size)
+        with self.__lock:
+            if len(self.threads) > 0:
+                return
+
+            self.__closed = False
+            for i in range(self.__pool_size):
+                thread = threading.Thread(target=self._work,
+                                               name='spyne-auxproc-%d' % (i,))
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+
+            if not self.__atexit_registered:
+                atexit.register(self._close_at_exit)
+                self.__atexit_registered = True
+
+    def _close_at_exit(self):
+        if not self.__closed:
+            self.close(self.drain_timeout)
+
+    def close(self, timeout=None):
+        """Stops accepting new methods and waits at most ``timeout`` seconds
+        for the queued ones to complete. None means forever. Returns True if
+        the queue was drained."""
+
+        with self.__lock:
+            self.__closed = True
+            self.__not_empty.notify_all()
+            self.__not_full.notify_all()
+            threads, self.threads = self.threads, []
+
+        deadline = None
+        if timeout is not None:
+            deadline = time() + timeout
+
+        for thread in threads:
+            if deadline is None:
+                thread.join()
+            else:
+                thread.join(max(0, deadline - time()))
+
+        with self.__lock:
+            retval = len(self.__queue) == 0 and \
+                          not any(thread.is_alive() for thread in threads)
+        if not retval:
+            logger.warning("%r could not drain its queue in %r seconds",
+                                                                self, timeout)
+
+        return retval
+
+    def get_stats(self):
+        """Returns the queue depth, the number of busy threads and the metrics
+        of every auxiliary method, keyed by its id in the ``methods``
+        attribute. Wait and run times are in seconds. ``histogram`` is the
+        number of runs that took at most the respective value of
+        ``latency_buckets``, plus the number of longer runs at the end."""
+
+        with self.__lock:
+            return dict(
+                queued=len(self.__queue),
+                running=self.__running,
+                latency_buckets=list(self.latency_buckets),
+                methods=dict((k, dict(v, histogram=list(v['histogram'])))
+                                              for k, v in self.stats.items()),
+            )
+
+    def _get_method_stats(self, ctx):
+        d = ctx.descriptor
+        key = _generate_method_id(d.service_class, d)
+
+        retval = self.stats.get(key, None)
+        if retval is None:
+            retval = self.stats[key] = dict(calls=0, errors=0, dropped=0,
+                        inline=0, total_wait=0.0, max_wait=0.0,
+                        total_time=0.0, max_time=0.0,
+                        histogram=[0] * (len(self.latency_buckets) + 1))
+
+        return retval
+
+    def _work(self):
+        while True:
+            with self.__lock:
+                while len(self.__queue) == 0 and not self.__closed:
+                    self.__not_empty.wait()
+
+                if len(self.__queue) == 0:
+                    return
+
+                item = self.__queue.popleft()
+                self.__not_full.notify()
+
+            self._run(item)
+
+    def _run(self, item):
+        server, ctx, args, kwargs, queued_at = item
+
+        start = time()
+        with self.__lock:
+            self.__running += 1
+
+        try:
+            error = self.process(server, ctx, *args, **kwargs)
+
+        except Exception as e:
+            logger.exception(e)
+            error = e
+
+        end = time()
+        with self.__lock:
+            self.__running -= 1
+
+            stats = self._get_method_stats(ctx)
+            stats['calls'] += 1
+            if error is not None:
+                stats['errors'] += 1
+
+            wait, duration = start - queued_at, end - start
+            stats['total_wait'] += wait
+            stats['max_wait'] = max(stats['max_wait'], wait)
+            stats['total_time'] += duration
+            stats['max_time'] = max(stats['max_time'], duration)
+            stats['histogram'][bisect_left(self.latency_buckets, duration)] += 1
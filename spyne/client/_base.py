@@ -20,6 +20,8 @@
 """Contains the ClientBase class and its helper objects."""
 
 from spyne._base import MethodContext
+from spyne.model.complex import Array
+from spyne.model.fault import Fault
 from spyne.model.primitive import string_encoding
 
 
@@ -139,6 +141,11 @@ class RemoteProcedureBase(object):
         assert ctx.in_document is None
 
         self.app.in_protocol.create_in_document(ctx)
+        self.get_in_object_from_document(ctx)
+
+    def get_in_object_from_document(self, ctx):
+        """Deserializes ``ctx.in_document`` as a native python object."""
+
         if ctx.service_class != None:
             ctx.service_class.event_manager.fire_event(
                                             'method_accept_document', ctx)
@@ -159,6 +166,100 @@ class RemoteProcedureBase(object):
             ctx.in_object = getattr(ctx.in_object, wrapper_attribute, None)
 
 
+    def iter_in_object(self, ctx):
+        """Deserializes the response bytestream as it arrives and yields the
+        elements of the returned array one by one. The response must be a
+        single ``Array`` or ``Iterable``. Only the Xml-based protocols parse
+        the response incrementally, the others deserialize it all before
+        yielding the first element. Faults in the response are raised.
+
+        Headers in the response are ignored.
+        """
+
+        from spyne.protocol.xml import XmlDocument
+
+        assert ctx.in_string is not None
+        assert ctx.in_document is None
+
+        om = ctx.descriptor.out_message
+        if len(om._type_info) != 1:
+            raise ValueError("%r must return a single array" % ctx.descriptor)
+
+        (result_name, result_class), = om._type_info.items()
+        if not issubclass(result_class, Array):
+            raise ValueError("%r must return an array" % ctx.descriptor)
+
+        if isinstance(self.app.in_protocol, XmlDocument):
+            item_class, = result_class._type_info.values()
+            for obj in self._iter_xml(ctx, result_name, item_class):
+                yield obj
+
+            if ctx.in_document is None:  # everything was in the array
+                return
+
+        else:
+            self.app.in_protocol.create_in_document(ctx)
+
+        self.get_in_object_from_document(ctx)
+        if ctx.in_error is not None:
+            raise ctx.in_error
+
+        for obj in ctx.in_object or ():
+            yield obj
+
+    def _iter_xml(self, ctx, result_name, item_class):
+        """Yields the children of the ``result_name`` element as they are
+        parsed and drops them afterwards. When there's no such element, sets
+        ``ctx.in_document`` so that it can be deserialized the usual way."""
+
+        from lxml.etree import XMLPullParser, QName, XMLSyntaxError
+        from spyne.protocol.soap import Soap11
+        from spyne.protocol.soap.soap11 import get_xmlids
+
+        prot = self.app.in_protocol
+        parser = XMLPullParser(events=('start', 'end'), **prot.parser_kwargs)
+        depth = 0
+        result_depth = None
+        found = False
+
+        try:
+            for fragment in ctx.in_string:
+                parser.feed(fragment)
+
+                for event, elt in parser.read_events():
+                    if event == 'start':
+                        depth += 1
+                        if not found and QName(elt).localname == result_name:
+                            found = True
+                            result_depth = depth
+                        continue
+
+                    if result_depth is not None and depth == result_depth + 1:
+                        yield prot.from_element(ctx, item_class, elt)
+
+                        # free the memory used by the elements already seen
+                        elt.clear()
+                        parent = elt.getparent()
+                        while elt.getprevious() is not None:
+                            del parent[0]
+
+                    elif depth == result_depth:
+                        result_depth = None
+
+                    depth -= 1
+
+            root = parser.close()
+
+        except XMLSyntaxError as e:
+            raise Fault('Client.XMLSyntaxError', str(e))
+
+        if not found:
+            if isinstance(prot, Soap11):
+                ctx.in_document = root, get_xmlids(root)
+            else:
+                ctx.in_document = root
+
+
 class ClientBase(object):
     """The base class for all client applications. ``self.service`` attribute
     should be initialized in the constructor of the child class.
@@ -17,15 +17,101 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
-"""The HTTP (urllib2) client transport."""
+"""The HTTP client transport. It keeps the connections to the server open and
+reuses them across calls, which can be made concurrently."""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import socket
+import threading
+import zlib
+
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 from spyne import RemoteService, ClientBase, RemoteProcedureBase
+from spyne.util.aio import asyncio, get_running_loop
+from spyne.util.six.moves import http_client
+from spyne.util.six.moves.urllib.parse import urlsplit
+
+
+# what a keep-alive connection that the server closed while it was idle
+# raises when it's reused.
+_STALE_CONNECTION_ERRORS = (http_client.BadStatusLine,
+                            http_client.CannotSendRequest, socket.error)
+
+
+class HttpConnectionPool(object):
+    """A thread-safe pool of idle keep-alive connections, per host.
+
+    :param max_idle: The max. number of idle connections to keep per host.
+    :param timeout: The socket timeout of new connections, in seconds.
+    :param ssl_context: The ``ssl.SSLContext`` to use for https connections.
+    """
+
+    def __init__(self, max_idle=10, timeout=None, ssl_context=None):
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def connect(self, scheme, netloc):
+        """Returns a new connection to the given host."""
+
+        kwargs = {}
+        if self.timeout is not None:
+            kwargs['timeout'] = self.timeout
+
+        if scheme == 'https':
+            if self.ssl_context is not None:
+                kwargs['context'] = self.ssl_context
+            return http_client.HTTPSConnection(netloc, **kwargs)
+
+        return http_client.HTTPConnection(netloc, **kwargs)
+
+    def get(self, scheme, netloc):
+        """Returns a ``(connection, reused)`` tuple. ``reused`` is True when
+        the connection was taken from the pool."""
+
+        with self._lock:
+            conns = self._idle.get((scheme, netloc))
+            if conns:
+                return conns.pop(), True
+
+        return self.connect(scheme, netloc), False
+
+    def put(self, scheme, netloc, conn):
+        """Returns an idle connection to the pool. It's closed instead when
+        the pool is full."""
+
+        with self._lock:
+            conns = self._idle.setdefault((scheme, netloc), [])
+            if len(conns) < self.max_idle:
+                conns.append(conn)
+                return
+
+        conn.close()
+
+    def close(self):
+        """Closes all idle connections."""
 
-from spyne.util.six.moves.urllib.request import Request, urlopen
-from spyne.util.six.moves.urllib.error import HTTPError
+        with self._lock:
+            idle, self._idle = self._idle, {}
+
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
 
 
 class _RemoteProcedure(RemoteProcedureBase):
+    def __init__(self, url, app, name, out_header=None, client=None):
+        super(_RemoteProcedure, self).__init__(url, app, name, out_header)
+
+        self.client = client
+
     def __call__(self, *args, **kwargs):
         # there's no point in having a client making the same request more than
         # once, so if there's more than just one context, it is a bug.
@@ -40,16 +126,8 @@ class _RemoteProcedure(RemoteProcedureBase):
         # sets ctx.out_string
         self.get_out_string(self.ctx)
 
-        out_string = b''.join(self.ctx.out_string) # FIXME: just send the iterable to the http stream.
-        request = Request(self.url, out_string)
-        code = 200
-        try:
-            response = urlopen(request)
-            self.ctx.in_string = [response.read()]
-
-        except HTTPError as e:
-            code = e.code
-            self.ctx.in_string = [e.read()]
+        code, self.ctx.in_string = self.client.post(self.ctx.out_string,
+                                           self.ctx.out_protocol.mime_type)
 
         # this sets ctx.in_error if there's an error, and ctx.in_object if
         # there's none.
@@ -63,8 +141,214 @@ class _RemoteProcedure(RemoteProcedureBase):
             return self.ctx.in_object
 
 
+class _StreamRemoteProcedure(_RemoteProcedure):
+    """Returns an iterator over the elements of the returned array, which are
+    deserialized as the response arrives."""
+
+    def __call__(self, *args, **kwargs):
+        self.ctx, = self.contexts
+
+        self.get_out_object(self.ctx, args, kwargs)
+        self.get_out_string(self.ctx)
+
+        code, self.ctx.in_string = self.client.post(self.ctx.out_string,
+                                           self.ctx.out_protocol.mime_type)
+
+        return self.iter_in_object(self.ctx)
+
+
+class _AioRemoteProcedure(_RemoteProcedure):
+    """Returns an asyncio future instead of blocking. The call is made in the
+    default executor of the event loop."""
+
+    def __call__(self, *args, **kwargs):
+        loop = get_running_loop()
+        if loop is None:
+            loop = asyncio.get_event_loop()
+
+        return loop.run_in_executor(None, partial(
+               super(_AioRemoteProcedure, self).__call__, *args, **kwargs))
+
+
 class HttpClient(ClientBase):
-    def __init__(self, url, app):
+    """The HTTP client transport. Calls made through the ``service`` attribute
+    block until they get their response, whereas the ones made through the
+    ``aio`` attribute return asyncio futures. See :func:`batch` for making
+    many calls concurrently from synchronous code.
+
+    Methods that return an ``Array`` or an ``Iterable`` can also be called
+    through the ``stream`` attribute. It returns an iterator that
+    deserializes the elements of the array as the response arrives, so that
+    large responses can be processed with bounded memory when using Xml-based
+    protocols.
+
+    :param url: The url of the server endpoint.
+    :param app: The :class:`spyne.application.Application` instance.
+    :param pool_size: The max. number of idle connections to keep and the
+        number of threads that :func:`batch` uses.
+    :param timeout: The socket timeout in seconds.
+    :param gzip: Whether to accept gzip-compressed responses.
+    :param chunk_size: The number of bytes to read from the connection at
+        once.
+    :param ssl_context: The ``ssl.SSLContext`` to use for https urls.
+    :param connection_pool: A :class:`HttpConnectionPool` to share with other
+        clients. When given, ``timeout`` and ``ssl_context`` are ignored.
+    """
+
+    def __init__(self, url, app, pool_size=10, timeout=None, gzip=True,
+                chunk_size=0x10000, ssl_context=None, connection_pool=None):
         super(HttpClient, self).__init__(url, app)
 
-        self.service = RemoteService(_RemoteProcedure, url, app)
+        parts = urlsplit(url)
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.path = parts.path or '/'
+        if parts.query:
+            self.path = '%s?%s' % (self.path, parts.query)
+
+        self.pool_size = pool_size
+        self.gzip = gzip
+        self.chunk_size = chunk_size
+
+        if connection_pool is None:
+            connection_pool = HttpConnectionPool(max_idle=pool_size,
+                                     timeout=timeout, ssl_context=ssl_context)
+        self.connection_pool = connection_pool
+
+        self.thread_pool = None
+        """The thread pool for :func:`batch`. It's created on first use."""
+
+        self.service = RemoteService(_RemoteProcedure, url, app, self)
+        self.aio = RemoteService(_AioRemoteProcedure, url, app, self)
+        self.stream = RemoteService(_StreamRemoteProcedure, url, app, self)
+
+    def set_options(self, **kwargs):
+        super(HttpClient, self).set_options(**kwargs)
+
+        self.aio.out_header = self.service.out_header
+        self.stream.out_header = self.service.out_header
+
+    def post(self, body, mime_type):
+        """Posts the ``body`` iterable of byte strings to the server and
+        returns a ``(response code, response body)`` tuple. The response body
+        is an iterable of byte strings that's read from the connection as it's
+        iterated over. See :func:`read_response`.
+
+        A call that fails on a connection from the pool is retried once on a
+        new connection, as the server may have closed it in the meantime."""
+
+        if not isinstance(body, (list, tuple)):
+            body = list(body)
+
+        while True:
+            conn, reused = self.connection_pool.get(self.scheme, self.netloc)
+            try:
+                response = self.send_request(conn, body, mime_type)
+
+            except socket.timeout:
+                conn.close()
+                raise
+
+            except _STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if reused:
+                    logger.debug("Retrying on a new connection: %r", e)
+                    continue
+                raise
+
+            return response.status, self.read_response(conn, response)
+
+    def send_request(self, conn, body, mime_type):
+        """Sends the request chunk by chunk and returns the response."""
+
+        conn.putrequest('POST', self.path, skip_accept_encoding=True)
+        conn.putheader('Content-Type', mime_type)
+        conn.putheader('Content-Length', str(sum(len(b) for b in body)))
+        if self.gzip:
+            conn.putheader('Accept-Encoding', 'gzip')
+        conn.endheaders()
+
+        for chunk in body:
+            conn.send(chunk)
+
+        return conn.getresponse()
+
+    def read_response(self, conn, response):
+        """Yields the response body chunk by chunk as it arrives,
+        decompressing it if necessary. The connection is returned to the pool
+        once the body is read in full and closed otherwise."""
+
+        decompressor = None
+        encoding = response.getheader('Content-Encoding', '')
+        if encoding.lower() == 'gzip':
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        done = False
+        try:
+            while True:
+                data = response.read(self.chunk_size)
+                if not data:
+                    break
+
+                if decompressor is not None:
+                    data = decompressor.decompress(data)
+                if data:
+                    yield data
+
+            if decompressor is not None:
+                data = decompressor.flush()
+                if data:
+                    yield data
+
+            done = True
+
+        finally:
+            if done and not response.will_close:
+                self.connection_pool.put(self.scheme, self.netloc, conn)
+            else:
+                conn.close()
+
+    def batch(self, calls, return_exceptions=False):
+        """Makes the given calls concurrently and returns their results in
+        the same order.
+
+        :param calls: An iterable of ``(method_name, args)`` or
+            ``(method_name, args, kwargs)`` tuples.
+        :param return_exceptions: When True, the exceptions that the calls
+            raise are returned in place of their results. Otherwise the first
+            one is raised.
+        """
+
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPool(self.pool_size)
+
+        results = [self.thread_pool.apply_async(self._call, call)
+                                                               for call in calls]
+
+        retval = []
+        for result in results:
+            try:
+                retval.append(result.get())
+
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                retval.append(e)
+
+        return retval
+
+    def _call(self, method_name, args=(), kwargs=None):
+        if kwargs is None:
+            kwargs = {}
+
+        return getattr(self.service, method_name)(*args, **kwargs)
+
+    def close(self):
+        """Closes the idle connections and stops the threads of
+        :func:`batch`."""
+
+        self.connection_pool.close()
+
+        if self.thread_pool is not None:
+            self.thread_pool.terminate()
+            self.thread_pool = None
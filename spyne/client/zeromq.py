@@ -17,28 +17,306 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
-"""The ZeroMQ (zmq.REQ) client transport."""
+"""The ZeroMQ (zmq.DEALER) client transport.
+
+Every :class:`ZeroMQClient` keeps one ``zmq.DEALER`` socket that's shared by
+all the calls made through it, from any thread or asyncio task. Requests are
+sent as ``[request id, b'', request]``. Both ``zmq.REP`` servers and
+:class:`spyne.server.zeromq.ZeroMQRouterServer` send the frames before the
+request back with the reply, which is how replies are matched to requests
+regardless of the order they arrive in.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import threading
+
+from collections import deque
+from itertools import count
+from time import time
 
 import zmq
 
 from spyne import RemoteService, ClientBase, RemoteProcedureBase
+from spyne.util.aio import asyncio, get_running_loop
 
 context = zmq.Context()
 
 
+class RequestTimeoutError(Exception):
+    """Raised when there's no reply to a request, even after retrying."""
+
+
+class _Request(object):
+    def __init__(self, id, data, callback):
+        self.id = id
+        self.data = data
+        self.callback = callback
+
+        self.socket = None
+        self.deadline = None
+        self.tries = 0
+
+
+class ZeroMQConnection(object):
+    """Multiplexes requests over a ``zmq.DEALER`` socket. The sockets are only
+    touched by a daemon I/O thread that's started on first use.
+
+    Sockets are never written to in blocking mode. Requests that can't be
+    sent right away, e.g. because the peer is unreachable and the high-water
+    mark of the socket is reached, wait until the socket is writable again.
+    Their timeouts still apply.
+
+    A request that gets no reply in ``timeout`` seconds is sent again, at
+    most ``retries`` times, over a fresh socket. The old socket is closed when
+    the requests that were sent over it either get their replies or time out
+    as well. When the original reply arrives after a retry, it's used and the
+    reply to the retry is discarded.
+
+    :param url: The ZeroMQ endpoint to connect to.
+    :param ctx: The ``zmq.Context`` to use. Defaults to a shared one.
+    :param timeout: The number of seconds to wait for a reply. None means
+        waiting forever.
+    :param retries: The number of times to resend a request that timed out.
+    """
+
+    def __init__(self, url, ctx=None, timeout=None, retries=0):
+        self.url = url
+        self.ctx = ctx or context
+        self.timeout = timeout
+        self.retries = retries
+
+        self._ids = count()
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._running = False
+
+        # the following are only touched by the I/O thread
+        self._pending = {}
+        self._deadlines = deque()
+        self._sockets = {}  # socket => number of pending requests
+        self._backlogs = {}  # socket => requests waiting for POLLOUT
+        self._socket = None
+
+        # the callers wake up the I/O thread through this pair.
+        wakeup_url = 'inproc://spyne-client-%x' % id(self)
+        self._wakeup_in = self.ctx.socket(zmq.PAIR)
+        self._wakeup_in.bind(wakeup_url)
+        self._wakeup_out = self.ctx.socket(zmq.PAIR)
+        self._wakeup_out.connect(wakeup_url)
+
+    def send(self, data, callback):
+        """Queues ``data`` to be sent and returns immediately. ``callback``
+        is called from the I/O thread with either the reply or an exception
+        instance as its only argument."""
+
+        with self._lock:
+            if self._thread is None:
+                self._running = True
+                self._thread = threading.Thread(target=self._run,
+                                                name='spyne-zmq-client')
+                self._thread.daemon = True
+                self._thread.start()
+
+            id = str(next(self._ids)).encode('ascii')
+            self._queue.append(_Request(id, data, callback))
+            self._wakeup()
+
+    def close(self):
+        """Stops the I/O thread and closes the sockets. The calls that are in
+        flight fail with a :class:`RequestTimeoutError`."""
+
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._running = False
+            if thread is not None:
+                self._wakeup()
+
+        if thread is not None:
+            thread.join()
+
+        self._wakeup_in.close(linger=0)
+        self._wakeup_out.close(linger=0)
+
+    def _wakeup(self):
+        try:
+            self._wakeup_out.send(b'', zmq.NOBLOCK)
+
+        # the pipe is full, so the I/O thread is going to wake up anyway
+        except zmq.Again:
+            pass
+
+    def _get_socket(self, poller):
+        if self._socket is None:
+            socket = self._socket = self.ctx.socket(zmq.DEALER)
+            socket.setsockopt(zmq.LINGER, 0)
+            socket.connect(self.url)
+
+            poller.register(socket, zmq.POLLIN)
+            self._sockets[socket] = 0
+
+        return self._socket
+
+    def _send(self, req, poller):
+        req.socket = self._get_socket(poller)
+        req.tries += 1
+        self._sockets[req.socket] += 1
+        self._pending[req.id] = req
+
+        if self.timeout is not None:
+            req.deadline = time() + self.timeout
+            self._deadlines.append((req.deadline, req))
+
+        socket = req.socket
+        backlog = self._backlogs.get(socket, None)
+        if backlog is None:
+            try:
+                socket.send_multipart([req.id, b'', req.data], zmq.NOBLOCK)
+                return
+
+            except zmq.Again:
+                backlog = self._backlogs[socket] = deque()
+                poller.register(socket, zmq.POLLIN | zmq.POLLOUT)
+
+        backlog.append((req, req.tries))
+
+    def _flush_backlog(self, socket, poller):
+        backlog = self._backlogs[socket]
+        while backlog:
+            req, tries = backlog[0]
+
+            # skip requests that timed out in the meantime
+            if req.socket is socket and req.tries == tries and \
+                                                        req.id in self._pending:
+                try:
+                    socket.send_multipart([req.id, b'', req.data], zmq.NOBLOCK)
+                except zmq.Again:
+                    return
+
+            backlog.popleft()
+
+        del self._backlogs[socket]
+        poller.register(socket, zmq.POLLIN)
+
+    def _recv(self, socket):
+        while True:
+            try:
+                frames = socket.recv_multipart(zmq.NOBLOCK)
+            except zmq.Again:
+                break
+
+            req = self._pending.pop(frames[0], None)
+            if req is None:
+                logger.debug("Discarding reply to request %r", frames[0])
+                continue
+
+            self._sockets[req.socket] -= 1
+            self._call(req, frames[-1])
+
+    def _call(self, req, reply):
+        try:
+            req.callback(reply)
+        except Exception as e:
+            logger.exception(e)
+
+    def _check_timeouts(self, poller):
+        # deadlines are appended in increasing order as the timeout is fixed.
+        now = time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, req = self._deadlines.popleft()
+            if req.deadline != deadline or not (req.id in self._pending):
+                continue
+
+            self._sockets[req.socket] -= 1
+            if req.tries <= self.retries:
+                logger.debug("Retrying request %r", req.id)
+                if req.socket is self._socket:
+                    self._socket = None
+                self._send(req, poller)
+
+            else:
+                del self._pending[req.id]
+                self._call(req, RequestTimeoutError("No reply from %r in %r "
+                                  "seconds after %d tries" %
+                                  (self.url, self.timeout, req.tries)))
+
+        for socket, num_pending in list(self._sockets.items()):
+            if num_pending == 0 and socket is not self._socket:
+                poller.unregister(socket)
+                socket.close()
+                del self._sockets[socket]
+                self._backlogs.pop(socket, None)
+
+    def _get_poll_timeout(self):
+        if not self._deadlines:
+            return None
+
+        return max(0, int((self._deadlines[0][0] - time()) * 1000) + 1)
+
+    def _run(self):
+        poller = zmq.Poller()
+        poller.register(self._wakeup_in, zmq.POLLIN)
+
+        try:
+            while self._running:
+                events = dict(poller.poll(self._get_poll_timeout()))
+
+                for socket in list(self._sockets):
+                    flags = events.get(socket, 0)
+                    if flags & zmq.POLLIN:
+                        self._recv(socket)
+                    if flags & zmq.POLLOUT and socket in self._backlogs:
+                        self._flush_backlog(socket, poller)
+
+                if self._wakeup_in in events:
+                    while True:
+                        try:
+                            self._wakeup_in.recv(zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+
+                while self._queue and self._running:
+                    self._send(self._queue.popleft(), poller)
+
+                self._check_timeouts(poller)
+
+        except Exception as e:
+            logger.exception(e)
+
+        finally:
+            for socket in self._sockets:
+                socket.close()
+            self._sockets.clear()
+            self._backlogs.clear()
+            self._socket = None
+
+            pending = list(self._pending.values()) + list(self._queue)
+            self._pending.clear()
+            self._queue.clear()
+            self._deadlines.clear()
+
+            for req in pending:
+                self._call(req, RequestTimeoutError("Connection closed"))
+
+
 class _RemoteProcedure(RemoteProcedureBase):
-    def __call__(self, *args, **kwargs):
+    def __init__(self, url, app, name, out_header=None, connection=None):
+        super(_RemoteProcedure, self).__init__(url, app, name, out_header)
+
+        self.connection = connection
+
+    def get_out_bytes(self, args, kwargs):
         self.ctx = self.contexts[0]
 
         self.get_out_object(self.ctx, args, kwargs)
         self.get_out_string(self.ctx)
-        out_string = b''.join(self.ctx.out_string)
 
-        socket = context.socket(zmq.REQ)
-        socket.connect(self.url)
-        socket.send(out_string)
+        return b''.join(self.ctx.out_string)
 
-        self.ctx.in_string = [socket.recv()]
+    def get_return_value(self, in_string):
+        self.ctx.in_string = [in_string]
         self.get_in_object(self.ctx)
 
         if not (self.ctx.in_error is None):
@@ -46,9 +324,80 @@ class _RemoteProcedure(RemoteProcedureBase):
         else:
             return self.ctx.in_object
 
+    def __call__(self, *args, **kwargs):
+        event = threading.Event()
+        reply = []
+
+        def _cb(data):
+            reply.append(data)
+            event.set()
+
+        self.connection.send(self.get_out_bytes(args, kwargs), _cb)
+
+        event.wait()
+        if isinstance(reply[0], Exception):
+            raise reply[0]
+
+        return self.get_return_value(reply[0])
+
+
+class _AioRemoteProcedure(_RemoteProcedure):
+    """Returns an asyncio future instead of blocking. The response is
+    deserialized on the event loop thread."""
+
+    def __call__(self, *args, **kwargs):
+        loop = get_running_loop()
+        if loop is None:
+            loop = asyncio.get_event_loop()
+
+        future = loop.create_future()
+
+        def _cb(data):
+            loop.call_soon_threadsafe(self._set_result, future, data)
+
+        self.connection.send(self.get_out_bytes(args, kwargs), _cb)
+
+        return future
+
+    def _set_result(self, future, data):
+        if future.cancelled():
+            return
+
+        if isinstance(data, Exception):
+            future.set_exception(data)
+            return
+
+        try:
+            future.set_result(self.get_return_value(data))
+        except Exception as e:
+            future.set_exception(e)
+
 
 class ZeroMQClient(ClientBase):
-    def __init__(self, url, app):
+    """The ZeroMQ client transport. Calls made through the ``service``
+    attribute block until they get their reply, whereas the ones made through
+    the ``aio`` attribute return asyncio futures. Any number of calls can be
+    in flight at once. See :class:`ZeroMQConnection` for the meaning of the
+    ``ctx``, ``timeout`` and ``retries`` arguments.
+    """
+
+    def __init__(self, url, app, timeout=None, retries=0, ctx=None):
         super(ZeroMQClient, self).__init__(url, app)
 
-        self.service = RemoteService(_RemoteProcedure, url, app)
+        self.connection = ZeroMQConnection(url, ctx=ctx, timeout=timeout,
+                                                                retries=retries)
+
+        self.service = RemoteService(_RemoteProcedure, url, app,
+                                                                self.connection)
+        self.aio = RemoteService(_AioRemoteProcedure, url, app,
+                                                                self.connection)
+
+    def set_options(self, **kwargs):
+        super(ZeroMQClient, self).set_options(**kwargs)
+
+        self.aio.out_header = self.service.out_header
+
+    def close(self):
+        """Closes the connection. The client can't be used afterwards."""
+
+        self.connection.close()
@@ -107,7 +107,7 @@ def _produce_input_message(f, params, in_message_name,
 
             # there can't be multiple arguments here.
             if message.__type_name__ is ModelBase.Empty:
-                message._fill_empty_type_name(ns, in_message_name,
+                message = message._fill_empty_type_name(ns, in_message_name,
                                                     "%s_arg0" % in_message_name)
 
     else:
@@ -180,6 +180,7 @@ def _produce_output_message(func_name, body_style_str, kparams):
     if body_style_str.endswith('bare') and _returns is not None:
         message = _returns.customize(sub_name=_out_message_name, sub_ns=ns)
         if message.__type_name__ is ModelBase.Empty:
+            message = message._unshare(ns, _out_message_name)
             message.__type_name__ = _out_message_name
 
     else:
@@ -272,6 +273,9 @@ def rpc(*params, **kparams):
     :param _args: the name of the arguments to expose.
     :param _service_class: A :class:`ServiceBase` subclass, if you feel like
         overriding it.
+    :param _executor: The name of the thread pool to run this method in, for
+        transports that support it. ``None`` runs it in the transport's own
+        thread.
     """
 
     params = list(params)
@@ -298,6 +302,7 @@ def rpc(*params, **kparams):
             _when = kparams.pop("_when", None)
             _service_class = kparams.pop("_service_class", None)
             _href = kparams.pop("_href", None)
+            _executor = kparams.pop("_executor", None)
 
             _substitute_self_reference(params, kparams, kwargs, _no_self)
 
@@ -370,7 +375,7 @@ def rpc(*params, **kparams):
                 translations=_translations, when=_when,
                 in_message_name_override=_in_message_name_override,
                 out_message_name_override=_out_message_name_override,
-                service_class=_service_class, href=_href,
+                service_class=_service_class, href=_href, executor=_executor,
             )
 
             if _patterns is not None and _no_self:
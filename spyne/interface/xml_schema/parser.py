@@ -291,7 +291,10 @@ class XmlSchemaParser(object):
             if restriction.pattern.value:
                 kwargs['pattern'] = restriction.pattern.value
 
-        retval = base.customize(**kwargs)
+        # the name and namespace are part of the customization so that the
+        # class is not shared with identical restrictions of other types.
+        retval = base.customize(type_name=name, __namespace__=self.tns,
+                                                                      **kwargs)
         retval.__type_name__ = name
         retval.__namespace__ = self.tns
         if retval.__orig__ is None:
@@ -26,6 +26,8 @@ from spyne.model._base import ModelBase
 from spyne.model._base import PushBase
 from spyne.model._base import Null
 from spyne.model._base import SimpleModel
+from spyne.model._base import get_customization_stats
+from spyne.model._base import get_validators
 
 # Primitives
 from spyne.model.primitive import *
@@ -42,6 +44,7 @@ from spyne.model._base import msgpack
 from spyne.model.complex import ComplexModelMeta
 from spyne.model.complex import ComplexModelBase
 from spyne.model.complex import ComplexModel
+from spyne.model.complex import CompactComplexModel
 from spyne.model.complex import TTableModelBase
 from spyne.model.complex import TTableModel
 
@@ -27,19 +27,80 @@ import logging
 logger = logging.getLogger(__name__)
 
 import re
+import types
 import decimal
 import threading
 
+from weakref import WeakSet, WeakValueDictionary, ref as weakref_ref
+
 import spyne.const.xml_ns
 
 from spyne import const
-from spyne.util import Break, six
+from spyne.util import Break, six, memoize
 from spyne.util.cdict import cdict
 from spyne.util.odict import odict
 
 from spyne.const.xml_ns import DEFAULT_NS
 
 
+_customized_classes = WeakSet()
+_customization_cache = WeakValueDictionary()
+_shared_anonymous_classes = WeakSet()
+_unshared_copies = WeakValueDictionary()
+_customization_stats = {'hits': 0, 'misses': 0, 'uncacheable': 0}
+
+_FROZEN_TYPES = (type(None), bool, float, decimal.Decimal, type,
+                 types.FunctionType, types.BuiltinFunctionType, six.binary_type,
+                 six.text_type) + six.integer_types + six.string_types
+
+
+def _freeze(v):
+    """Returns a hashable value that compares equal only for arguments that
+    would result in identical customizations. Raises TypeError for values
+    that are not known to be safe to compare."""
+
+    t = type(v)
+    if isinstance(v, _FROZEN_TYPES):
+        return t, v
+
+    if isinstance(v, (list, tuple)):
+        return t, tuple([_freeze(x) for x in v])
+
+    if isinstance(v, (set, frozenset)):
+        return t, frozenset([_freeze(x) for x in v])
+
+    if isinstance(v, dict):
+        return t, frozenset([(_freeze(k), _freeze(x)) for k, x in v.items()])
+
+    raise TypeError(t)
+
+
+def _get_customization_key(cls, kwargs):
+    try:
+        return cls, _freeze(kwargs)
+
+    except TypeError:
+        _customization_stats['uncacheable'] += 1
+        return None
+
+
+def get_customization_stats():
+    """Returns a dict with the following keys:
+
+        * ``customized``: Number of customized classes that are alive.
+        * ``cached``: Number of customized classes that are reused when the
+          same customization is requested again.
+        * ``hits``, ``misses``: Customization cache hits and misses.
+        * ``uncacheable``: Number of customizations that could not be looked up
+          in the cache because of their arguments.
+    """
+
+    retval = dict(_customization_stats)
+    retval['customized'] = len(_customized_classes)
+    retval['cached'] = len(_customization_cache)
+    return retval
+
+
 def _decode_pa_dict(d):
     """Decodes dict passed to prot_attrs.
 
@@ -177,6 +238,12 @@ class AttributesMeta(type(object)):
 
 
 class ModelBaseMeta(type(object)):
+    def __init__(self, cls_name, cls_bases, cls_dict):
+        super(ModelBaseMeta, self).__init__(cls_name, cls_bases, cls_dict)
+
+        if cls_dict.get('__orig__', None) is not None:
+            _customized_classes.add(self)
+
     def __getitem__(self, item):
         return self.customize(**item)
 
@@ -196,6 +263,8 @@ class ModelBase(object):
     mainly used for defining constraints on input values.
     """
 
+    __slots__ = ()
+
     __orig__ = None
     """This holds the original class the class .customize()d from. Ie if this is
     None, the class is not a customize()d one."""
@@ -402,16 +471,59 @@ class ModelBase(object):
 
         return cls.__namespace__
 
+    @classmethod
+    def _unshare(cls, ns, type_name):
+        """Returns the class that should get the given name. That's the class
+        itself, unless it's an anonymous type that's shared by identical
+        customizations. Those are never named. A copy is returned instead,
+        which is shared by the parents that give it the same name."""
+
+        if not (cls in _shared_anonymous_classes):
+            return cls
+
+        key = cls, ns, type_name
+        retval = _unshared_copies.get(key, None)
+        if retval is None:
+            retval = _unshared_copies[key] = type(cls)(cls.__name__, (cls,),
+                                                 {'__module__': cls.__module__})
+
+        return retval
+
     @classmethod
     def _fill_empty_type_name(cls, parent_ns, parent_tn, k):
+        """Names the anonymous class after the member ``k`` of its parent and
+        returns it. See :func:`_unshare` for why that may not be ``cls``."""
+
+        tn = "%s_%s%s" % (parent_tn, k, const.TYPE_SUFFIX)
+        cls = cls._unshare(parent_ns, tn)
+
         cls.__namespace__ = parent_ns
+        cls.__type_name__ = tn
+
+        # the anonymous types further up are named recursively.
+        extends = cls.__extends__
+        if extends is not None and extends.__type_name__ is ModelBase.Empty:
+            cls.__extends__ = extends._fill_empty_type_name(parent_ns, tn,
+                                                       k + const.PARENT_SUFFIX)
+
+        return cls
+
+    @classmethod
+    def _fill_empty_parent_name(cls, parent_ns, parent_tn, k):
+        """Names the anonymous class this class extends, if any, after the
+        member ``k`` of the parent class. This class keeps inheriting its
+        namespace from it when it doesn't have its own."""
 
-        cls.__type_name__ = "%s_%s%s" % (parent_tn, k, const.TYPE_SUFFIX)
         extends = cls.__extends__
-        while extends is not None and extends.__type_name__ is ModelBase.Empty:
-            cls.__extends__._fill_empty_type_name(cls.get_namespace(),
-                               cls.get_type_name(), k + const.PARENT_SUFFIX)
-            extends = extends.__extends__
+        if extends is None or extends.get_type_name() is not ModelBase.Empty:
+            return
+
+        owner = next(c for c in cls.__mro__ if '__namespace__' in c.__dict__)
+
+        cls.__extends__ = extends._fill_empty_type_name(parent_ns, parent_tn,
+                                                       k + const.PARENT_SUFFIX)
+        if owner is extends:
+            cls.__namespace__ = cls.__extends__.get_namespace()
 
     # TODO: rename to "resolve_identifier"
     @staticmethod
@@ -633,6 +745,76 @@ class Null(ModelBase):
     pass
 
 
+_re_inline_flags = re.compile(r'\(\?[aiLmsux]+\)')
+_re_fixed_atom = re.compile(r"""
+      \\[dDsSwW]                  # class escapes
+    | \\[^A-Za-z0-9]              # escaped punctuation
+    | \[\^?\]?(?:\\.|[^\]\\])*\]  # character classes
+    | \.                          # any character
+    | [^\\.^$*+?{}\[\]|()]        # other literals
+""", re.VERBOSE)
+_re_fixed_repeat = re.compile(r'\{([0-9]+)\}')
+
+
+def _get_fixed_length(pattern):
+    """Returns the length of the strings the given pattern matches if it's
+    made only of single-character atoms with optional ``{n}`` repetitions,
+    e.g. ``[a-f0-9]{8}-[a-f0-9]{4}``. Returns ``None`` otherwise."""
+
+    retval = 0
+    i = 0
+    while i < len(pattern):
+        m = _re_fixed_atom.match(pattern, i)
+        if m is None:
+            return None
+        i = m.end()
+
+        m = _re_fixed_repeat.match(pattern, i)
+        if m is None:
+            retval += 1
+        else:
+            retval += int(m.group(1))
+            i = m.end()
+
+    return retval
+
+
+@memoize.bounded(1024)
+def compile_pattern(pattern, flags=0):
+    """Returns the compiled version of the given regular expression. Compiled
+    patterns are shared by all types that use them. Only the most recently
+    used ones are kept, as types with arbitrary patterns can be created at
+    runtime."""
+
+    return re.compile(pattern, flags)
+
+
+@memoize.bounded(1024)
+def get_pattern_matcher(pattern, flags=0):
+    """Returns a ``(match, length)`` tuple for the given pattern.
+
+    ``match`` is a callable that returns a match object when the whole of the
+    given string matches the pattern and ``None`` otherwise. ``length`` is the
+    length of all matching strings for fixed-length patterns and ``None`` for
+    others. Checking it first avoids running the regex for most invalid
+    values."""
+
+    if _re_inline_flags.match(pattern) is None:
+        match = compile_pattern(u'(?:%s)\\Z' % pattern, flags).match
+
+    else:
+        # inline flags have to stay at the start of the pattern
+        _match = compile_pattern(pattern, flags).match
+
+        def match(value):
+            m = _match(value)
+            if m is not None and m.span() == (0, len(value)):
+                return m
+            return None
+
+    return match, _get_fixed_length(pattern)
+
+
 class SimpleModelAttributesMeta(AttributesMeta):
     def __init__(self, cls_name, cls_bases, cls_dict):
         super(SimpleModelAttributesMeta, self).__init__(cls_name, cls_bases, cls_dict)
@@ -645,7 +827,9 @@ class SimpleModelAttributesMeta(AttributesMeta):
     def set_pattern(self, pattern):
         self._pattern = pattern
         if pattern is not None:
-            self._pattern_re = re.compile(pattern)
+            self._pattern_re = compile_pattern(pattern)
+            self._pattern_match, self._pattern_length = \
+                                                   get_pattern_matcher(pattern)
 
     pattern = property(get_pattern, set_pattern)
 
@@ -655,7 +839,9 @@ class SimpleModelAttributesMeta(AttributesMeta):
     def set_unicode_pattern(self, pattern):
         self._pattern = pattern
         if pattern is not None:
-            self._pattern_re = re.compile(pattern, re.UNICODE)
+            self._pattern_re = compile_pattern(pattern, re.UNICODE)
+            self._pattern_match, self._pattern_length = \
+                                       get_pattern_matcher(pattern, re.UNICODE)
 
     unicode_pattern = property(get_unicode_pattern, set_unicode_pattern)
     upattern = property(get_unicode_pattern, set_unicode_pattern)
@@ -680,6 +866,8 @@ class SimpleModel(ModelBase):
         dict values are either a single string or a translation dict."""
 
         _pattern_re = None
+        _pattern_match = None
+        _pattern_length = None
 
     def __new__(cls, **kwargs):
         """Overriden so that any attempt to instantiate a primitive will return
@@ -693,7 +881,37 @@ class SimpleModel(ModelBase):
     @classmethod
     def customize(cls, **kwargs):
         """Duplicates cls and overwrites the values in ``cls.Attributes`` with
-        ``**kwargs`` and returns the new class."""
+        ``**kwargs`` and returns the new class.
+
+        Identical customizations of the same class return the same class.
+        Anonymous types get their names from the parent class they end up in,
+        so shared ones are copied when they get a name. See
+        :func:`_fill_empty_type_name`. Callers that change the returned class
+        otherwise must use :func:`_customize_private` instead.
+        """
+
+        key = _get_customization_key(cls, kwargs)
+        if key is not None:
+            retval = _customization_cache.get(key, None)
+            if retval is not None:
+                _customization_stats['hits'] += 1
+                return retval
+
+            _customization_stats['misses'] += 1
+
+        retval = cls._customize_private(**kwargs)
+
+        if key is not None:
+            _customization_cache[key] = retval
+            if retval.__type_name__ is ModelBase.Empty:
+                _shared_anonymous_classes.add(retval)
+
+        return retval
+
+    @classmethod
+    def _customize_private(cls, **kwargs):
+        """Same as :func:`customize`, but always returns a new class that's
+        not shared with identical customizations."""
 
         cls_name, cls_bases, cls_dict = cls._s_customize(cls, **kwargs)
 
@@ -724,6 +942,139 @@ class SimpleModel(ModelBase):
             )
 
 
+_validator_compilers = {}
+
+
+def _always_valid(value):
+    return True
+
+
+def _is_not_none(value):
+    return value is not None
+
+
+def validator_compiler(validator):
+    """Registers the decorated function as the compiler of the given
+    ``validate_string`` or ``validate_native`` implementation.
+
+    A compiler takes a class and returns a list of checks. A check is a
+    callable that takes the value and returns a boolean. All checks passing
+    must be equivalent to ``validator(cls, value)`` returning ``True``. Checks
+    that always pass for the given class should not be returned.
+    """
+
+    def wrapper(f):
+        _validator_compilers[validator] = f
+        return f
+
+    return wrapper
+
+
+def compile_checks(cls, validator):
+    """Returns a new list of checks equivalent to ``validator(cls, value)``."""
+
+    compiler = _validator_compilers.get(validator, None)
+    if compiler is None:
+        return [bind_validator(validator, cls)]
+
+    return compiler(cls)
+
+
+def bind_validator(validator, cls):
+    """Returns a check that calls ``validator(cls, value)``. The class is only
+    weakly referenced, so that the cached checks don't keep it alive."""
+
+    cls_ref = weakref_ref(cls)
+    return lambda value: validator(cls_ref(), value)
+
+
+def join_checks(checks):
+    """Returns a single callable that runs all the given checks."""
+
+    if len(checks) == 0:
+        return _always_valid
+
+    if len(checks) == 1:
+        return checks[0]
+
+    if len(checks) == 2:
+        a, b = checks
+        return lambda value: a(value) and b(value)
+
+    checks = tuple(checks)
+
+    def _check_all(value):
+        for check in checks:
+            if not check(value):
+                return False
+        return True
+
+    return _check_all
+
+
+@memoize
+def get_validators(cls):
+    """Returns the ``(validate_string, validate_native)`` pair for the given
+    class. They are callables that take only the value and are equivalent to
+    ``cls.validate_string(cls, value)`` and ``cls.validate_native(cls, value)``
+    respectively, but only do the checks that are actually configured for the
+    class. They are compiled once per class.
+
+    ``validate_*`` overrides that don't have a compiler registered with
+    :func:`validator_compiler` are called as usual.
+
+    Checks must not hold strong references to the class. Use
+    :func:`bind_validator` when they need it.
+    """
+
+    return (
+        join_checks(compile_checks(cls, cls.validate_string)),
+        join_checks(compile_checks(cls, cls.validate_native)),
+    )
+
+
+@validator_compiler(ModelBase.validate_string)
+def _compile_model_base_validate_string(cls):
+    if cls.Attributes.nillable:
+        return []
+    return [_is_not_none]
+
+
+@validator_compiler(ModelBase.validate_native)
+def _compile_model_base_validate_native(cls):
+    if cls.Attributes.nullable:
+        return []
+    return [_is_not_none]
+
+
+@validator_compiler(SimpleModel.validate_native)
+def _compile_simple_model_validate_native(cls):
+    retval = compile_checks(cls, ModelBase.validate_native)
+
+    values = cls.Attributes.values
+    if values is None or len(values) == 0:
+        return retval
+
+    nillable = cls.Attributes.nillable
+    try:
+        values = frozenset(values)
+    except TypeError:
+        pass
+
+    def _check_values(value):
+        if value is None:
+            return nillable
+
+        try:
+            return value in values
+        except TypeError:  # unhashable value
+            return False
+
+    retval.append(_check_values)
+
+    return retval
+
+
 class PushBase(object):
     def __init__(self, callback=None, errback=None):
         self.orig_thread = threading.current_thread()
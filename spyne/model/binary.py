@@ -96,6 +96,11 @@ class ByteArray(SimpleModel):
                 raise ValueError("'encoding' must be one of: %r" % \
                                 (tuple(ByteArray._encoding.handlers.values()),))
 
+        # the type name is part of the customization so that the class is not
+        # shared with ones that don't get it.
+        if tn is not None:
+            kwargs['type_name'] = tn
+
         retval = cls.customize(**kwargs)
         if tn is not None:
             retval.__type_name__ = tn
@@ -28,10 +28,11 @@ from __future__ import print_function
 import logging
 logger = logging.getLogger(__name__)
 
+import re
 import decimal
 
 from copy import copy
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, ref as weakref_ref
 from collections import deque
 from inspect import isclass
 from itertools import chain
@@ -51,6 +52,7 @@ from spyne.model.primitive import NATIVE_MAP
 from spyne.util import six
 from spyne.util import memoize
 from spyne.util import memoize_id
+from spyne.util import memoize_class
 from spyne.util import sanitize_args
 from spyne.util.color import YEL
 from spyne.util.meta import Prepareable
@@ -60,6 +62,8 @@ from spyne.util.six import add_metaclass, with_metaclass, string_types
 
 PSSM_VALUES = {'json': json, 'xml': xml, 'msgpack': msgpack, 'table': table}
 
+_re_slot_name = re.compile('^[A-Za-z_][A-Za-z0-9_]*$')
+
 
 def _is_under_pydev_debugger():
     import inspect
@@ -91,15 +95,27 @@ class TypeInfo(odict):
 
 
 class _SimpleTypeInfoElement(object):
-    __slots__ = ['path', 'parent', 'type', 'is_array', 'can_be_empty']
+    """An entry of the dict returned by ``get_simple_type_info``. The parent
+    and the type are only weakly referenced, so that the memoized dicts don't
+    keep the classes alive."""
+
+    __slots__ = ['path', '_parent', '_type', 'is_array', 'can_be_empty']
 
     def __init__(self, path, parent, type_, is_array, can_be_empty):
         self.path = path
-        self.parent = parent
-        self.type = type_
+        self._parent = weakref_ref(parent)
+        self._type = weakref_ref(type_)
         self.is_array = is_array
         self.can_be_empty = can_be_empty
 
+    @property
+    def parent(self):
+        return self._parent()
+
+    @property
+    def type(self):
+        return self._type()
+
     def __repr__(self):
         return "SimpleTypeInfoElement(path=%r, parent=%r, type=%r, is_array=%r)" \
                             % (self.path, self.parent, self.type, self.is_array)
@@ -132,18 +148,16 @@ class XmlModifier(ModelBase):
         cls.__namespace__ = parent_ns
         tn = "%s_%s%s" % (parent_tn, k, const.TYPE_SUFFIX)
 
-        child_v = cls.type
+        child_v = cls.type = cls.type._unshare(parent_ns, tn)
         child_v.__type_name__ = tn
 
         cls._type_info = TypeInfo({tn: child_v})
         cls.__type_name__ = '%s%s%s' % (const.ARRAY_PREFIX, tn,
                                                          const.ARRAY_SUFFIX)
 
-        extends = child_v.__extends__
-        while extends is not None and extends.get_type_name() is cls.Empty:
-            extends._fill_empty_type_name(parent_ns, parent_tn,
-                                                    k + const.PARENT_SUFFIX)
-            extends = extends.__extends__
+        child_v._fill_empty_parent_name(parent_ns, parent_tn, k)
+
+        return cls
 
 
 class XmlData(XmlModifier):
@@ -327,7 +341,7 @@ def _get_type_info(cls, cls_name, cls_bases, cls_dict, attrs):
                     "customized class. You should first get your class " \
                     "hierarchy right, then start customizing classes."
 
-                b.get_subclasses.memo.clear()
+                b.get_subclasses.clear()
                 logger.debug("Registering %r as base of '%s'", b, cls_name)
 
     if not ('_type_info' in cls_dict):
@@ -472,6 +486,73 @@ def _sanitize_sqlalchemy_parameters(cls_dict, attrs):
     attrs.sqla_table_args = _join_args(attrs.sqla_table_args, targs)
 
 
+def _gen_slots(cls_name, cls_bases, cls_dict, _type_info, attrs):
+    """Moves field storage of compact classes to ``__slots__``. Field names
+    that can't be slot names force a ``__dict__`` onto the instances."""
+
+    if attrs.table_name is not None or attrs.sqla_table is not None:
+        raise Exception("%s: Compact classes can't be mapped to database "
+                        "tables." % cls_name)
+
+    if '__slots__' in cls_dict:
+        return
+
+    # customized classes are not supposed to be instantiated.
+    if cls_dict.get('__orig__', None) is not None:
+        cls_dict['__slots__'] = ()
+        return
+
+    inherited = set()
+    for b in cls_bases:
+        inherited.update(getattr(b, '__fields_in_slots__', ()))
+
+    slots = []
+    needs_dict = False
+    for k in _type_info:
+        if k in inherited:
+            continue
+
+        # names starting with double underscores would get mangled
+        if _re_slot_name.match(k) is None or k.startswith('__'):
+            needs_dict = True
+            continue
+
+        # class-level field declarations would conflict with the slots
+        cls_dict.pop(k, None)
+        slots.append(k)
+
+    cls_dict['__fields_in_slots__'] = frozenset(inherited.union(slots))
+    if needs_dict:
+        slots.append('__dict__')
+    cls_dict['__slots__'] = tuple(slots)
+
+
+def _gen_voa_property(k, v, slot):
+    """Returns a property that checks the type of values assigned to the field
+    ``k``. ``slot`` is the member descriptor of the field when the class is
+    compact, ``None`` otherwise."""
+
+    if slot is None:
+        def _get(self):
+            return self.__dict__[k]
+
+        def _set(self, val):
+            self.__dict__[k] = val
+
+    else:
+        _get = slot.__get__
+        _set = slot.__set__
+
+    def _set_prop(self, val):
+        if not (val is None or isinstance(val, v.Value)):
+            raise ValueError("Invalid value %r, "
+                             "should be an instance of %r" % (val, v.Value))
+
+        _set(self, val)
+
+    return property(_get, _set_prop)
+
+
 def _sanitize_type_info(cls_name, _type_info, _type_info_alt):
     """Make sure _type_info contents are sane"""
 
@@ -587,6 +668,9 @@ class ComplexModelMeta(with_metaclass(Prepareable, type(ModelBase))):
         _sanitize_type_info(cls_name, _type_info, _type_info_alt)
         _sanitize_sqlalchemy_parameters(cls_dict, attrs)
 
+        if attrs.compact:
+            _gen_slots(cls_name, cls_bases, cls_dict, _type_info, attrs)
+
         return super(ComplexModelMeta, cls).__new__(cls, cls_name, cls_bases,
                                                     cls_dict)
 
@@ -640,21 +724,16 @@ class ComplexModelMeta(with_metaclass(Prepareable, type(ModelBase))):
         assert len(self._type_info) == len(new_type_info)
         self._type_info.keys()[:] = new_type_info
 
+        own_slots = self.__dict__.get('__slots__', ())
         for k, v in self._type_info.items():
             if not v.Attributes.validate_on_assignment:
                 continue
 
-            def _get_prop(self):
-                return self.__dict__[k]
+            slot = None
+            if k in own_slots:
+                slot = self.__dict__[k]
 
-            def _set_prop(self, val):
-                if not (val is None or isinstance(val, v.Value)):
-                    raise ValueError("Invalid value %r, "
-                                 "should be an instance of %r" % (val, v.Value))
-
-                self.__dict__[k] = val
-
-            setattr(self, k, property(_get_prop, _set_prop))
+            setattr(self, k, _gen_voa_property(k, v, slot))
 
         methods = _gen_methods(self, cls_dict)
         if len(methods) > 0:
@@ -718,13 +797,79 @@ class ComplexModelMeta(with_metaclass(Prepareable, type(ModelBase))):
 _is_array = lambda v: issubclass(v, Array) or (v.Attributes.min_occurs > 1)
 
 
+class _InitPlan(object):
+    """Field defaults of a ComplexModelBase subclass, as ``__init__`` is going
+    to apply them.
+
+    ``static`` contains the values that can be written straight to the
+    instance ``__dict__``. ``dynamic`` contains
+    ``(name, slotted, default_factory, default, sqla)`` tuples for fields that
+    must go through ``setattr``. ``slotted`` is true for fields that are not
+    stored in the instance ``__dict__``. Read-only properties are in neither.
+
+    Instances without a ``__dict__`` only get ``dynamic`` fields.
+    """
+
+    __slots__ = ('fields', 'static', 'dynamic')
+
+    def __init__(self, cls, is_sqla, plain_setattr):
+        fti = cls.get_flat_type_info(cls)
+        self.fields = tuple(fti.items())
+        self.static = {}
+        self.dynamic = []
+
+        slotted = cls.__fields_in_slots__
+        if cls.__dictoffset__ == 0:  # instances have no __dict__
+            slotted = fti
+
+        for k, v in fti.items():
+            attr = v.Attributes
+            def_val = attr.default
+            def_fac = attr.default_factory
+
+            cls_getattr_ret = getattr(cls, k, None)
+            if isinstance(cls_getattr_ret, property) and \
+                                                   cls_getattr_ret.fset is None:
+                continue  # we skip read-only properties
+
+            if def_fac is not None:
+                if six.PY2 and hasattr(def_fac, 'im_func'):
+                    # unbound-method error workaround. huh.
+                    def_fac = def_fac.im_func
+
+                self.dynamic.append((k, k in slotted, def_fac, None, False))
+                continue
+
+            if def_val is None and is_sqla:
+                # sqlalchemy objects do their own init, except the attributes
+                # that sqlalchemy doesn't know about
+                if attr.exc_table or (issubclass(v, ComplexModelBase)
+                                                  and attr.store_as is None):
+                    self.dynamic.append((k, k in slotted, None, None, True))
+                continue
+
+            if plain_setattr and not (k in slotted or
+                                 hasattr(type(cls_getattr_ret), '__set__')):
+                self.static[k] = def_val
+            else:
+                self.dynamic.append((k, k in slotted, None, def_val, False))
+
+        self.dynamic = tuple(self.dynamic)
+
+
 class ComplexModelBase(ModelBase):
     """If you want to make a better class type, this is what you should inherit
     from.
     """
 
+    __slots__ = ()
+
     __mixin__ = False
 
+    __fields_in_slots__ = frozenset()
+    """Names of the fields that are stored in ``__slots__`` instead of the
+    instance ``__dict__``. Only compact classes populate this."""
+
     class Attributes(ModelBase.Attributes):
         """ComplexModel-specific attributes"""
 
@@ -798,6 +943,13 @@ class ComplexModelBase(ModelBase):
         methods = None
         """FIXME: document me yo."""
 
+        compact = False
+        """When ``True``, instances store their fields in ``__slots__`` instead
+        of a per-instance ``__dict__``, which considerably reduces the memory
+        footprint of large object graphs. Subclasses inherit this setting.
+        Compact classes can't be mapped to database tables. See
+        :class:`CompactComplexModel`."""
+
         _variants = None
         _xml_tag_body_as = None
         _delayed_child_attrs = None
@@ -806,7 +958,6 @@ class ComplexModelBase(ModelBase):
 
     def __init__(self, *args, **kwargs):
         cls = self.__class__
-        fti = cls.get_flat_type_info(cls)
 
         if cls.__orig__ is not None:
             logger.warning("%r seems to be a customized class. It is not "
@@ -823,52 +974,51 @@ class ComplexModelBase(ModelBase):
                                 "with XmlData field. You must use keyword "
                                 "arguments in any other case.")
 
-        for k, v in fti.items():
+        plan = cls._get_init_plan(cls, hasattr(cls, '_sa_class_manager'),
+                                                               cls.__setattr__)
+
+        if len(kwargs) > 0:
+            for k, v in plan.fields:
+                if k in kwargs:
+                    self._safe_set(k, kwargs[k], v)
+
+        # the plan has no static fields and marks all fields as slotted when
+        # instances have no __dict__, so inst_dict is not used in that case.
+        inst_dict = getattr(self, '__dict__', None)
+
+        static = plan.static
+        if len(static) > 0:
+            if len(inst_dict) == 0:
+                inst_dict.update(static)
+
+            else:
+                for k, val in static.items():
+                    if not k in inst_dict:
+                        inst_dict[k] = val
+
+        for k, slotted, def_fac, def_val, sqla in plan.dynamic:
             if k in kwargs:
-                self._safe_set(k, kwargs[k], v)
+                continue
+            if slotted:
+                if hasattr(self, k):
+                    continue
+            elif k in inst_dict:
+                continue
 
-            elif not k in self.__dict__:
-                attr = v.Attributes
-                def_val = attr.default
-                def_fac = attr.default_factory
+            if def_fac is not None:
+                # should not check for read-only for default values
+                setattr(self, k, def_fac())
 
-                cls_getattr_ret = getattr(self.__class__, k, None)
-                if isinstance(cls_getattr_ret, property) and \
-                                                   cls_getattr_ret.fset is None:
-                    continue  # we skip read-only properties
-
-                elif def_fac is not None:
-                    if six.PY2 and hasattr(def_fac, 'im_func'):
-                        # unbound-method error workaround. huh.
-                        def_fac = def_fac.im_func
-                    dval = def_fac()
-
-                    # should not check for read-only for default values
-                    setattr(self, k, dval)
-
-                elif def_val is not None:
-                    # should not check for read-only for default values
-                    setattr(self, k, def_val)
-
-                # sqlalchemy objects do their own init.
-                elif hasattr(cls, '_sa_class_manager'):
-                    # except the attributes that sqlalchemy doesn't know about
-                    if v.Attributes.exc_table:
-                        # FIXME: These hide real exceptions!
-                        try:
-                            setattr(self, k, None)
-                        except AttributeError:
-                            pass
-
-                    elif issubclass(v, ComplexModelBase) and \
-                                                  v.Attributes.store_as is None:
-                        # FIXME: These hide real exceptions!
-                        try:
-                            setattr(self, k, None)
-                        except AttributeError:
-                            pass
-                else:
+            elif sqla:
+                # FIXME: These hide real exceptions!
+                try:
                     setattr(self, k, None)
+                except AttributeError:
+                    pass
+
+            else:
+                # should not check for read-only for default values
+                setattr(self, k, def_val)
 
     def __len__(self):
         return len(self._type_info)
@@ -885,10 +1035,23 @@ class ComplexModelBase(ModelBase):
         return retval
 
     def __repr__(self):
-        return "%s(%s)" % (self.get_type_name(), ', '.join(
-               ['%s=%r' % (k, self.__dict__.get(k))
-                    for k in self.__class__.get_flat_type_info(self.__class__)
-                    if self.__dict__.get(k, None) is not None]))
+        cls = self.__class__
+        slotted = cls.__fields_in_slots__
+        # we don't use getattr for fields in __dict__ so that e.g. sqlalchemy
+        # lazy loads are not triggered.
+        inst_dict = getattr(self, '__dict__', {})
+
+        fields = []
+        for k in cls.get_flat_type_info(cls):
+            if k in slotted:
+                v = getattr(self, k, None)
+            else:
+                v = inst_dict.get(k, None)
+
+            if v is not None:
+                fields.append('%s=%r' % (k, v))
+
+        return "%s(%s)" % (self.get_type_name(), ', '.join(fields))
 
     def _safe_set(self, key, value, t):
         if t.Attributes.read_only:
@@ -981,7 +1144,7 @@ class ComplexModelBase(ModelBase):
         return retval
 
     @staticmethod
-    @memoize
+    @memoize_class
     def get_flat_type_info(cls):
         """Returns a _type_info dict that includes members from all base
         classes.
@@ -991,12 +1154,25 @@ class ComplexModelBase(ModelBase):
         """
         return _get_flat_type_info(cls, TypeInfo())
 
+    @staticmethod
+    @memoize_class
+    def _get_init_plan(cls, is_sqla, setattr_impl):
+        """Returns what ``__init__`` needs to know about the fields of the
+        class, resolved once per class instead of once per instance. It's
+        cleared along with the ``get_flat_type_info`` cache.
+
+        Whether the class is mapped by sqlalchemy and its ``__setattr__`` are
+        part of the key, so that classes that are mapped or get a new
+        ``__setattr__`` after they are first instantiated get a new plan."""
+
+        return _InitPlan(cls, is_sqla, setattr_impl is object.__setattr__)
+
     @classmethod
     def get_orig(cls):
         return cls.__orig__ or cls
 
     @staticmethod
-    @memoize
+    @memoize_class
     def get_simple_type_info(cls, hier_delim="."):
         """Returns a _type_info dict that includes members from all base classes
         and whose types are only primitives. It will prefix field names in
@@ -1062,13 +1238,16 @@ class ComplexModelBase(ModelBase):
         if not ModelBase.resolve_namespace(cls, default_ns, tags):
             return False
 
-        for k, v in cls._type_info.items():
+        for k, v in list(cls._type_info.items()):
             if v is None:
                 continue
 
             if v.__type_name__ is ModelBase.Empty:
-                v._fill_empty_type_name(cls.get_namespace(),
+                named = v._fill_empty_type_name(cls.get_namespace(),
                                                          cls.get_type_name(), k)
+                if named is not v:
+                    cls._replace_field(k, named)
+                    v = named
 
             v.resolve_namespace(v, default_ns, tags)
 
@@ -1138,9 +1317,10 @@ class ComplexModelBase(ModelBase):
 
         # we could be smarter, but customize is supposed to be called only
         # during daemon initialization, so it's not really necessary.
-        ComplexModelBase.get_subclasses.memo.clear()
-        ComplexModelBase.get_flat_type_info.memo.clear()
-        ComplexModelBase.get_simple_type_info.memo.clear()
+        ComplexModelBase.get_subclasses.clear()
+        ComplexModelBase.get_flat_type_info.clear()
+        ComplexModelBase.get_simple_type_info.clear()
+        ComplexModelBase._get_init_plan.clear()
 
         return retval
 
@@ -1154,9 +1334,20 @@ class ComplexModelBase(ModelBase):
             # _variants is only for the root class.
             retval.Attributes._variants = None
 
+    @classmethod
+    def _check_can_add_field(cls, field_name):
+        """Compact classes can't get new fields, because ``__slots__`` can't be
+        changed after the class is created."""
+
+        if cls.Attributes.compact:
+            raise TypeError("Can't add field %r to %r: Compact classes can't "
+                            "get new fields after they are defined."
+                                                         % (field_name, cls))
+
     @classmethod
     def _append_field_impl(cls, field_name, field_type):
         assert isinstance(field_name, string_types)
+        cls._check_can_add_field(field_name)
 
         dcaa = cls.Attributes._delayed_child_attrs_all
         if dcaa is not None:
@@ -1170,8 +1361,9 @@ class ComplexModelBase(ModelBase):
 
         cls._type_info[field_name] = field_type
 
-        ComplexModelBase.get_flat_type_info.memo.clear()
-        ComplexModelBase.get_simple_type_info.memo.clear()
+        ComplexModelBase.get_flat_type_info.clear()
+        ComplexModelBase.get_simple_type_info.clear()
+        ComplexModelBase._get_init_plan.clear()
 
     @classmethod
     def _append_to_variants(cls, field_name, field_type):
@@ -1194,6 +1386,7 @@ class ComplexModelBase(ModelBase):
     def _insert_field_impl(cls, index, field_name, field_type):
         assert isinstance(index, int)
         assert isinstance(field_name, string_types)
+        cls._check_can_add_field(field_name)
 
         dcaa = cls.Attributes._delayed_child_attrs_all
         if dcaa is not None:
@@ -1207,8 +1400,9 @@ class ComplexModelBase(ModelBase):
 
         cls._type_info.insert(index, (field_name, field_type))
 
-        ComplexModelBase.get_flat_type_info.memo.clear()
-        ComplexModelBase.get_simple_type_info.memo.clear()
+        ComplexModelBase.get_flat_type_info.clear()
+        ComplexModelBase.get_simple_type_info.clear()
+        ComplexModelBase._get_init_plan.clear()
 
     @classmethod
     def insert_field(cls, index, field_name, field_type):
@@ -1227,8 +1421,9 @@ class ComplexModelBase(ModelBase):
 
         cls._type_info[field_name] = field_type
 
-        ComplexModelBase.get_flat_type_info.memo.clear()
-        ComplexModelBase.get_simple_type_info.memo.clear()
+        ComplexModelBase.get_flat_type_info.clear()
+        ComplexModelBase.get_simple_type_info.clear()
+        ComplexModelBase._get_init_plan.clear()
 
     @classmethod
     def _replace_field(cls, field_name, field_type):
@@ -1279,6 +1474,25 @@ class ComplexModel(ComplexModelBase):
     (see :class:``spyne.model.ModelBase``).
     """
 
+    __slots__ = ()
+
+
+class CompactComplexModel(ComplexModel):
+    """A :class:`ComplexModel` whose instances keep their fields in
+    ``__slots__``. They don't have a per-instance ``__dict__`` so they use
+    considerably less memory, at the cost of not accepting attributes that are
+    not declared as fields.
+
+    Fields whose names are not valid slot names are stored in a ``__dict__``
+    as usual. Fields can't be added with :func:`append_field` or
+    :func:`insert_field` once the class is defined.
+    """
+
+    __slots__ = ()
+
+    class Attributes(ComplexModel.Attributes):
+        compact = True
+
 
 @add_metaclass(ComplexModelMeta)
 class Array(ComplexModelBase):
@@ -1289,6 +1503,26 @@ class Array(ComplexModelBase):
     class Attributes(ComplexModelBase.Attributes):
         _wrapper = True
 
+        vectorize = None
+        """Set this to ``'list'`` or ``'ndarray'`` to have arrays of
+        :class:`spyne.model.primitive.Integer` or
+        :class:`spyne.model.primitive.Double` values deserialized and validated
+        in one go using NumPy. The service gets a list or a ``numpy.ndarray``
+        respectively.
+
+        Set this to ``'array'`` to get an ``array.array`` instead, which needs
+        no NumPy. Its typecode is the smallest one that fits the element type,
+        e.g. ``'b'`` for :class:`spyne.model.primitive.Integer8` and ``'d'``
+        for :class:`spyne.model.primitive.Double`.
+
+        Arrays that can't be handled this way (e.g. ones with null values or
+        ones that fail validation) and all arrays when NumPy is needed but not
+        installed are deserialized element by element as usual, which results
+        in a list. Only incoming documents are affected. Outgoing
+        ``array.array``, ``memoryview`` or ``numpy.ndarray`` values are
+        serialized in bulk by Json, MessagePack and Yaml documents
+        regardless of this setting."""
+
     def __new__(cls, serializer, member_name=None, wrapped=True, **kwargs):
         if not wrapped:
             if serializer.Attributes.max_occurs == 1:
@@ -1321,17 +1555,16 @@ class Array(ComplexModelBase):
         tn = "%s_%s%s" % (parent_tn, k, const.TYPE_SUFFIX)
 
         child_v, = cls._type_info.values()
+        child_v = child_v._unshare(parent_ns, tn)
         child_v.__type_name__ = tn
 
         cls._type_info = TypeInfo({tn: child_v})
         cls.__type_name__ = '%s%s%s' % (const.ARRAY_PREFIX, tn,
                                                              const.ARRAY_SUFFIX)
 
-        extends = child_v.__extends__
-        while extends is not None and extends.get_type_name() is cls.Empty:
-            extends._fill_empty_type_name(parent_ns, parent_tn,
-                                                    k + const.PARENT_SUFFIX)
-            extends = extends.__extends__
+        child_v._fill_empty_parent_name(parent_ns, parent_tn, k)
+
+        return cls
 
     @classmethod
     def customize(cls, **kwargs):
@@ -18,12 +18,21 @@
 #
 
 from spyne.model import SimpleModel
+from spyne.model._base import compile_checks
+from spyne.model._base import validator_compiler
+from spyne.util import six
 
 # adapted from: http://code.activestate.com/recipes/413486/
 
 class EnumBase(SimpleModel):
     __namespace__ = None
 
+    __members__ = {}
+    """Maps the string values of the enum to its members."""
+
+    __member_strings__ = {}
+    """Maps the members of the enum to their string values."""
+
     @staticmethod
     def resolve_namespace(cls, default_ns, tags=None):
         if cls.__namespace__ is None:
@@ -36,6 +45,54 @@ class EnumBase(SimpleModel):
                 and value in cls.__values__
             )
 
+    @classmethod
+    def get_member(cls, value):
+        """Returns the enum member for the given string value or ``None`` if
+        there is no such member."""
+
+        try:
+            return cls.__members__.get(value, None)
+        except TypeError:  # unhashable
+            return None
+
+    @classmethod
+    def to_bytes(cls, value):
+        try:
+            retval = cls.__member_strings__.get(value, None)
+        except TypeError:  # unhashable
+            retval = None
+
+        if retval is None:
+            return str(value)
+        return retval
+
+    @classmethod
+    def to_unicode(cls, value):
+        try:
+            retval = cls.__member_strings__.get(value, None)
+        except TypeError:  # unhashable
+            retval = None
+
+        if retval is None or six.PY2:
+            return six.text_type(value)
+        return retval
+
+
+@validator_compiler(EnumBase.validate_string)
+def _compile_enum_base_validate_string(cls):
+    retval = compile_checks(cls, SimpleModel.validate_string)
+
+    members = cls.__members__
+    def _is_member(value):
+        try:
+            return value in members
+        except TypeError:  # unhashable
+            return False
+
+    retval.append(_is_member)
+    return retval
+
+
 def Enum(*values, **kwargs):
     """The enum type that can only return ``True`` when compared to types of
     own type.
@@ -99,6 +156,8 @@ def Enum(*values, **kwargs):
         __doc__ = docstr
         __type_name__ = type_name
         __values__ = values
+        __members__ = {}
+        __member_strings__ = {}
 
         def __iter__(self):
             return iter(values)
@@ -116,6 +175,9 @@ def Enum(*values, **kwargs):
             return 'enum ' + str(values)
 
     for i, v in enumerate(values):
-        setattr(EnumType, v, EnumValue(i))
+        member = EnumValue(i)
+        setattr(EnumType, v, member)
+        EnumType.__members__[v] = member
+        EnumType.__member_strings__[member] = str(v)
 
     return EnumType
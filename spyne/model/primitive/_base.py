@@ -37,8 +37,11 @@ def re_match_with_span(attr, value):
     if attr.pattern is None:
         return True
 
-    m = attr._pattern_re.match(value)
-    return (m is not None) and (m.span() == (0, len(value)))
+    length = attr._pattern_length
+    if length is not None and len(value) != length:
+        return False
+
+    return attr._pattern_match(value) is not None
 
 
 class AnyXml(SimpleModel):
@@ -24,6 +24,9 @@ import spyne
 import datetime
 
 from spyne.model import SimpleModel
+from spyne.model._base import compile_checks
+from spyne.model._base import join_checks
+from spyne.model._base import validator_compiler
 from spyne.model.primitive import NATIVE_MAP
 
 FLOAT_PATTERN = r'-?[0-9]+\.?[0-9]*(e-?[0-9]+)?'
@@ -202,6 +205,36 @@ class DateTime(SimpleModel):
             ))
 
 
+@validator_compiler(DateTime.validate_native)
+def _compile_datetime_validate_native(cls):
+    checks = compile_checks(cls, SimpleModel.validate_native)
+
+    attrs = cls.Attributes
+    gt, ge, lt, le = attrs.gt, attrs.ge, attrs.lt, attrs.le
+    if not (gt is _min_dt and ge is _min_dt and lt is _max_dt and
+                                                               le is _max_dt):
+        checks.append(lambda value: value is None or (
+                # min_dt is also a valid value if gt is intact.
+                    (gt is _min_dt or value > gt)
+                and value >= ge
+                # max_dt is also a valid value if lt is intact.
+                and (lt is _max_dt or value < lt)
+                and value <= le
+            ))
+
+    if len(checks) == 0:
+        return []
+
+    check = join_checks(checks)
+
+    def _check_datetime(value):
+        if isinstance(value, datetime.datetime) and value.tzinfo is None:
+            value = value.replace(tzinfo=spyne.LOCAL_TZ)
+        return check(value)
+
+    return [_check_datetime]
+
+
 class Date(DateTime):
     """Just that, Date. No time zone support.
 
@@ -22,6 +22,8 @@ import decimal
 import platform
 
 from spyne.model import SimpleModel
+from spyne.model._base import compile_checks
+from spyne.model._base import validator_compiler
 from spyne.model.primitive import NATIVE_MAP
 from spyne.util import six
 from spyne.util import memoize
@@ -145,6 +147,42 @@ class Decimal(SimpleModel):
             ))
 
 
+@validator_compiler(Decimal.validate_string)
+def _compile_decimal_validate_string(cls):
+    retval = compile_checks(cls, SimpleModel.validate_string)
+
+    max_str_len = cls.Attributes.max_str_len
+    retval.append(lambda value: value is None or len(value) <= max_str_len)
+
+    return retval
+
+
+_NINF = float('-inf')
+_PINF = float('inf')
+
+
+def _is_finite(value):
+    return value is None or _NINF < value < _PINF
+
+
+@validator_compiler(Decimal.validate_native)
+def _compile_decimal_validate_native(cls):
+    retval = compile_checks(cls, SimpleModel.validate_native)
+
+    attrs = cls.Attributes
+    gt, ge, lt, le = attrs.gt, attrs.ge, attrs.lt, attrs.le
+
+    # unbounded values only need to be finite and not nan.
+    if gt == _NINF and ge == _NINF and lt == _PINF and le == _PINF:
+        retval.append(_is_finite)
+
+    else:
+        retval.append(lambda value: value is None or (
+            value > gt and value >= ge and value < lt and value <= le))
+
+    return retval
+
+
 class Double(Decimal):
     """This is serialized as the python ``float``. So this type comes with its
     gotchas. Unless you really know what you're doing, you should use a
@@ -221,6 +259,20 @@ class UnsignedInteger(Integer):
             )
 
 
+@validator_compiler(Integer.validate_native)
+def _compile_integer_validate_native(cls):
+    retval = compile_checks(cls, Decimal.validate_native)
+    retval.append(lambda value: value is None or int(value) == value)
+    return retval
+
+
+@validator_compiler(UnsignedInteger.validate_native)
+def _compile_unsigned_integer_validate_native(cls):
+    retval = compile_checks(cls, Integer.validate_native)
+    retval.append(lambda value: value is None or value >= 0)
+    return retval
+
+
 NonNegativeInteger = UnsignedInteger
 """The arbitrary-size unsigned integer, alias for UnsignedInteger."""
 
@@ -237,6 +289,13 @@ class PositiveInteger(NonNegativeInteger):
                 and (value is None or value > 0))
 
 
+@validator_compiler(PositiveInteger.validate_native)
+def _compile_positive_integer_validate_native(cls):
+    retval = compile_checks(cls, Integer.validate_native)
+    retval.append(lambda value: value is None or value > 0)
+    return retval
+
+
 @memoize
 def TBoundedInteger(num_bits, type_name):
     _min_b = -(0x8<<(num_bits-4))     # 0x8 is 4 bits.
@@ -257,6 +316,13 @@ def TBoundedInteger(num_bits, type_name):
                 and (value is None or (_min_b <= value <= _max_b))
             )
 
+    @validator_compiler(_BoundedInteger.validate_native)
+    def _compile_validate_native(cls):
+        retval = compile_checks(cls, Integer.validate_native)
+        retval.append(lambda value: value is None or
+                                                   _min_b <= value <= _max_b)
+        return retval
+
     return _BoundedInteger
 
 
@@ -280,6 +346,13 @@ def TBoundedUnsignedInteger(num_bits, type_name):
                 and (value is None or (_min_b <= value < _max_b))
             )
 
+    @validator_compiler(_BoundedUnsignedInteger.validate_native)
+    def _compile_validate_native(cls):
+        retval = compile_checks(cls, UnsignedInteger.validate_native)
+        retval.append(lambda value: value is None or
+                                                    _min_b <= value < _max_b)
+        return retval
+
     return _BoundedUnsignedInteger
 
 
@@ -24,7 +24,6 @@
 # but not:
 #     MULTIPOINT ((10 40), (40 30), (20 20), (30 10))
 #
-from spyne.model import SimpleModel
 from spyne.model.primitive.string import Unicode
 
 
@@ -102,7 +101,7 @@ class Point(Unicode):
             kwargs['pattern'] = _get_point_pattern(dim)
             kwargs['type_name'] = 'point%dd' % dim
 
-        retval = SimpleModel.__new__(cls, **kwargs)
+        retval = cls._customize_private(**kwargs)
         retval.__namespace__ = 'http://spyne.io/schema'
         retval.__extends__ = Unicode
         retval.__orig__ = Unicode
@@ -131,7 +130,7 @@ class Line(Unicode):
             kwargs['pattern'] = _get_linestring_pattern(dim)
             kwargs['type_name'] = 'line%dd' % dim
 
-        retval = SimpleModel.__new__(cls, **kwargs)
+        retval = cls._customize_private(**kwargs)
         retval.__namespace__ = 'http://spyne.io/schema'
         retval.__extends__ = Unicode
         retval.__orig__ = Unicode
@@ -161,7 +160,7 @@ class Polygon(Unicode):
             kwargs['pattern'] = _get_polygon_pattern(dim)
             kwargs['type_name'] = 'polygon%dd' % dim
 
-        retval = SimpleModel.__new__(cls, **kwargs)
+        retval = cls._customize_private(**kwargs)
         retval.__namespace__ = 'http://spyne.io/schema'
         retval.__extends__ = Unicode
         retval.__orig__ = Unicode
@@ -190,7 +189,7 @@ class MultiPoint(Unicode):
             kwargs['pattern'] = _get_multipoint_pattern(dim)
             kwargs['type_name'] = 'multiPoint%dd' % dim
 
-        retval = SimpleModel.__new__(cls, **kwargs)
+        retval = cls._customize_private(**kwargs)
         retval.__namespace__ = 'http://spyne.io/schema'
         retval.__extends__ = Unicode
         retval.__orig__ = Unicode
@@ -219,7 +218,7 @@ class MultiLine(Unicode):
             kwargs['pattern'] = _get_multilinestring_pattern(dim)
             kwargs['type_name'] = 'multiLine%dd' % dim
 
-        retval = SimpleModel.__new__(cls, **kwargs)
+        retval = cls._customize_private(**kwargs)
         retval.__namespace__ = 'http://spyne.io/schema'
         retval.__extends__ = Unicode
         retval.__orig__ = Unicode
@@ -250,7 +249,7 @@ class MultiPolygon(Unicode):
             kwargs['pattern'] = _get_multipolygon_pattern(dim)
             kwargs['type_name'] = 'multipolygon%dd' % dim
 
-        retval = SimpleModel.__new__(cls, **kwargs)
+        retval = cls._customize_private(**kwargs)
         retval.__namespace__ = 'http://spyne.io/schema'
         retval.__extends__ = Unicode
         retval.__orig__ = Unicode
@@ -23,6 +23,9 @@ import uuid
 from spyne.model.primitive import NATIVE_MAP
 from spyne.util import six
 from spyne.model._base import SimpleModel
+from spyne.model._base import bind_validator
+from spyne.model._base import compile_checks
+from spyne.model._base import validator_compiler
 from spyne.model.primitive._base import re_match_with_span
 
 
@@ -107,6 +110,55 @@ class Unicode(SimpleModel):
             )))
 
 
+def _compile_len_check(attrs):
+    min_len = attrs.min_len
+    max_len = attrs.max_len
+
+    # len() is always called, so that values without a length are still
+    # rejected with a TypeError.
+    if max_len == decimal.Decimal('inf'):
+        return lambda value: value is None or len(value) >= min_len
+
+    return lambda value: value is None or min_len <= len(value) <= max_len
+
+
+def _compile_pattern_check(attrs):
+    if attrs.pattern is None:
+        return None
+
+    match = attrs._pattern_match
+    length = attrs._pattern_length
+
+    if length is None:
+        def _check_pattern(value):
+            return value is None or match(value) is not None
+
+    else:
+        def _check_pattern(value):
+            return value is None or (len(value) == length
+                                                 and match(value) is not None)
+
+    return _check_pattern
+
+
+@validator_compiler(Unicode.validate_string)
+def _compile_unicode_validate_string(cls):
+    retval = compile_checks(cls, SimpleModel.validate_string)
+    retval.append(_compile_len_check(cls.Attributes))
+    return retval
+
+
+@validator_compiler(Unicode.validate_native)
+def _compile_unicode_validate_native(cls):
+    retval = compile_checks(cls, SimpleModel.validate_native)
+
+    check = _compile_pattern_check(cls.Attributes)
+    if check is not None:
+        retval.append(check)
+
+    return retval
+
+
 class String(Unicode):
     pass
 
@@ -196,6 +248,26 @@ class Uuid(Unicode(pattern=UUID_PATTERN)):
         return SimpleModel.validate_native(cls, value)
 
 
+@validator_compiler(Uuid.validate_string)
+def _compile_uuid_validate_string(cls):
+    validator = _uuid_validate[cls.Attributes.serialize_as]
+    if validator is not _uuid_validate_string:
+        return [bind_validator(validator, cls)]
+
+    retval = _compile_unicode_validate_string(cls)
+
+    check = _compile_pattern_check(cls.Attributes)
+    if check is not None:
+        retval.append(check)
+
+    return retval
+
+
+@validator_compiler(Uuid.validate_native)
+def _compile_uuid_validate_native(cls):
+    return compile_checks(cls, SimpleModel.validate_native)
+
+
 class Ltree(Unicode(LTREE_OPTIMAL_SIZE, unicode_pattern=LTREE_PATTERN)):
     """A special kind of String type designed to hold the Ltree type from
     Postgresql."""
@@ -44,6 +44,7 @@ from spyne.protocol._base import ProtocolMixin
 from spyne.model import ModelBase, XmlAttribute, Array, Null, \
     ByteArray, File, ComplexModelBase, AnyXml, AnyHtml, Unicode, String, \
     Decimal, Double, Integer, Time, DateTime, Uuid, Date, Duration, Boolean
+from spyne.model import get_validators
 
 from spyne.error import ValidationError
 
@@ -59,6 +60,13 @@ from spyne.util.cdict import cdict
 
 _date_re = re.compile(DATE_PATTERN)
 _time_re = re.compile(TIME_PATTERN)
+_date_fast_re = re.compile(r'(\d{4})-(\d{2})-(\d{2})\Z')
+_time_fast_re = re.compile(r'(\d{2}):(\d{2}):(\d{2})(\.\d+)?\Z')
+_datetime_fast_re = re.compile(
+        r'(\d{4})-(\d{2})-(\d{2})[T ]'
+        r'(\d{2}):(\d{2}):(\d{2})(\.\d+)?'
+        r'(?:(Z)|([+-]\d{2}):(\d{2}))?\Z'
+    )
 _duration_re = re.compile(
         r'(?P<sign>-?)'
         r'P'
@@ -375,6 +383,10 @@ class InProtocolBase(ProtocolMixin):
     def time_from_unicode(self, cls, string):
         """Expects ISO formatted times."""
 
+        retval = _parse_time_iso_fast(string)
+        if retval is not None:
+            return retval
+
         match = _time_re.match(string)
         if match is None:
             raise ValidationError(string, "%%r does not match regex %r " %
@@ -399,6 +411,10 @@ class InProtocolBase(ProtocolMixin):
         no matter what.
         """
 
+        retval = _parse_date_iso_fast(string)
+        if retval is not None:
+            return retval
+
         try:
             return date(*(strptime(string, '%Y-%m-%d')[0:3]))
 
@@ -415,10 +431,15 @@ class InProtocolBase(ProtocolMixin):
             raise ValidationError(string)
 
     def enum_base_from_string(self, cls, value):
-        if self.validator is self.SOFT_VALIDATION and not (
-                                        cls.validate_string(cls, value)):
-            raise ValidationError(value)
-        return getattr(cls, value)
+        if self.validator is self.SOFT_VALIDATION:
+            validate_string, _ = get_validators(cls)
+            if not validate_string(value):
+                raise ValidationError(value)
+
+        retval = cls.get_member(value)
+        if retval is None:
+            retval = getattr(cls, value)
+        return retval
 
     def model_base_from_string(self, cls, value):
         return cls.from_string(value)
@@ -426,6 +447,15 @@ class InProtocolBase(ProtocolMixin):
     def datetime_from_unicode_iso(self, cls, string):
         astz = self.get_cls_attrs(cls).as_timezone
 
+        retval = _parse_datetime_iso_fast(string)
+        if retval is not None:
+            if retval.tzinfo is None:
+                if astz:
+                    retval = retval.replace(tzinfo=astz)
+            elif astz is not None:
+                retval = retval.astimezone(astz)
+            return retval
+
         match = cls._utc_re.match(string)
         if match:
             tz = pytz.utc
@@ -439,7 +469,7 @@ class InProtocolBase(ProtocolMixin):
             if match:
                 tz_hr, tz_min = [int(match.group(x))
                                                    for x in ("tz_hr", "tz_min")]
-                tz = FixedOffset(tz_hr * 60 + tz_min, {})
+                tz = FixedOffset(tz_hr * 60 + tz_min)
                 retval = _parse_datetime_iso_match(match, tz=tz)
                 if astz is not None:
                     retval = retval.astimezone(astz)
@@ -464,8 +494,14 @@ class InProtocolBase(ProtocolMixin):
         return self._datetime_dsmap[serialize_as](cls, string)
 
     def date_from_string(self, cls, string):
+        date_format = self.get_cls_attrs(cls).format
+        if date_format == '%Y-%m-%d':
+            retval = _parse_date_iso_fast(string)
+            if retval is not None:
+                return retval
+
         try:
-            d = datetime.strptime(string, self.get_cls_attrs(cls).format)
+            d = datetime.strptime(string, date_format)
             return date(d.year, d.month, d.day)
         except ValueError as e:
             match = cls._offset_re.match(string)
@@ -477,8 +513,14 @@ class InProtocolBase(ProtocolMixin):
                                          "%%r: %s" % repr(e).replace("%", "%%"))
 
     def date_from_unicode(self, cls, string):
+        date_format = self.get_cls_attrs(cls).format
+        if date_format == '%Y-%m-%d':
+            retval = _parse_date_iso_fast(string)
+            if retval is not None:
+                return retval
+
         try:
-            d = datetime.strptime(string, self.get_cls_attrs(cls).format)
+            d = datetime.strptime(string, date_format)
             return date(d.year, d.month, d.day)
 
         except ValueError as e:
@@ -611,6 +653,70 @@ if six.PY2:
     _uuid_deserialize[('int', long)] = _uuid_deserialize[('int', int)]
 
 
+def _parse_usecond(sec_frac):
+    if sec_frac is None:
+        return 0
+
+    # we only get the most significant 6 digits because that's what
+    # datetime can handle.
+    return min(999999, int(round(float(sec_frac) * 1e6)))
+
+
+# The functions below parse the common ISO 8601 forms with a single anchored
+# regex each. They return None for anything else, or for invalid values, so
+# that the callers can fall back to the more lenient code paths and their error
+# reporting.
+
+def _parse_time_iso_fast(string):
+    match = _time_fast_re.match(string)
+    if match is None:
+        return None
+
+    hr, mi, sec, sec_frac = match.groups()
+    try:
+        return time(int(hr), int(mi), int(sec), _parse_usecond(sec_frac))
+    except ValueError:
+        return None
+
+
+def _parse_date_iso_fast(string):
+    match = _date_fast_re.match(string)
+    if match is None:
+        return None
+
+    year, month, day = match.groups()
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _parse_datetime_iso_fast(string):
+    """Returns a naive datetime for local times and an aware one for times with
+    ``Z`` or ``[+-]hh:mm`` suffixes."""
+
+    match = _datetime_fast_re.match(string)
+    if match is None:
+        return None
+
+    year, month, day, hr, mi, sec, sec_frac, utc, tz_hr, tz_min = \
+                                                                 match.groups()
+    try:
+        if utc is not None:
+            tz = pytz.utc
+        elif tz_hr is not None:
+            # pytz.FixedOffset caches its instances by offset.
+            tz = FixedOffset(int(tz_hr) * 60 + int(tz_min))
+        else:
+            tz = None
+
+        return datetime(int(year), int(month), int(day), int(hr), int(mi),
+                                         int(sec), _parse_usecond(sec_frac), tz)
+
+    except ValueError:
+        return None
+
+
 def _parse_datetime_iso_match(date_match, tz=None):
     fields = date_match.groupdict()
 
@@ -620,13 +726,7 @@ def _parse_datetime_iso_match(date_match, tz=None):
     hour = int(fields.get('hr'))
     minute = int(fields.get('min'))
     second = int(fields.get('sec'))
-    usecond = fields.get("sec_frac")
-    if usecond is None:
-        usecond = 0
-    else:
-        # we only get the most significant 6 digits because that's what
-        # datetime can handle.
-        usecond = min(999999, int(round(float(usecond) * 1e6)))
+    usecond = _parse_usecond(fields.get("sec_frac"))
 
     return datetime(year, month, day, hour, minute, second, usecond, tz)
 
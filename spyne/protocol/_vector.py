@@ -0,0 +1,279 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""Bulk (de)serialization of arrays of numbers. See
+:attr:`spyne.model.complex.Array.Attributes.vectorize`.
+
+The ``from_*`` functions return ``None`` when the given array can't be
+handled in one go, in which case the caller must fall back to deserializing
+the array element by element. This also covers arrays that fail validation, so
+that the usual code path raises the usual errors.
+"""
+
+from __future__ import absolute_import
+
+import math
+import array
+import logging
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from spyne.model import get_validators
+from spyne.model.primitive import number
+from spyne.model.primitive.number import Double
+from spyne.model.primitive.number import Integer
+from spyne.model.primitive.number import UnsignedInteger
+from spyne.model.primitive.number import PositiveInteger
+
+
+def _get_available_typecodes(typecodes):
+    # 'q' and 'Q' are not there before Python 3.3.
+    retval = []
+    for typecode in typecodes:
+        try:
+            array.array(typecode)
+        except ValueError:
+            continue
+        retval.append(typecode)
+
+    return tuple(retval)
+
+
+_SIGNED_TYPECODES = _get_available_typecodes(('b', 'h', 'i', 'l', 'q'))
+_UNSIGNED_TYPECODES = _get_available_typecodes(('B', 'H', 'I', 'L', 'Q'))
+_INTEGER_TYPECODES = frozenset(_SIGNED_TYPECODES + _UNSIGNED_TYPECODES)
+_FLOAT_TYPECODES = frozenset(('f', 'd'))
+
+
+def _is_vectorizable(cls):
+    # Custom validators can do anything, so we only know what to do for the
+    # ones in the number module.
+    if cls.validate_native.__module__ != number.__name__ or \
+                            cls.validate_string.__module__ != number.__name__:
+        return False
+
+    return issubclass(cls, (Integer, Double))
+
+
+def _get_target(prot, cls):
+    """Returns ``(dtype, accepted kinds of incoming numbers)`` for the element
+    type of the given array or ``None`` when it can't be vectorized."""
+
+    if numpy is None or not _is_vectorizable(cls):
+        return None
+
+    if issubclass(cls, Integer):
+        return numpy.int64, 'i'
+
+    return numpy.float64, 'iuf'
+
+
+def _get_typecode(prot, cls):
+    """Returns the smallest ``array.array`` typecode that can hold all valid
+    values of the given number type."""
+
+    if issubclass(cls, Double):
+        return 'd'
+
+    unsigned = issubclass(cls, UnsignedInteger)
+
+    attrs = prot.get_cls_attrs(cls)
+    min_bound = getattr(attrs, 'min_bound', None)
+    max_bound = getattr(attrs, 'max_bound', None)
+    if min_bound is not None and max_bound is not None:
+        if unsigned:
+            typecodes = _UNSIGNED_TYPECODES
+            max_bound -= 1  # it's exclusive for unsigned types
+        else:
+            typecodes = _SIGNED_TYPECODES
+
+        for typecode in typecodes:
+            num_bits = array.array(typecode).itemsize * 8
+            if unsigned:
+                lo, hi = 0, (1 << num_bits) - 1
+            else:
+                lo, hi = -(1 << (num_bits - 1)), (1 << (num_bits - 1)) - 1
+
+            if lo <= min_bound and max_bound <= hi:
+                return typecode
+
+    if unsigned:
+        return _UNSIGNED_TYPECODES[-1]
+    return _SIGNED_TYPECODES[-1]
+
+
+def _to_array(prot, cls, values, validate):
+    try:
+        retval = array.array(_get_typecode(prot, cls), values)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+    if validate:
+        _, validate_native = get_validators(cls)
+        if not all(map(validate_native, retval)):
+            return None
+
+    return retval
+
+
+def _to_bound(arr, value):
+    # Finite bounds of integer arrays are compared as integers so that large
+    # values don't lose precision.
+    if arr.dtype.kind == 'i':
+        if not (math.isinf(value) or math.isnan(value)) and \
+                                                           value == int(value):
+            return int(value)
+    return float(value)
+
+
+def _is_valid(prot, cls, arr):
+    attrs = prot.get_cls_attrs(cls)
+
+    valid = (arr > _to_bound(arr, attrs.gt)) & (arr >= _to_bound(arr, attrs.ge))
+    valid &= (arr < _to_bound(arr, attrs.lt)) & (arr <= _to_bound(arr, attrs.le))
+
+    if issubclass(cls, PositiveInteger):
+        valid &= arr > 0
+
+    elif issubclass(cls, UnsignedInteger):
+        valid &= arr >= 0
+
+    min_bound = getattr(attrs, 'min_bound', None)
+    if min_bound is not None:
+        valid &= arr >= min_bound
+
+    max_bound = getattr(attrs, 'max_bound', None)
+    if max_bound is not None:
+        if issubclass(cls, UnsignedInteger):
+            valid &= arr < max_bound
+        else:
+            valid &= arr <= max_bound
+
+    if attrs.values is not None and len(attrs.values) > 0:
+        valid &= numpy.isin(arr, list(attrs.values))
+
+    return bool(valid.all())
+
+
+def _finalize(prot, array_cls, cls, arr, validate):
+    if validate and not _is_valid(prot, cls, arr):
+        return None
+
+    if prot.get_cls_attrs(array_cls).vectorize == 'ndarray':
+        return arr
+
+    return arr.tolist()
+
+
+def from_numbers(prot, array_cls, cls, values, validate):
+    """Converts a list of numbers, as they come from e.g. JSON or MessagePack
+    documents."""
+
+    if prot.get_cls_attrs(array_cls).vectorize == 'array':
+        if not _is_vectorizable(cls) or not isinstance(values, (list, tuple)):
+            return None
+        return _to_array(prot, cls, values, validate)
+
+    target = _get_target(prot, cls)
+    if target is None or not isinstance(values, (list, tuple)):
+        return None
+
+    dtype, kinds = target
+    try:
+        arr = numpy.asarray(values)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+    if arr.ndim != 1 or arr.dtype.kind not in kinds:
+        return None
+
+    return _finalize(prot, array_cls, cls, arr.astype(dtype, copy=False),
+                                                                       validate)
+
+
+def from_strings(prot, array_cls, cls, strings, validate):
+    """Converts a list of strings, as they come from e.g. Xml documents."""
+
+    if not _is_vectorizable(cls):
+        return None
+
+    max_str_len = prot.get_cls_attrs(cls).max_str_len
+    if max_str_len is not None and len(strings) > 0 and \
+                                        max(map(len, strings)) > max_str_len:
+        return None
+
+    if prot.get_cls_attrs(array_cls).vectorize == 'array':
+        # these are what the scalar code path uses as well.
+        if issubclass(cls, Integer):
+            conv = int
+        else:
+            conv = float
+
+        return _to_array(prot, cls, map(conv, strings), validate)
+
+    target = _get_target(prot, cls)
+    if target is None:
+        return None
+
+    dtype, _ = target
+    try:
+        arr = numpy.array(strings).astype(dtype)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+    if arr.ndim != 1:
+        return None
+
+    return _finalize(prot, array_cls, cls, arr, validate)
+
+
+def to_list(cls, inst):
+    """Returns the given ``array.array``, ``memoryview`` or ``numpy.ndarray``
+    of numbers as a list in one go, or ``None`` when it's anything else or
+    when its items don't fit the given number type."""
+
+    if isinstance(inst, array.array):
+        typecode = inst.typecode
+
+    elif isinstance(inst, memoryview) or \
+                        (numpy is not None and isinstance(inst, numpy.ndarray)):
+        if inst.ndim != 1:
+            return None
+
+        if isinstance(inst, memoryview):
+            typecode = inst.format
+        else:
+            typecode = inst.dtype.char
+
+    else:
+        return None
+
+    if typecode in _INTEGER_TYPECODES:
+        if issubclass(cls, (Integer, Double)):
+            return inst.tolist()
+
+    elif typecode in _FLOAT_TYPECODES:
+        if issubclass(cls, Double):
+            return inst.tolist()
+
+    return None
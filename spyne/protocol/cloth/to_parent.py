@@ -384,7 +384,7 @@ class ToParentMixin(OutProtocolBase):
             # PushBase instance here.
 
     def enum_to_parent(self, ctx, cls, inst, parent, name, **kwargs):
-        self.base_to_parent(ctx, cls, str(inst), parent, name)
+        self.base_to_parent(ctx, cls, inst, parent, name)
 
     def xml_to_parent(self, ctx, cls, inst, parent, name, **kwargs):
         if isinstance(inst, string_types):
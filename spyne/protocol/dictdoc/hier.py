@@ -31,7 +31,9 @@ from spyne.error import ResourceNotFoundError
 
 from spyne.model import ByteArray, File, Fault, ComplexModelBase, Array, Any, \
     AnyDict, Uuid, Unicode
+from spyne.model import get_validators
 
+from spyne.protocol import _vector
 from spyne.protocol.dictdoc import DictDocument
 
 
@@ -45,6 +47,11 @@ class HierDictDocument(DictDocument):
     from_serstr = DictDocument.from_unicode
     to_serstr = DictDocument.to_unicode
 
+    # Number types whose values this protocol puts in the document as they
+    # are. Arrays of these that are given as array.array, memoryview or
+    # numpy.ndarray instances are serialized with a single tolist() call.
+    _bulk_number_types = ()
+
     def get_class_name(self, cls):
         class_name = cls.get_type_name()
         if not six.PY2:
@@ -124,8 +131,10 @@ class HierDictDocument(DictDocument):
             raise ValidationError((key, inst))
 
     def _from_dict_value(self, key, cls, inst, validator):
-        if validator is self.SOFT_VALIDATION:
+        soft = validator is self.SOFT_VALIDATION
+        if soft:
             self.validate(key, cls, inst)
+            validate_string, validate_native = get_validators(cls)
 
         if issubclass(cls, (Any, AnyDict)):
             retval = inst
@@ -141,9 +150,8 @@ class HierDictDocument(DictDocument):
             if cls.Attributes.empty_is_none and inst in (u'', b''):
                 inst = None
 
-            if (validator is self.SOFT_VALIDATION
-                                        and isinstance(inst, six.string_types)
-                                        and not cls.validate_string(cls, inst)):
+            if (soft and isinstance(inst, six.string_types)
+                                                and not validate_string(inst)):
                 raise ValidationError((key, inst))
 
             if issubclass(cls, (ByteArray, File, Uuid)):
@@ -152,8 +160,7 @@ class HierDictDocument(DictDocument):
                 retval = self.from_serstr(cls, inst)
 
         # validate native type
-        if validator is self.SOFT_VALIDATION and \
-                                           not cls.validate_native(cls, retval):
+        if soft and not validate_native(retval):
             raise ValidationError((key, retval))
 
         return retval
@@ -172,6 +179,13 @@ class HierDictDocument(DictDocument):
             if not isinstance(doc, AbcIterable):
                 raise ValidationError(doc)
 
+            if self.get_cls_attrs(cls).vectorize is not None:
+                retval = _vector.from_numbers(self, cls, serializer, doc,
+                                           validator is self.SOFT_VALIDATION)
+                if retval is not None:
+                    return retval
+                retval = []
+
             for i, child in enumerate(doc):
                 retval.append(self._from_dict_value(i, serializer, child,
                                                                     validator))
@@ -282,7 +296,10 @@ class HierDictDocument(DictDocument):
         # transform the results into a dict:
         if cls.Attributes.max_occurs > 1:
             if inst is not None:
-                retval = [self._to_dict_value(cls, inst) for inst in inst]
+                if issubclass(cls, self._bulk_number_types):
+                    retval = _vector.to_list(cls, inst)
+                if retval is None:
+                    retval = [self._to_dict_value(cls, inst) for inst in inst]
         else:
             retval = self._to_dict_value(cls, inst)
 
@@ -25,12 +25,14 @@ RE_HTTP_ARRAY_INDEX = re.compile("\\[([0-9]+)\\]")
 
 from collections import deque
 from collections import defaultdict
+from weakref import WeakKeyDictionary, ref as weakref_ref
 
 from spyne.util import six
 from spyne.error import ValidationError
 
 from spyne.model import ByteArray, String, File, ComplexModelBase, Array, \
     SimpleModel, Any, AnyDict, Unicode
+from spyne.model import get_validators
 
 from spyne.protocol.dictdoc import DictDocument
 
@@ -74,6 +76,132 @@ def _fill(inst_class, frequencies):
             frequencies[cfreq_key][k] = 0
 
 
+class _KeyPathNode(object):
+    """A node in the key-path trie of a class. Intermediate nodes correspond to
+    complex members, leaf nodes carry the ``_SimpleTypeInfoElement`` of the
+    flat dict key they represent in their ``member`` attribute. Types are only
+    weakly referenced, so that cached tries don't keep the classes alive."""
+
+    __slots__ = ['name', '_type', 'is_array', 'member', 'key', 'multi_value',
+                                                                   'children']
+
+    def __init__(self, name, type_, is_array):
+        self.name = name
+        self._type = weakref_ref(type_)
+        self.is_array = is_array
+        self.member = None
+        self.key = None
+        self.multi_value = False
+        self.children = {}
+
+    @property
+    def type(self):
+        return self._type()
+
+    def __repr__(self):
+        return "KeyPathNode(name=%r, type=%r, is_array=%r, member=%r)" % \
+                            (self.name, self.type, self.is_array, self.member)
+
+
+def _compile_key_path_trie(cls, simple_type_info):
+    """Builds a trie from the paths in the given simple type info dict. Member
+    types, array-ness and the flat type info lookups are all resolved here once
+    so that the deserializer only needs to walk the trie for every key."""
+
+    root = _KeyPathNode(None, cls, False)
+
+    for key, member in simple_type_info.items():
+        node = root
+        for pkey in member.path:
+            child = node.children.get(pkey, None)
+            if child is None:
+                ncls = node.type.get_flat_type_info(node.type).get(pkey, None)
+                if ncls is None:
+                    logger.debug("\tno trie entry for %r", member.path)
+                    break
+
+                if issubclass(ncls, Array):
+                    ncls, = ncls._type_info.values()
+
+                child = _KeyPathNode(pkey, ncls,
+                                             ncls.Attributes.max_occurs > 1)
+                node.children[pkey] = child
+
+            node = child
+
+        else:
+            node.member = member
+            node.key = key
+            node.multi_value = member.type.Attributes.max_occurs > 1
+
+    return root
+
+
+def _resolve_key(trie, orig_k, hier_delim):
+    """Parses a flat dict key like ``a[3].b.c`` in a single scan and returns
+    the leaf node along with the list of intermediate ``(node, index)`` pairs.
+    Returns None when the key can't be resolved this way."""
+
+    node = trie
+    nodes = []
+
+    for seg in orig_k.split(hier_delim):
+        nidx = 0
+        if seg[-1:] == ']':
+            i = seg.find('[')
+            if i < 0:
+                return None
+
+            try:
+                nidx = int(seg[i + 1:-1])
+            except ValueError:
+                return None
+
+            seg = seg[:i]
+
+        node = node.children.get(seg, None)
+        if node is None:
+            return None
+
+        nodes.append((node, nidx if node.is_array else 0))
+
+    leaf, _ = nodes.pop()
+    if leaf.member is None:
+        return None
+
+    return leaf, nodes
+
+
+def _resolve_key_slow(trie, simple_type_info, orig_k):
+    """Resolves keys that :func:`_resolve_key` can't parse (e.g. member names
+    that contain the hierarchy delimiter) by stripping array indexes from the
+    key and looking it up in the simple type info dict."""
+
+    member = simple_type_info.get(RE_HTTP_ARRAY_INDEX.sub("", orig_k), None)
+    if member is None:
+        return None
+
+    indexes = deque(RE_HTTP_ARRAY_INDEX.findall(orig_k))
+
+    node = trie
+    nodes = []
+    for pkey in member.path[:-1]:
+        node = node.children.get(pkey, None)
+        if node is None:
+            return None
+
+        nidx = 0
+        if node.is_array and len(indexes) > 0:
+            nidx = int(indexes.popleft())
+        nodes.append((node, nidx))
+
+    leaf = node.children.get(member.path[-1], None)
+    if leaf is None or leaf.member is None:
+        return None
+
+    return leaf, nodes
+
+
 class SimpleDictDocument(DictDocument):
     """This protocol contains logic for protocols that serialize and deserialize
     flat dictionaries. The only example as of now is Http.
@@ -93,9 +221,15 @@ class SimpleDictDocument(DictDocument):
         self.hier_delim = hier_delim
         self.strict_arrays = strict_arrays
 
+        self._key_path_tries = WeakKeyDictionary()
+
     def _to_native_values(self, cls, member, orig_k, k, v, req_enc, validator):
         value = []
 
+        soft = validator is self.SOFT_VALIDATION
+        if soft:
+            validate_string, validate_native = get_validators(member.type)
+
         for v2 in v:
             # some wsgi implementations pass unicode strings, some pass str
             # strings. we get unicode here when we can and should.
@@ -109,8 +243,7 @@ class SimpleDictDocument(DictDocument):
                     raise ValidationError(v2, "%r while decoding %%r" % e)
 
             try:
-                if (validator is self.SOFT_VALIDATION and not
-                              member.type.validate_string(member.type, v2)):
+                if soft and not validate_string(v2):
                     raise ValidationError((orig_k, v2))
 
             except TypeError:
@@ -134,14 +267,27 @@ class SimpleDictDocument(DictDocument):
                     raise ValidationError(e.faultstring,
                                   "Validation failed for %s.%s: %%s" % (ns, k))
 
-            if (validator is self.SOFT_VALIDATION and not
-                           member.type.validate_native(member.type, native_v2)):
+            if soft and not validate_native(native_v2):
                 raise ValidationError((orig_k, v2))
 
             value.append(native_v2)
 
         return value
 
+    def _get_key_path_trie(self, cls, simple_type_info):
+        """Returns the compiled key-path trie for the given class. The trie is
+        rebuilt whenever the memoized simple type info of the class changes.
+        """
+
+        cached = self._key_path_tries.get(cls, None)
+        if cached is not None and cached[0] is simple_type_info:
+            return cached[1]
+
+        retval = _compile_key_path_trie(cls, simple_type_info)
+        self._key_path_tries[cls] = (simple_type_info, retval)
+
+        return retval
+
     def simple_dict_to_object(self, doc, cls, validator=None, req_enc=None):
         """Converts a flat dict to a native python object.
 
@@ -165,18 +311,37 @@ class SimpleDictDocument(DictDocument):
         retval = cls.get_deserialization_instance()
         simple_type_info = cls.get_simple_type_info(cls,
                                                      hier_delim=self.hier_delim)
+        trie = self._get_key_path_trie(cls, simple_type_info)
 
         logger.debug("Simple type info key: %r", simple_type_info.keys())
 
+        if self.strict_arrays:
+            # strict arrays must see their indexes in ascending order.
+            items = sorted(doc.items(), key=lambda _k: _k[0])
+
+        else:
+            # only values of indexed primitive arrays (e.g. a.b[1]=x&a.b[0]=y)
+            # need to be appended in key order, the rest can go as they come.
+            items = [kv for kv in doc.items() if kv[0][-1:] != ']']
+            if len(items) < len(doc):
+                items.extend(sorted((kv for kv in doc.items()
+                                                          if kv[0][-1:] == ']'),
+                                                     key=lambda _k: _k[0]))
+
         idxmap = defaultdict(dict)
-        for orig_k, v in sorted(doc.items(), key=lambda _k: _k[0]):
-            k = RE_HTTP_ARRAY_INDEX.sub("", orig_k)
+        for orig_k, v in items:
+            path = _resolve_key(trie, orig_k, self.hier_delim)
+            if path is None:
+                path = _resolve_key_slow(trie, simple_type_info, orig_k)
 
-            member = simple_type_info.get(k, None)
-            if member is None:
-                logger.debug("\tdiscarding field %r" % k)
+            if path is None:
+                logger.debug("\tdiscarding field %r", orig_k)
                 continue
 
+            leaf, nodes = path
+            member = leaf.member
+            k = leaf.key
+
             if member.can_be_empty:
                 if v != ['empty']:  # maybe raise a ValidationError instead?
                     # 'empty' is the only valid value at this point after all
@@ -201,26 +366,13 @@ class SimpleDictDocument(DictDocument):
             # assign the native value to the relevant class in the nested object
             # structure.
             cinst = retval
-            ctype_info = cls.get_flat_type_info(cls)
-
-            idx, nidx = 0, 0
-            pkey = member.path[0]
-            cfreq_key = cls, idx
-
-            indexes = deque(RE_HTTP_ARRAY_INDEX.findall(orig_k))
-            for pkey in member.path[:-1]:
-                nidx = 0
-                ncls, ninst = ctype_info[pkey], getattr(cinst, pkey, None)
-                if issubclass(ncls, Array):
-                    ncls, = ncls._type_info.values()
+            cfreq_key = cls, 0
 
-                mo = ncls.Attributes.max_occurs
-                if mo > 1:
-                    if len(indexes) == 0:
-                        nidx = 0
-                    else:
-                        nidx = int(indexes.popleft())
+            for node, nidx in nodes:
+                pkey, ncls = node.name, node.type
+                ninst = getattr(cinst, pkey, None)
 
+                if node.is_array:
                     if ninst is None:
                         ninst = []
                         cinst._safe_set(pkey, ninst, ncls)
@@ -233,7 +385,7 @@ class SimpleDictDocument(DictDocument):
 
                         if nidx > len(ninst):
                             raise ValidationError(orig_k,
-                                            "%%r Invalid array index %d." % idx)
+                                           "%%r Invalid array index %d." % nidx)
                         if nidx == len(ninst):
                             ninst.append(ncls.get_deserialization_instance())
                             frequencies[cfreq_key][pkey] += 1
@@ -261,29 +413,25 @@ class SimpleDictDocument(DictDocument):
                     cinst = ninst
 
                 cfreq_key = cfreq_key + (ncls, nidx)
-                idx = nidx
-                ctype_info = ncls.get_flat_type_info(ncls)
 
-            frequencies[cfreq_key][member.path[-1]] += len(value)
+            frequencies[cfreq_key][leaf.name] += len(value)
 
-            if member.type.Attributes.max_occurs > 1:
-                _v = getattr(cinst, member.path[-1], None)
+            if leaf.multi_value:
+                _v = getattr(cinst, leaf.name, None)
                 is_set = True
                 if _v is None:
-                    is_set = cinst._safe_set(member.path[-1], value, member.type)
+                    is_set = cinst._safe_set(leaf.name, value, member.type)
                 else:
                     _v.extend(value)
 
-                set_skip = 'set ' if is_set else 'SKIP'
-                logger.debug("\t%s arr %r(%r) = %r" %
-                                           (set_skip, member.path, pkey, value))
+                logger.debug("\t%s arr %r = %r",
+                               'set ' if is_set else 'SKIP', member.path, value)
 
             else:
-                is_set =cinst._safe_set(member.path[-1], value[0], member.type)
+                is_set = cinst._safe_set(leaf.name, value[0], member.type)
 
-                set_skip = 'set ' if is_set else 'SKIP'
-                logger.debug("\t%s val %r(%r) = %r" %
-                                        (set_skip, member.path, pkey, value[0]))
+                logger.debug("\t%s val %r = %r",
+                            'set ' if is_set else 'SKIP', member.path, value[0])
 
         if validator is self.SOFT_VALIDATION:
             logger.debug("\tvalidate_freq: \n%r", frequencies)
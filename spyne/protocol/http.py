@@ -174,8 +174,8 @@ class HttpRpc(SimpleDictDocument):
                         l.append(v.coded_value)
                         ctx.in_header_doc[k] = l
 
-        logger.debug('\theader : %r' % (ctx.in_header_doc))
-        logger.debug('\tbody   : %r' % (ctx.in_body_doc))
+        logger.debug('\theader : %r', ctx.in_header_doc)
+        logger.debug('\tbody   : %r', ctx.in_body_doc)
 
     def deserialize(self, ctx, message):
         assert message in (self.REQUEST,)
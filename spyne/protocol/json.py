@@ -105,6 +105,8 @@ class JsonDocument(HierDictDocument):
 
     default_binary_encoding = BINARY_ENCODING_BASE64
 
+    _bulk_number_types = (Integer, Double)
+
     # flags used just for tests
     _decimal_as_string = True
 
@@ -31,6 +31,8 @@ logger = logging.getLogger(__name__)
 
 import msgpack
 
+from msgpack.exceptions import OutOfData
+
 from spyne import ValidationError
 from spyne.util import six
 from spyne.model.fault import Fault
@@ -48,6 +50,32 @@ class MessagePackDecodeError(Fault):
 NON_NUMBER_TYPES = tuple({list, dict, six.text_type, six.binary_type})
 
 
+def _unpack(in_string, **kwargs):
+    """Feeds the fragments in the ``in_string`` iterable to a
+    ``msgpack.Unpacker`` as they come instead of joining them first. Raises
+    ``ValueError`` for incomplete input or extra data, like
+    ``msgpack.unpackb`` does."""
+
+    # the size limits are set from the input size, like unpackb does.
+    in_string = list(in_string)
+    unpacker = msgpack.Unpacker(
+                max_buffer_size=max(1, sum(len(s) for s in in_string)), **kwargs)
+    for s in in_string:
+        unpacker.feed(s)
+
+    try:
+        retval = unpacker.unpack()
+    except OutOfData:
+        raise ValueError("Unpack failed: incomplete input")
+
+    try:
+        unpacker.skip()
+    except OutOfData:
+        return retval
+
+    raise ValueError("Unpack failed: extra data")
+
+
 class MessagePackDocument(HierDictDocument):
     """An integration class for the msgpack protocol."""
 
@@ -61,6 +89,9 @@ class MessagePackDocument(HierDictDocument):
     from_serstr = HierDictDocument.from_string
     to_serstr = HierDictDocument.to_bytes
 
+    # array items always fit into what msgpack can handle natively.
+    _bulk_number_types = (Integer, Double)
+
     # flags to be used in tests
     _decimal_as_string = True
     _huge_numbers_as_string = True
@@ -119,15 +150,12 @@ class MessagePackDocument(HierDictDocument):
             argument is ignored.
         """
 
-        # TODO: Use feed api as msgpack's implementation reads everything in one
-        # go anyway.
-
         # handle mmap objects from in ctx.in_string as returned by
         # TwistedWebResource.handle_rpc.
         in_string = ((s.read(s.size()) if hasattr(s, 'read') else s)
                                                          for s in ctx.in_string)
         try:
-            ctx.in_document = msgpack.unpackb(b''.join(in_string))
+            ctx.in_document = _unpack(in_string)
         except ValueError as e:
             raise MessagePackDecodeError(''.join(e.args))
 
@@ -180,10 +208,8 @@ class MessagePackRpc(MessagePackDocument):
             argument is ignored.
         """
 
-        # TODO: Use feed api
         try:
-            ctx.in_document = msgpack.unpackb(b''.join(ctx.in_string),
-                                                         use_list=self.use_list)
+            ctx.in_document = _unpack(ctx.in_string, use_list=self.use_list)
         except ValueError as e:
             raise MessagePackDecodeError(''.join(e.args))
 
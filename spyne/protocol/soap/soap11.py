@@ -55,7 +55,7 @@ from spyne.const.http import HTTP_405, HTTP_500
 from spyne.error import RequestNotAllowed
 from spyne.model.fault import Fault
 from spyne.model.primitive import Date, Time, DateTime
-from spyne.protocol.xml import XmlDocument
+from spyne.protocol.xml import XmlDocument, feed_parser
 from spyne.protocol.soap.mime import collapse_swa
 from spyne.server.http import HttpTransportContext
 
@@ -91,9 +91,30 @@ def _from_soap(in_envelope_xml, xmlids=None, **kwargs):
     return header, body
 
 
+_find_xmlids = etree.XPath('//*[string(@id)]')
+
+
+def get_xmlids(root):
+    """Returns the dict of the elements under ``root`` with an ``id``
+    attribute, keyed by that attribute, like ``lxml.etree.XMLID`` does."""
+
+    return dict((elt.get('id'), elt) for elt in _find_xmlids(root))
+
+
 def _parse_xml_string(xml_string, parser, charset=None):
     xml_string = iter(xml_string)
     chunk = next(xml_string)
+    if isinstance(chunk, six.binary_type) and charset is None:
+        # feed the fragments to the parser instead of joining them first.
+        try:
+            root = feed_parser(parser, chain((chunk,), xml_string))
+
+        except XMLSyntaxError as e:
+            logger_invalid.error("%r while parsing the incoming document", e)
+            raise Fault('Client.XMLSyntaxError', str(e))
+
+        return root, get_xmlids(root)
+
     if isinstance(chunk, six.binary_type):
         string = b''.join(chain( (chunk,), xml_string ))
     else:
@@ -75,11 +75,13 @@ from spyne.model import File
 from spyne.model import ByteArray
 from spyne.model import XmlData
 from spyne.model import XmlAttribute
+from spyne.model import get_validators
 from spyne.model.binary import Attachment  # deprecated
 from spyne.model.binary import BINARY_ENCODING_BASE64
 from spyne.model.enum import EnumBase
 
 from spyne.protocol import ProtocolBase
+from spyne.protocol import _vector
 
 
 NIL_ATTR = {XSI('nil'): 'true'}
@@ -99,6 +101,16 @@ def _gen_tagname(ns, name):
     return name
 
 
+def feed_parser(parser, in_string):
+    """Feeds the fragments in the ``in_string`` iterable to the given lxml
+    parser as they come and returns the root element of the document."""
+
+    for fragment in in_string:
+        parser.feed(fragment)
+
+    return parser.close()
+
+
 class SchemaValidationError(Fault):
     """Raised when the input stream could not be validated by the Xml Schema."""
 
@@ -382,20 +394,14 @@ class XmlDocument(SubXmlBase):
         """Uses the iterable of string fragments in ``ctx.in_string`` to set
         ``ctx.in_document``."""
 
-        string = b''.join(ctx.in_string)
+        # the fragments are fed to the parser one by one instead of being
+        # joined first, so that the document is never held twice in memory.
         try:
-            try:
-                ctx.in_document = etree.fromstring(string,
-                                        parser=XMLParser(**self.parser_kwargs))
-
-            except ValueError:
-                logger.debug('ValueError: Deserializing from unicode strings '
-                             'with encoding declaration is not supported by '
-                             'lxml.')
-                ctx.in_document = etree.fromstring(string.decode(charset),
-                                                                    self.parser)
+            ctx.in_document = feed_parser(XMLParser(**self.parser_kwargs),
+                                                                 ctx.in_string)
+
         except XMLSyntaxError as e:
-            logger_invalid.error("%r in string %r", e, string)
+            logger_invalid.error("%r while parsing the incoming document", e)
             raise Fault('Client.XMLSyntaxError', str(e))
 
     def decompose_incoming_envelope(self, ctx, message):
@@ -859,7 +865,8 @@ class XmlDocument(SubXmlBase):
         return self._fault_to_parent_impl(ctx, cls, inst, parent, ns, subelts)
 
     def enum_to_parent(self, ctx, cls, inst, parent, ns, name='retval', **kwargs):
-        self.modelbase_to_parent(ctx, cls, str(inst), parent, ns, name, **kwargs)
+        # EnumBase.to_unicode() looks the string up instead of calling str()
+        self.modelbase_to_parent(ctx, cls, inst, parent, ns, name, **kwargs)
 
     def xml_to_parent(self, ctx, cls, inst, parent, ns, name, **_):
         if isinstance(inst, str) or isinstance(inst, unicode):
@@ -976,11 +983,30 @@ class XmlDocument(SubXmlBase):
         retval = [ ]
         (serializer,) = cls._type_info.values()
 
+        if self.get_cls_attrs(cls).vectorize is not None:
+            retval = self._vector_from_element(cls, serializer, element)
+            if retval is not None:
+                return retval
+            retval = [ ]
+
         for child in element.getchildren():
             retval.append(self.from_element(ctx, serializer, child))
 
         return retval
 
+    def _vector_from_element(self, cls, serializer, element):
+        strings = []
+        for child in element.getchildren():
+            # comments, processing instructions, nil markers, etc. all need
+            # the scalar code path.
+            if not isinstance(child.tag, string_types) or \
+                                    len(child.attrib) > 0 or child.text is None:
+                return None
+            strings.append(child.text)
+
+        return _vector.from_strings(self, cls, serializer, strings,
+                                         self.validator is self.SOFT_VALIDATION)
+
     def iterable_from_element(self, ctx, cls, element):
         (serializer,) = cls._type_info.values()
 
@@ -988,10 +1014,16 @@ class XmlDocument(SubXmlBase):
             yield self.from_element(ctx, serializer, child)
 
     def enum_from_element(self, ctx, cls, element):
-        if self.validator is self.SOFT_VALIDATION and not (
-                                        cls.validate_string(cls, element.text)):
-            raise ValidationError(element.text)
-        return getattr(cls, element.text)
+        value = element.text
+        if self.validator is self.SOFT_VALIDATION:
+            validate_string, _ = get_validators(cls)
+            if not validate_string(value):
+                raise ValidationError(value)
+
+        retval = cls.get_member(value)
+        if retval is None:
+            retval = getattr(cls, value)
+        return retval
 
     def fault_from_element(self, ctx, cls, element):
         code = element.find('faultcode').text
@@ -1034,9 +1066,11 @@ class XmlDocument(SubXmlBase):
         return None
 
     def unicode_from_element(self, ctx, cls, element):
-        if self.validator is self.SOFT_VALIDATION and not (
-                                        cls.validate_string(cls, element.text)):
-            raise ValidationError(element.text)
+        soft = self.validator is self.SOFT_VALIDATION
+        if soft:
+            validate_string, validate_native = get_validators(cls)
+            if not validate_string(element.text):
+                raise ValidationError(element.text)
 
         s = element.text
         if s is None:
@@ -1044,34 +1078,35 @@ class XmlDocument(SubXmlBase):
 
         retval = self.from_unicode(cls, s)
 
-        if self.validator is self.SOFT_VALIDATION and not (
-                                              cls.validate_native(cls, retval)):
+        if soft and not validate_native(retval):
             raise ValidationError(retval)
 
         return retval
 
     def base_from_element(self, ctx, cls, element):
-        if self.validator is self.SOFT_VALIDATION and not (
-                                        cls.validate_string(cls, element.text)):
-            raise ValidationError(element.text)
+        soft = self.validator is self.SOFT_VALIDATION
+        if soft:
+            validate_string, validate_native = get_validators(cls)
+            if not validate_string(element.text):
+                raise ValidationError(element.text)
 
         retval = self.from_unicode(cls, element.text)
 
-        if self.validator is self.SOFT_VALIDATION and not (
-                                            cls.validate_native(cls, retval)):
+        if soft and not validate_native(retval):
             raise ValidationError(retval)
 
         return retval
 
     def byte_array_from_element(self, ctx, cls, element):
-        if self.validator is self.SOFT_VALIDATION and not (
-                                        cls.validate_string(cls, element.text)):
-            raise ValidationError(element.text)
+        soft = self.validator is self.SOFT_VALIDATION
+        if soft:
+            validate_string, validate_native = get_validators(cls)
+            if not validate_string(element.text):
+                raise ValidationError(element.text)
 
         retval = self.from_unicode(cls, element.text, self.binary_encoding)
 
-        if self.validator is self.SOFT_VALIDATION and not (
-                                            cls.validate_native(cls, retval)):
+        if soft and not validate_native(retval):
             raise ValidationError(retval)
 
         return retval
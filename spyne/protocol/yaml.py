@@ -81,6 +81,8 @@ class YamlDocument(HierDictDocument):
 
     default_binary_encoding = BINARY_ENCODING_BASE64
 
+    _bulk_number_types = (Integer, Double)
+
     # for test classes
     _decimal_as_string = True
 
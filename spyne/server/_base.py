@@ -48,6 +48,13 @@ class ServerBase(object):
     def __init__(self, app):
         self.app = app
         self.app.transport = self.transport  # FIXME: this is weird
+
+        self.buffer_in_string = False
+        """When True, incoming byte streams that are not lists are read into
+        lists before they are parsed, so that they can be read again later.
+        Auxiliary processors that need the request bytes set this in their
+        ``initialize()`` method."""
+
         self.appinit()
 
         self.event_manager = EventManager(self)
@@ -62,6 +69,10 @@ class ServerBase(object):
         """
 
         try:
+            if self.buffer_in_string and ctx.in_string is not None and \
+                                  not isinstance(ctx.in_string, (list, tuple)):
+                ctx.in_string = list(ctx.in_string)
+
             # sets ctx.in_document
             self.app.in_protocol.create_in_document(ctx, in_string_charset)
 
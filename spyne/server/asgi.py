@@ -0,0 +1,517 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+
+"""
+A server that uses http as transport via asgi. It doesn't contain any server
+logic.
+
+This module needs Python 3.5 or newer. Service methods can be ``async def``
+coroutines, which are awaited on the event loop of the ASGI server. All other
+methods are run in a thread pool so that they don't block the event loop.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import asyncio
+import cgi
+import threading
+import itertools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from spyne.application import get_fault_string_from_exception
+from spyne.auxproc import process_contexts
+from spyne.error import Fault, InvalidInputError, RequestTooLongError
+from spyne.protocol.http import HttpRpc
+from spyne.server.http import HttpBase
+from spyne.server.http import HttpMethodContext
+from spyne.server.wsgi import WsgiApplication
+from spyne.server.wsgi import WsgiTransportContext
+from spyne.server.wsgi import _gen_http_headers
+from spyne.util import reconstruct_url
+from spyne.util.aio import get_pending
+from spyne.util.six import BytesIO
+
+from spyne.const.http import HTTP_200
+from spyne.const.http import HTTP_404
+from spyne.const.http import HTTP_500
+
+
+try:
+    from spyne.protocol.soap.mime import apply_mtom
+except ImportError as e:
+    def apply_mtom(*args, **kwargs):
+        raise e
+
+
+def _scope_to_environ(scope):
+    """Builds a WSGI environment from the given ASGI http connection scope.
+    The request body is not part of it."""
+
+    server = scope.get('server', None) or ('localhost', 80)
+
+    retval = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', ''),
+        'PATH_INFO': scope['path'],
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': 'HTTP/%s' % scope.get('http_version', '1.1'),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'asgi.scope': scope,
+    }
+
+    client = scope.get('client', None)
+    if client is not None:
+        retval['REMOTE_ADDR'] = client[0]
+        retval['REMOTE_PORT'] = str(client[1])
+
+    for k, v in scope.get('headers', ()):
+        k = k.decode('latin1')
+        v = v.decode('latin1')
+
+        if k == 'content-type':
+            retval['CONTENT_TYPE'] = v
+        elif k == 'content-length':
+            retval['CONTENT_LENGTH'] = v
+        else:
+            k = 'HTTP_' + k.upper().replace('-', '_')
+            if k in retval:
+                retval[k] = ','.join((retval[k], v))
+            else:
+                retval[k] = v
+
+    return retval
+
+
+def _gen_asgi_headers(headers):
+    return [(k.encode('latin1'), str(v).encode('latin1'))
+                                        for k, v in _gen_http_headers(headers)]
+
+
+def _to_bytes(chunk):
+    if isinstance(chunk, str):
+        return chunk.encode('utf8')
+    return chunk
+
+
+class AsgiTransportContext(WsgiTransportContext):
+    """The class that is used in the transport attribute of the
+    :class:`AsgiMethodContext` class. The ASGI scope is converted to a WSGI
+    environment, so everything that works with ``ctx.transport.req_env``
+    also works here."""
+
+    def __init__(self, parent, transport, req_env, content_type):
+        super(AsgiTransportContext, self).__init__(parent, transport,
+                                                          req_env, content_type)
+
+        self.scope = req_env['asgi.scope']
+        """ASGI connection scope"""
+
+
+class AsgiMethodContext(HttpMethodContext):
+    """The ASGI-Specific method context. ASGI-Specific information is stored in
+    the transport attribute using the :class:`AsgiTransportContext` class.
+    """
+
+    default_transport_context = AsgiTransportContext
+
+
+class AsgiApplication(HttpBase):
+    """An `ASGI 3 <https://asgi.readthedocs.io>`_ compliant callable class.
+
+    Request bodies are read as they arrive, and ``ctx.out_string`` is sent to
+    the client one chunk at a time.
+
+    Service methods that are ``async def`` coroutine functions are awaited on
+    the event loop. Other methods are run in a thread pool, which is an
+    instance of :class:`concurrent.futures.ThreadPoolExecutor` with
+    ``max_workers`` threads unless an executor is passed explicitly.
+
+    Supported events:
+        * ``wsdl``
+            Called right before the wsdl data is returned to the client.
+
+        * ``wsdl_exception``
+            Called right after an exception is thrown during wsdl generation.
+            The exception object is stored in ctx.transport.wsdl_error
+            attribute.
+
+        * ``wsgi_call``
+            Called first when the incoming http request is identified as a rpc
+            request.
+
+        * ``wsgi_return``
+            Called right before the output stream is sent to the client.
+
+        * ``wsgi_exception``
+            Called right before returning the exception to the client.
+
+        * ``wsgi_close``
+            Called after the whole data has been returned to the client. It's
+            called both from success and error cases.
+
+    The event names are the same as the ones of :class:`WsgiApplication` so that
+    the same event handlers can be used with both transports.
+    """
+
+    def __init__(self, app, chunked=True, max_content_length=2 * 1024 * 1024,
+                           block_length=8 * 1024, executor=None, max_workers=None):
+        super(AsgiApplication, self).__init__(app, chunked, max_content_length,
+                                                                   block_length)
+
+        self._mtx_build_interface_document = threading.Lock()
+
+        self._wsdl = None
+        if self.doc.wsdl11 is not None:
+            self._wsdl = self.doc.wsdl11.get_interface_document()
+
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        self.executor = executor
+        """The executor that runs the methods that are not coroutine
+        functions."""
+
+    async def __call__(self, scope, receive, send):
+        """This method conforms to the ASGI 3 spec for applications."""
+
+        if scope['type'] == 'lifespan':
+            return await self.handle_lifespan(scope, receive, send)
+
+        if scope['type'] != 'http':
+            raise ValueError("Unsupported connection type %r" % scope['type'])
+
+        req_env = _scope_to_environ(scope)
+
+        if self.is_wsdl_request(req_env):
+            url = reconstruct_url(req_env).split('.wsdl')[0]
+            return await self.handle_wsdl_request(req_env, send, url)
+
+        return await self.handle_rpc(req_env, receive, send)
+
+    is_wsdl_request = WsgiApplication.is_wsdl_request
+
+    async def handle_lifespan(self, scope, receive, send):
+        while True:
+            message = await receive()
+
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle_wsdl_request(self, req_env, send, url):
+        ctx = AsgiMethodContext(self, req_env, 'text/xml; charset=utf-8')
+
+        if self.doc.wsdl11 is None:
+            ctx.out_string = [HTTP_404]
+            return await self.send_response(ctx, send, HTTP_404)
+
+        if self._wsdl is None:
+            self._wsdl = self.doc.wsdl11.get_interface_document()
+
+        ctx.transport.wsdl = self._wsdl
+
+        if ctx.transport.wsdl is None:
+            try:
+                self._mtx_build_interface_document.acquire()
+
+                ctx.transport.wsdl = self._wsdl
+
+                if ctx.transport.wsdl is None:
+                    self.doc.wsdl11.build_interface_document(url)
+                    ctx.transport.wsdl = self._wsdl = \
+                                        self.doc.wsdl11.get_interface_document()
+
+            except Exception as e:
+                logger.exception(e)
+                ctx.transport.wsdl_error = e
+
+                self.event_manager.fire_event('wsdl_exception', ctx)
+
+                ctx.out_string = [HTTP_500]
+                return await self.send_response(ctx, send, HTTP_500)
+
+            finally:
+                self._mtx_build_interface_document.release()
+
+        self.event_manager.fire_event('wsdl', ctx)
+
+        ctx.transport.resp_headers['Content-Length'] = \
+                                                    str(len(ctx.transport.wsdl))
+        ctx.out_string = [ctx.transport.wsdl]
+
+        await self.send_response(ctx, send, HTTP_200)
+
+    async def handle_error(self, p_ctx, others, error, send):
+        """Serialize errors and send them to the client.
+
+        :param p_ctx: Primary (non-aux) context.
+        :param others: List if auxiliary contexts (can be empty).
+        :param error: One of ctx.{in,out}_error.
+        :param send: The ASGI send callable.
+        """
+
+        self.serialize_error(p_ctx, error)
+
+        try:
+            process_contexts(self, others, p_ctx, error=error)
+        except Exception as e:
+            # Report but ignore any exceptions from auxiliary methods.
+            logger.exception(e)
+
+        await self.send_response(p_ctx, send, p_ctx.transport.resp_code,
+                                                                  finalize=True)
+
+    def serialize_error(self, ctx, error):
+        """Sets ``ctx.out_string`` to the serialized ``error`` and returns the
+        response code."""
+
+        if ctx.transport.resp_code is None:
+            ctx.transport.resp_code = \
+                ctx.out_protocol.fault_to_http_response_code(error)
+
+        self.get_out_string(ctx)
+
+        # consume the generator to get the length
+        ctx.out_string = list(ctx.out_string)
+
+        ctx.transport.resp_headers['Content-Length'] = \
+                                    str(sum((len(s) for s in ctx.out_string)))
+        self.event_manager.fire_event('wsgi_exception', ctx)
+
+        return ctx.transport.resp_code
+
+    async def handle_rpc(self, req_env, receive, send):
+        initial_ctx = AsgiMethodContext(self, req_env,
+                                                self.app.out_protocol.mime_type)
+
+        self.event_manager.fire_event('wsgi_call', initial_ctx)
+
+        try:
+            initial_ctx.in_string = await self.read_request_body(req_env,
+                                                                       receive)
+        except Fault as e:
+            initial_ctx.in_object = None
+            initial_ctx.in_error = e
+            initial_ctx.out_error = e
+            return await self.handle_error(initial_ctx, (), e, send)
+
+        if initial_ctx.in_string is None:
+            # the client is gone, there's no one to respond to.
+            initial_ctx.close()
+            self.event_manager.fire_event('wsgi_close', initial_ctx)
+            return
+
+        contexts = self.generate_contexts(initial_ctx,
+                                                   self.get_charset(req_env))
+        p_ctx, others = contexts[0], contexts[1:]
+
+        if p_ctx.in_error:
+            return await self.handle_error(p_ctx, others, p_ctx.in_error, send)
+
+        self.get_in_object(p_ctx)
+        if p_ctx.in_error:
+            logger.error(p_ctx.in_error)
+            return await self.handle_error(p_ctx, others, p_ctx.in_error, send)
+
+        await self.get_out_object_async(p_ctx)
+        if p_ctx.out_error:
+            return await self.handle_error(p_ctx, others, p_ctx.out_error, send)
+
+        if p_ctx.transport.resp_code is None:
+            p_ctx.transport.resp_code = HTTP_200
+
+        try:
+            self.get_out_string(p_ctx)
+
+        except Exception as e:
+            logger.exception(e)
+            p_ctx.out_error = Fault('Server', get_fault_string_from_exception(e))
+            return await self.handle_error(p_ctx, others, p_ctx.out_error, send)
+
+        if isinstance(p_ctx.out_protocol, HttpRpc) and \
+                                               p_ctx.out_header_doc is not None:
+            p_ctx.transport.resp_headers.update(p_ctx.out_header_doc)
+
+        if p_ctx.descriptor and p_ctx.descriptor.mtom:
+            # see the comment in WsgiApplication.handle_rpc
+            out_type_info = p_ctx.descriptor.out_message._type_info
+            if len(out_type_info) == 1:
+                p_ctx.out_object = [p_ctx.out_object]
+
+            p_ctx.transport.resp_headers, p_ctx.out_string = apply_mtom(
+                    p_ctx.transport.resp_headers, p_ctx.out_string,
+                    p_ctx.descriptor.out_message._type_info.values(),
+                    p_ctx.out_object,
+                )
+
+        self.event_manager.fire_event('wsgi_return', p_ctx)
+
+        if self.chunked:
+            # the user has not set a content-length, so we delete it as the
+            # output is just an iterable.
+            if 'Content-Length' in p_ctx.transport.resp_headers:
+                del p_ctx.transport.resp_headers['Content-Length']
+        else:
+            p_ctx.out_string = [b''.join(map(_to_bytes, p_ctx.out_string))]
+
+        try:
+            len(p_ctx.out_string)  # generator?
+
+            # nope
+            p_ctx.transport.resp_headers['Content-Length'] = \
+                                    str(sum([len(a) for a in p_ctx.out_string]))
+
+        except TypeError:
+            pass
+
+        try:
+            process_contexts(self, others, p_ctx, error=None)
+        except Exception as e:
+            # Report but ignore any exceptions from auxiliary methods.
+            logger.exception(e)
+
+        await self.send_response(p_ctx, send, p_ctx.transport.resp_code,
+                                                                  finalize=True)
+
+    async def get_out_object_async(self, ctx):
+        """Calls the matched user function to set ``ctx.out_object``.
+        Coroutine functions are called on the event loop and their results
+        are awaited, other functions are called in ``self.executor``."""
+
+        if ctx.in_error is not None:
+            raise ctx.in_error
+
+        if asyncio.iscoroutinefunction(ctx.function):
+            self.get_out_object(ctx)
+        else:
+            await asyncio.get_event_loop().run_in_executor(self.executor,
+                                                     self.get_out_object, ctx)
+
+        pending = get_pending(ctx)
+        if pending is not None:
+            # Application.process_request sets ctx.out_object or
+            # ctx.out_error before this completes.
+            await pending
+
+    async def read_request_body(self, req_env, receive):
+        """Reads the request body from the given ASGI receive callable as it
+        arrives. Returns the list of body chunks, or None if the client
+        disconnected before sending the whole request."""
+
+        length = req_env.get('CONTENT_LENGTH', '')
+        if len(length) > 0:
+            try:
+                length = int(length)
+            except ValueError:
+                raise InvalidInputError("Invalid Content-Length", length)
+
+            if length > self.max_content_length:
+                raise RequestTooLongError()
+
+        retval = []
+        bytes_read = 0
+
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return None
+
+            data = message.get('body', b'')
+            if len(data) > 0:
+                bytes_read += len(data)
+                if bytes_read > self.max_content_length:
+                    raise RequestTooLongError()
+
+                retval.append(data)
+
+            if not message.get('more_body', False):
+                break
+
+        return retval
+
+    def get_charset(self, req_env):
+        content_type = req_env.get("CONTENT_TYPE")
+        if content_type is not None:
+            return cgi.parse_header(content_type)[1].get('charset', None)
+
+    async def send_response(self, ctx, send, resp_code, finalize=False):
+        """Sends ``ctx.out_string`` to the client chunk by chunk. The first
+        chunk is produced before the response headers are sent so that
+        generators get a chance to set them. When that fails, the error is
+        sent instead."""
+
+        try:
+            chunks = iter(ctx.out_string)
+            try:
+                first_chunk = next(chunks)
+
+            except StopIteration:
+                first_chunk = b''
+
+            except Exception as e:
+                if ctx.out_error is not None:
+                    raise
+
+                logger.exception(e)
+                ctx.out_error = Fault('Server',
+                                             get_fault_string_from_exception(e))
+                ctx.transport.resp_code = None
+                ctx.out_document = ctx.out_string = None
+                resp_code = self.serialize_error(ctx, ctx.out_error)
+                chunks = iter(ctx.out_string)
+                first_chunk = b''
+
+            await send({
+                'type': 'http.response.start',
+                'status': int(resp_code[:3]),
+                'headers': _gen_asgi_headers(ctx.transport.resp_headers),
+            })
+
+            for chunk in itertools.chain([first_chunk], chunks):
+                if len(chunk) > 0:
+                    await send({
+                        'type': 'http.response.body',
+                        'body': _to_bytes(chunk),
+                        'more_body': True,
+                    })
+
+            await send({'type': 'http.response.body', 'body': b''})
+
+        finally:
+            ctx.close()
+            if finalize:
+                self.event_manager.fire_event('wsgi_close', ctx)
+
+    def decompose_incoming_envelope(self, prot, ctx, message):
+        """This function is only called by the HttpRpc protocol to have the
+        request parsed into ``ctx.in_body_doc`` and ``ctx.in_header_doc``.
+        """
+
+        if ctx.in_string is not None:
+            ctx.in_document['wsgi.input'] = BytesIO(b''.join(ctx.in_string))
+
+        WsgiApplication.decompose_incoming_envelope(self, prot, ctx, message)
@@ -17,6 +17,8 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
+import re
+
 from collections import defaultdict
 
 from spyne import TransportContext, MethodDescriptor, MethodContext, Redirect
@@ -26,6 +28,167 @@ from spyne.const.http import gen_body_redirect, \
 from spyne.protocol.http import HttpPattern
 
 
+_re_special_chars = frozenset('.^$*+?{}[]\\|()')
+_re_quantifier_chars = frozenset('*+?{')
+_re_verb_literal = re.compile('^[A-Za-z]+(\\|[A-Za-z]+)*$')
+
+
+def _get_literal_prefix(address):
+    """Returns the leading path segments of the given compiled address pattern
+    that can only match themselves. Segments that contain regex syntax, and
+    everything after them, are left to the regex matcher."""
+
+    if '|' in address:  # top-level alternations can match anything
+        return ()
+
+    segments = address.split('/')[1:]
+    retval = []
+    for i, seg in enumerate(segments[:-1]):
+        if _re_special_chars.intersection(seg):
+            break
+
+        # a quantifier after the separator (e.g. "/a/?b") makes it optional
+        if segments[i + 1][:1] in _re_quantifier_chars:
+            break
+
+        retval.append(seg)
+
+    else:
+        seg = segments[-1]
+        if not _re_special_chars.intersection(seg):
+            retval.append(seg)
+
+    return tuple(retval)
+
+
+class _HttpRouterNode(object):
+    __slots__ = ['children', 'by_verb', 'any_verb']
+
+    def __init__(self):
+        self.children = {}
+        self.by_verb = defaultdict(list)
+        self.any_verb = []
+
+
+class HttpRouter(object):
+    """Matches requests against a list of :class:`HttpPattern` instances.
+
+    Patterns are indexed in a radix tree by the literal leading segments of
+    their address patterns, and by verb when the verb pattern is a literal or
+    an alternation of literals. Only the patterns whose literal parts are
+    compatible with the request are tried using regexes, in the same order
+    :func:`match_linear` would try them, so both return the same result.
+
+    :param patterns: An iterable of :class:`HttpPattern` instances, in
+        priority order.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self._root = _HttpRouterNode()
+
+        for i, patt in enumerate(self.patterns):
+            node = self._root
+            for seg in _get_literal_prefix(patt.address_re.pattern):
+                child = node.children.get(seg, None)
+                if child is None:
+                    node.children[seg] = child = _HttpRouterNode()
+                node = child
+
+            entry = (i, patt)
+            if patt.verb is not None and _re_verb_literal.match(patt.verb):
+                for verb in set(patt.verb.split('|')):
+                    node.by_verb[verb].append(entry)
+            else:
+                node.any_verb.append(entry)
+
+    def get_candidates(self, method, path):
+        """Returns the patterns that may match the given verb and path, in
+        priority order."""
+
+        retval = []
+        node = self._root
+        segments = iter(path.split('/')[1:])
+        while node is not None:
+            retval.extend(node.any_verb)
+            if len(node.by_verb) > 0:
+                retval.extend(node.by_verb.get(method, ()))
+
+            if len(node.children) == 0:
+                break
+
+            node = node.children.get(next(segments, None), None)
+
+        retval.sort(key=lambda x: x[0])
+
+        return [patt for _, patt in retval]
+
+    def match(self, method='', path='', host=''):
+        """Returns a ``(pattern, params)`` tuple for the first pattern that
+        matches the given request, ``(None, {})`` otherwise."""
+
+        if not path.startswith('/'):
+            path = '/' + path
+
+        for patt in self.get_candidates(method, path):
+            params = _match_one(patt, method, path, host)
+            if params is not None:
+                return patt, params
+
+        return None, {}
+
+    def match_linear(self, method='', path='', host=''):
+        """Same as :func:`match` but tries every pattern. Exists for testing
+        and benchmarking purposes."""
+
+        if not path.startswith('/'):
+            path = '/' + path
+
+        for patt in self.patterns:
+            params = _match_one(patt, method, path, host)
+            if params is not None:
+                return patt, params
+
+        return None, {}
+
+
+def _match_one(patt, method, path, host):
+    params = defaultdict(list)
+
+    if patt.verb is not None:
+        match = patt.verb_re.match(method)
+        if match is None:
+            return None
+        if not (match.span() == (0, len(method))):
+            return None
+
+        for k, v in match.groupdict().items():
+            params[k].append(v)
+
+    if patt.host is not None:
+        match = patt.host_re.match(host)
+        if match is None:
+            return None
+        if not (match.span() == (0, len(host))):
+            return None
+
+        for k, v in match.groupdict().items():
+            params[k].append(v)
+
+    assert patt.address is not None
+
+    match = patt.address_re.match(path)
+    if match is None:
+        return None
+    if not (match.span() == (0, len(path))):
+        return None
+
+    for k, v in match.groupdict().items():
+        params[k].append(v)
+
+    return params
+
+
 class HttpRedirect(Redirect):
     def do_redirect(self):
         if not isinstance(self.ctx.transport, HttpTransportContext):
@@ -155,10 +318,12 @@ class HttpBase(ServerBase):
         # the front.
         self._http_patterns = list(reversed(sorted(self._http_patterns,
                                           key=lambda x: (x.address, x.host) )))
+        self._http_router = HttpRouter(self._http_patterns)
 
     def match_pattern(self, ctx, method='', path='', host=''):
-        """Sets ctx.method_request_string if there's a match. It's O(n) which
-        means you should keep your number of patterns as low as possible.
+        """Sets ctx.method_request_string if there's a match. Patterns are
+        looked up using :class:`HttpRouter`, so only the patterns that share
+        the literal parts of the request path are tried using regexes.
 
         :param ctx: A MethodContext instance
         :param method: The verb in the HTTP Request (GET, POST, etc.)
@@ -167,51 +332,17 @@ class HttpBase(ServerBase):
             there)
         """
 
-        if not path.startswith('/'):
-            path = '/' + path
+        patt, params = self._http_router.match(method, path, host)
+        if patt is None:
+            return defaultdict(list)
 
-        params = defaultdict(list)
-        for patt in self._http_patterns:
-            assert isinstance(patt, HttpPattern)
-
-            if patt.verb is not None:
-                match = patt.verb_re.match(method)
-                if match is None:
-                    continue
-                if not (match.span() == (0, len(method))):
-                    continue
-
-                for k,v in match.groupdict().items():
-                    params[k].append(v)
-
-            if patt.host is not None:
-                match = patt.host_re.match(host)
-                if match is None:
-                    continue
-                if not (match.span() == (0, len(host))):
-                    continue
-
-                for k, v in match.groupdict().items():
-                    params[k].append(v)
-
-            assert patt.address is not None
-
-            match = patt.address_re.match(path)
-            if match is None:
-                continue
-            if not (match.span() == (0, len(path))):
-                continue
-            for k,v in match.groupdict().items():
-                params[k].append(v)
-
-            d = patt.endpoint
-            assert isinstance(d, MethodDescriptor)
-            if d.parent_class is not None and d.in_message_name_override:
-                ctx.method_request_string = '%s.%s' % (
-                                           d.in_message.get_type_name(), d.name)
-            else:
-                ctx.method_request_string = patt.endpoint.name
-            break
+        d = patt.endpoint
+        assert isinstance(d, MethodDescriptor)
+        if d.parent_class is not None and d.in_message_name_override:
+            ctx.method_request_string = '%s.%s' % (
+                                       d.in_message.get_type_name(), d.name)
+        else:
+            ctx.method_request_string = patt.endpoint.name
 
         return params
 
@@ -36,6 +36,7 @@ from spyne.const.ansi_color import LIGHT_RED
 from spyne.const.ansi_color import LIGHT_BLUE
 from spyne.const.ansi_color import END_COLOR
 from spyne.server import ServerBase
+from spyne.util.aio import get_pending, get_running_loop
 
 
 _big_header = ('=' * 40) + LIGHT_RED
@@ -50,6 +51,15 @@ class NullServer(ServerBase):
 
     It implicitly uses the 'sync' auxiliary processing mode.
 
+    Methods are called through the ``service`` attribute. Calls made through
+    the ``async`` attribute return Twisted ``Deferred`` instances when the
+    method does so. Calls made through the ``aio`` attribute always return an
+    awaitable, which runs the method when it's awaited: ::
+
+        result = await null_server.aio.some_method(*args)
+
+    This works for both ``async def`` methods and regular ones.
+
     Note that:
         1) ``**kwargs`` overwrite ``*args``.
         2) You can do: ::
@@ -68,6 +78,7 @@ class NullServer(ServerBase):
 
         self.service = _FunctionProxy(self, self.app, async=False)
         self.async = _FunctionProxy(self, self.app, async=True)
+        self.aio = _FunctionProxy(self, self.app, async=False, aio=True)
         self.factory = Factory(self.app)
         self.ostr = ostr
         self.locale = locale
@@ -86,22 +97,24 @@ class NullServer(ServerBase):
 
 
 class _FunctionProxy(object):
-    def __init__(self, server, app, async):
+    def __init__(self, server, app, async, aio=False):
         self._app = app
         self._server = server
         self.in_header = None
         self.async = async
+        self.aio = aio
 
     def __getattr__(self, key):
         return _FunctionCall(self._app, self._server, key, self.in_header,
-                  self._server.ostr, self._server.locale, self.async)
+                  self._server.ostr, self._server.locale, self.async, self.aio)
 
     def __getitem__(self, key):
         return self.__getattr__(key)
 
 
 class _FunctionCall(object):
-    def __init__(self, app, server, key, in_header, ostr, locale, async):
+    def __init__(self, app, server, key, in_header, ostr, locale, async,
+                                                                    aio=False):
         self.app = app
 
         self._key = key
@@ -110,8 +123,15 @@ class _FunctionCall(object):
         self._ostr = ostr
         self._locale = locale
         self._async = async
+        self._aio = aio
 
     def __call__(self, *args, **kwargs):
+        if self._aio:
+            return _AioCall(self, args, kwargs)
+
+        return self._call(*args, **kwargs)
+
+    def _call(self, *args, **kwargs):
         initial_ctx = MethodContext(self, MethodContext.SERVER)
         initial_ctx.method_request_string = self._key
         initial_ctx.in_header = self._in_header
@@ -162,14 +182,17 @@ class _FunctionCall(object):
                                                                  _small_footer))
 
             if cnt == 0:
-                if self._async and isinstance(ctx.out_object[0], Deferred):
+                if self._aio:
+                    retval = _aio_result(ctx, cnt, self)
+
+                elif self._async and isinstance(ctx.out_object[0], Deferred):
                     retval = ctx.out_object[0]
                     retval.addCallback(_cb_async, ctx, cnt, self)
 
                 else:
                     retval = _cb_sync(ctx, cnt, self)
 
-        if not self._async:
+        if not (self._async or self._aio):
             p_ctx.close()
 
         logger.warning("%s  end request  %s" % (_big_header, _big_footer))
@@ -177,6 +200,19 @@ class _FunctionCall(object):
         return retval
 
 
+class _AioCall(object):
+    """The awaitable returned by the aio interface. The call is made when it's
+    awaited, so that it runs on the event loop of the awaiting coroutine."""
+
+    def __init__(self, fc, args, kwargs):
+        self._fc = fc
+        self._args = args
+        self._kwargs = kwargs
+
+    def __await__(self):
+        return self._fc._call(*self._args, **self._kwargs).__await__()
+
+
 def _cb_async(ret, ctx, cnt, fc):
     if issubclass(ctx.descriptor.out_message, ComplexModelBase):
         if len(ctx.descriptor.out_message._type_info) == 0:
@@ -194,6 +230,34 @@ def _cb_async(ret, ctx, cnt, fc):
     return _cb_sync(ctx, cnt, fc)
 
 
+def _aio_result(ctx, cnt, fc):
+    """Returns an asyncio future that completes with what ``_cb_sync`` returns
+    once the result of the user function is processed."""
+
+    loop = get_running_loop()
+    if loop is None:
+        ctx.close()
+        raise RuntimeError("The aio interface needs a running event loop")
+
+    retval = loop.create_future()
+
+    def _cb_done(_):
+        try:
+            retval.set_result(_cb_sync(ctx, cnt, fc))
+        except Exception as e:
+            retval.set_exception(e)
+        finally:
+            ctx.close()
+
+    pending = get_pending(ctx)
+    if pending is not None:
+        pending.add_done_callback(_cb_done)
+    else:
+        _cb_done(None)
+
+    return retval
+
+
 def _cb_sync(ctx, cnt, fc):
     retval = None
 
@@ -0,0 +1,494 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""The ``spyne.server.prefork`` module runs the Twisted server transports in
+several processes, to make use of all the cores of a machine. It's POSIX-only
+as it uses ``os.fork()``.
+
+The Twisted reactor does not survive forks, so this module does not import
+it. Each worker process imports it after it's forked, which means the reactor
+must not be imported in the process that calls
+:func:`TwistedPreforkServer.serve_forever`. Importing anything from
+:mod:`spyne.server.twisted` would do that, so don't. ::
+
+    from spyne.server.prefork import TwistedPreforkServer
+
+    app = Application(...)
+    TwistedPreforkServer(app, 8000, num_workers=4).serve_forever()
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import errno
+import json
+import os
+import select
+import signal
+import socket
+import sys
+
+from multiprocessing import cpu_count
+from time import time
+
+
+class TwistedPreforkServer(object):
+    """Builds the listening socket, then forks ``num_workers`` processes that
+    run a Twisted reactor each. The workers get the already built
+    :class:`spyne.application.Application` instance, along with its
+    interface, from the parent process via copy-on-write.
+
+    By default, the workers inherit the listening socket from the parent
+    process. When ``reuse_port`` is True, every worker listens on its own
+    socket with the ``SO_REUSEPORT`` option instead, which lets the kernel
+    balance the incoming connections between them.
+
+    Workers that exit are restarted, at most once every ``restart_delay``
+    seconds per worker. On ``SIGHUP``, the workers are replaced one by one:
+    every new worker is started before the old one is told to stop. On
+    ``SIGTERM`` or ``SIGINT``, the workers are stopped and
+    :func:`serve_forever` returns. A worker that's told to stop closes its
+    listening socket and exits once its connections are closed, or after
+    ``graceful_timeout`` seconds.
+
+    Every ``stats_interval`` seconds, the workers report their metrics to the
+    parent process, which aggregates them. See :func:`get_stats`. When
+    ``stats_path`` is given, the parent listens on a unix socket there and
+    writes the output of :func:`get_stats` as json to every connection it
+    accepts. Workers that find their parent process gone stop as if they got
+    ``SIGTERM``.
+
+    :param app: The :class:`spyne.application.Application` instance.
+    :param port: The port to listen on. 0 means a random port, which is
+        available via the ``port`` attribute once :func:`bind` is called.
+    :param host: The address to listen on.
+    :param num_workers: The number of worker processes. Defaults to the number
+        of cores.
+    :param transport: Either ``'http'`` for
+        :class:`spyne.server.twisted.TwistedWebResource` or ``'msgpack'`` for
+        :class:`spyne.server.twisted.msgpack.TwistedMessagePackProtocolFactory`.
+        Override :func:`build_factory` to use anything else.
+    :param transport_kwargs: The keyword arguments to pass to the transport
+        constructor.
+    :param reuse_port: Whether to use ``SO_REUSEPORT`` instead of sharing a
+        single listening socket.
+    :param backlog: The listen backlog of the listening socket(s).
+    :param restart_delay: The min. number of seconds between two restarts of
+        a worker.
+    :param graceful_timeout: The max. number of seconds a stopping worker
+        waits for its connections to close.
+    :param stats_path: The path of the unix socket that serves the stats.
+    :param stats_interval: The number of seconds between two stats reports
+        of a worker.
+    """
+
+    def __init__(self, app, port, host='', num_workers=None, transport='http',
+                 transport_kwargs=None, reuse_port=False, backlog=128,
+                 restart_delay=1.0, graceful_timeout=30.0, stats_path=None,
+                                                           stats_interval=1.0):
+        if not (transport in ('http', 'msgpack')):
+            raise ValueError(transport)
+
+        if reuse_port and not hasattr(socket, 'SO_REUSEPORT'):
+            raise ValueError("SO_REUSEPORT is not supported on this platform")
+
+        if num_workers is None:
+            num_workers = cpu_count()
+
+        self.app = app
+        self.port = port
+        self.host = host
+        self.num_workers = num_workers
+        self.transport = transport
+        self.transport_kwargs = transport_kwargs or {}
+        self.reuse_port = reuse_port
+        self.backlog = backlog
+        self.restart_delay = restart_delay
+        self.graceful_timeout = graceful_timeout
+        self.stats_path = stats_path
+        self.stats_interval = stats_interval
+
+        self.socket = None
+
+        self.workers = [None] * num_workers
+        """The pids of the worker processes. None for workers that are not
+        running."""
+
+        self.worker_stats = {}
+        """The last metrics that each worker reported, by worker index."""
+
+        self._started_at = [0.0] * num_workers
+        self._retiring = set()
+        self._running = False
+        self._restart_requested = False
+        self._stats_in = self._stats_out = None
+        self._stats_listener = None
+
+    def bind(self):
+        """Creates the listening socket. When ``reuse_port`` is True, the
+        socket is only bound to reserve the port for the workers."""
+
+        self.socket = self._create_socket()
+        self.port = self.socket.getsockname()[1]
+        if not self.reuse_port:
+            self.socket.listen(self.backlog)
+
+    def _create_socket(self):
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if self.reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((self.host, self.port))
+
+        return sock
+
+    def build_factory(self):
+        """Returns the Twisted protocol factory that the workers listen with.
+        It's called in the worker processes, after the reactor is
+        imported."""
+
+        if self.transport == 'http':
+            from twisted.web.server import Site
+            from spyne.server.twisted import TwistedWebResource
+
+            return Site(TwistedWebResource(self.app, **self.transport_kwargs))
+
+        from spyne.server.msgpack import MessagePackServerBase
+        from spyne.server.twisted.msgpack import \
+                                              TwistedMessagePackProtocolFactory
+
+        return TwistedMessagePackProtocolFactory(
+                        MessagePackServerBase(self.app, **self.transport_kwargs))
+
+    def create_worker(self, i):
+        """Forks the ``i``th worker process and returns its pid."""
+
+        pid = os.fork()
+        if pid != 0:
+            logger.debug("Started worker %d with pid %d", i, pid)
+            return pid
+
+        # child process: never return from here.
+        retval = 0
+        try:
+            self._run_worker(i)
+
+        except BaseException as e:
+            logger.exception(e)
+            retval = 1
+
+        finally:
+            os._exit(retval)
+
+    def _run_worker(self, i):
+        for signum in (signal.SIGINT, signal.SIGHUP):
+            signal.signal(signum, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        self._stats_in.close()
+        if self._stats_listener is not None:
+            self._stats_listener.close()
+
+        from twisted.internet import reactor
+        from twisted.internet.task import LoopingCall
+        from twisted.protocols.policies import WrappingFactory
+
+        factory = WrappingFactory(self.build_factory())
+        stats = {'worker': i, 'pid': os.getpid(), 'started_at': time(),
+                            'calls': 0, 'errors': 0, 'connections': 0}
+
+        def _on_call(ctx):
+            stats['calls'] += 1
+
+        def _on_error(ctx):
+            stats['errors'] += 1
+
+        self.app.event_manager.add_listener('method_call', _on_call)
+        self.app.event_manager.add_listener('method_exception_object',
+                                                                      _on_error)
+
+        sock = self.socket
+        if self.reuse_port:
+            sock = self._create_socket()
+            sock.listen(self.backlog)
+
+        # twisted accepts in a loop, so a blocking socket would hang the
+        # worker as soon as another worker wins the race for a connection.
+        sock.setblocking(False)
+        port = reactor.adoptStreamPort(sock.fileno(), sock.family, factory)
+        sock.close()
+        if self.socket is not None:
+            self.socket.close()
+
+        # the connections are counted by the wrapped protocols.
+        orig_build_protocol = factory.buildProtocol
+
+        def _build_protocol(addr):
+            stats['connections'] += 1
+            return orig_build_protocol(addr)
+
+        factory.buildProtocol = _build_protocol
+
+        resource = getattr(factory.wrappedFactory, 'resource', None)
+        parent_pid = os.getppid()
+
+        def _send_stats():
+            if os.getppid() != parent_pid:
+                logger.warning("Worker %d lost its parent process", i)
+                _stop()
+                return
+
+            stats['open_connections'] = len(factory.protocols)
+            if hasattr(resource, 'get_thread_pool_stats'):
+                stats['thread_pools'] = resource.get_thread_pool_stats()
+
+            try:
+                self._stats_out.send(json.dumps(stats).encode('utf8'))
+            except socket.error as e:  # the parent is busy or gone
+                logger.debug("Could not send stats: %r", e)
+
+        stopping = []
+
+        def _wait_for_connections(deadline):
+            if factory.protocols and time() < deadline:
+                reactor.callLater(0.1, _wait_for_connections, deadline)
+                return
+
+            for p in list(factory.protocols):
+                p.transport.loseConnection()
+            reactor.stop()
+
+        def _stop():
+            if stopping:
+                return
+            stopping.append(True)
+
+            logger.debug("Worker %d is stopping", i)
+            port.stopListening()
+            _wait_for_connections(time() + self.graceful_timeout)
+
+        signal.signal(signal.SIGTERM,
+                             lambda signum, frame: reactor.callFromThread(_stop))
+
+        LoopingCall(_send_stats).start(self.stats_interval)
+
+        reactor.run(installSignalHandlers=False)
+
+    def supervise(self):
+        """Reaps exited workers and starts the missing ones."""
+
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except OSError:  # no child processes
+                break
+
+            if pid == 0:
+                break
+
+            if pid in self._retiring:
+                self._retiring.discard(pid)
+
+            elif pid in self.workers:
+                i = self.workers.index(pid)
+                logger.warning("Worker %d with pid %d exited with status %d",
+                                                                  i, pid, status)
+                self.workers[i] = None
+                self.worker_stats.pop(i, None)
+
+        now = time()
+        for i, pid in enumerate(self.workers):
+            if pid is None and now - self._started_at[i] >= self.restart_delay:
+                self._started_at[i] = now
+                self.workers[i] = self.create_worker(i)
+
+    def restart(self):
+        """Makes :func:`serve_forever` replace all workers. Can be called from
+        signal handlers."""
+
+        self._restart_requested = True
+
+    def _restart_workers(self):
+        self._restart_requested = False
+
+        for i, pid in enumerate(self.workers):
+            self._started_at[i] = time()
+            self.workers[i] = self.create_worker(i)
+            self.worker_stats.pop(i, None)
+
+            if pid is not None:
+                self._retiring.add(pid)
+                self._kill(pid, signal.SIGTERM)
+
+    def stop(self):
+        """Makes :func:`serve_forever` return. Can be called from signal
+        handlers."""
+
+        self._running = False
+
+    def get_stats(self):
+        """Returns the last metrics reported by each worker under the
+        ``'workers'`` key, and their sums under the ``'total'`` key."""
+
+        total = {}
+        for stats in self.worker_stats.values():
+            for k in ('calls', 'errors', 'connections', 'open_connections'):
+                total[k] = total.get(k, 0) + stats.get(k, 0)
+
+        return {
+            'workers': dict((str(k), v) for k, v in self.worker_stats.items()),
+            'total': total,
+        }
+
+    def _read_stats(self):
+        while True:
+            try:
+                data = self._stats_in.recv(0x10000)
+            except socket.error as e:
+                if e.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+
+            stats = json.loads(data.decode('utf8'))
+            if self.workers[stats['worker']] == stats['pid']:
+                self.worker_stats[stats['worker']] = stats
+
+    def _serve_stats(self):
+        conn, _ = self._stats_listener.accept()
+        try:
+            conn.sendall(json.dumps(self.get_stats()).encode('utf8'))
+        except socket.error as e:
+            logger.debug("Could not send stats: %r", e)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _kill(pid, signum):
+        try:
+            os.kill(pid, signum)
+        except OSError:  # already gone
+            pass
+
+    def _stop_workers(self):
+        pids = [pid for pid in self.workers if pid is not None]
+        pids.extend(self._retiring)
+        for pid in pids:
+            self._kill(pid, signal.SIGTERM)
+
+        deadline = time() + self.graceful_timeout + 1
+        while pids and time() < deadline:
+            for pid in list(pids):
+                try:
+                    if os.waitpid(pid, os.WNOHANG)[0] != 0:
+                        pids.remove(pid)
+                except OSError:
+                    pids.remove(pid)
+            if pids:
+                select.select([], [], [], 0.05)
+
+        for pid in pids:
+            logger.warning("Killing worker with pid %d", pid)
+            self._kill(pid, signal.SIGKILL)
+            try:
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+
+        self.workers = [None] * self.num_workers
+        self.worker_stats.clear()
+        self._retiring.clear()
+
+    def serve_forever(self):
+        """Starts the workers and supervises them until :func:`stop` is
+        called or the process receives ``SIGTERM`` or ``SIGINT``. The workers
+        are stopped before returning."""
+
+        if 'twisted.internet.reactor' in sys.modules:
+            raise RuntimeError("The Twisted reactor must not be imported in "
+                               "the process that forks the workers.")
+
+        if self.socket is None:
+            self.bind()
+
+        self._stats_in, self._stats_out = socket.socketpair(socket.AF_UNIX,
+                                                              socket.SOCK_DGRAM)
+        self._stats_in.setblocking(False)
+        self._stats_out.setblocking(False)
+
+        if self.stats_path is not None:
+            if os.path.exists(self.stats_path):
+                os.unlink(self.stats_path)
+            self._stats_listener = socket.socket(socket.AF_UNIX,
+                                                            socket.SOCK_STREAM)
+            self._stats_listener.bind(self.stats_path)
+            self._stats_listener.listen(5)
+
+        def _on_stop(signum, frame):
+            self.stop()
+
+        def _on_restart(signum, frame):
+            self.restart()
+
+        self._running = True
+        orig_handlers = dict((signum, signal.signal(signum, handler))
+                      for signum, handler in ((signal.SIGTERM, _on_stop),
+                                              (signal.SIGINT, _on_stop),
+                                              (signal.SIGHUP, _on_restart)))
+
+        try:
+            self.supervise()
+
+            rlist = [self._stats_in]
+            if self._stats_listener is not None:
+                rlist.append(self._stats_listener)
+
+            while self._running:
+                try:
+                    readable, _, _ = select.select(rlist, [], [], 0.1)
+                except (select.error, OSError) as e:
+                    if e.args[0] != errno.EINTR:
+                        raise
+                    continue
+
+                if self._stats_in in readable:
+                    self._read_stats()
+
+                if self._stats_listener in readable:
+                    self._serve_stats()
+
+                if self._restart_requested:
+                    self._restart_workers()
+
+                self.supervise()
+
+        finally:
+            for signum, handler in orig_handlers.items():
+                signal.signal(signum, handler)
+
+            self._stop_workers()
+
+            self.socket.close()
+            self.socket = None
+            self._stats_in.close()
+            self._stats_out.close()
+
+            if self._stats_listener is not None:
+                self._stats_listener.close()
+                os.unlink(self.stats_path)
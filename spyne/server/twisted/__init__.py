@@ -17,5 +17,6 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
+from spyne.server.twisted._base import MethodThreadPool
 from spyne.server.twisted.http import TwistedWebResource
 from spyne.server.twisted.websocket import TwistedWebSocketResource
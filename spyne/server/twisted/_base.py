@@ -17,8 +17,14 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
+import threading
+
+from time import time
+
 from twisted.internet.defer import Deferred
 from twisted.internet.interfaces import IPullProducer
+from twisted.internet.threads import deferToThreadPool
+from twisted.python.threadpool import ThreadPool
 from twisted.web.iweb import UNKNOWN_LENGTH
 
 from zope.interface import implementer
@@ -68,6 +74,83 @@ class Producer(object):
         self.deferred = None
 
 
+class MethodThreadPool(object):
+    """A named, size-bounded thread pool that runs blocking service methods
+    out of the reactor thread. Methods are assigned to pools by name with the
+    ``_executor`` argument of the ``@rpc`` decorator or the ``__executor__``
+    attribute of their service class.
+
+    :param name: The name of the pool.
+    :param size: The maximum number of threads in the pool. Calls that arrive
+        when all threads are busy wait in the queue of the pool.
+    :param serialize: When True, deserialization of the request and
+        serialization of the response also run in the pool.
+    :param reactor: The reactor to deliver the results to. Defaults to the
+        global reactor.
+    """
+
+    def __init__(self, name, size=10, serialize=False, reactor=None):
+        if reactor is None:
+            from twisted.internet import reactor
+
+        self.name = name
+        self.size = size
+        self.serialize = serialize
+        self.reactor = reactor
+
+        self.pool = ThreadPool(minthreads=0, maxthreads=size,
+                                               name='spyne-%s' % (name,))
+        self.pool.start()
+        reactor.addSystemEventTrigger('during', 'shutdown', self.pool.stop)
+
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.calls = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def defer(self, f, *args, **kwargs):
+        """Runs ``f(*args, **kwargs)`` in the pool. Returns a Deferred that
+        fires in the reactor thread with its return value."""
+
+        queued_at = time()
+        with self._lock:
+            self.queued += 1
+
+        def _run():
+            wait = time() - queued_at
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                self.calls += 1
+                self.total_wait += wait
+                if wait > self.max_wait:
+                    self.max_wait = wait
+
+            try:
+                return f(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+
+        return deferToThreadPool(self.reactor, self.pool, _run)
+
+    def get_stats(self):
+        """Returns a dict with the queue depth, the number of busy threads and
+        the time calls spent waiting for a thread, in seconds."""
+
+        with self._lock:
+            avg_wait = 0.0
+            if self.calls > 0:
+                avg_wait = self.total_wait / self.calls
+
+            return dict(name=self.name, size=self.size, queued=self.queued,
+                    running=self.running, calls=self.calls,
+                    total_wait=self.total_wait, avg_wait=avg_wait,
+                    max_wait=self.max_wait)
+
+
 from spyne import Address
 _TYPE_MAP = {'TCP': Address.TCP4, 'TCP6': Address.TCP6,
              'UDP': Address.UDP4, 'UDP6': Address.UDP6}
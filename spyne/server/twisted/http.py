@@ -80,6 +80,7 @@ from spyne.server.http import HttpBase
 from spyne.server.http import HttpMethodContext
 from spyne.server.http import HttpTransportContext
 from spyne.server.twisted._base import Producer
+from spyne.server.twisted._base import MethodThreadPool
 from spyne.util.six import text_type, string_types
 from spyne.util.six.moves.urllib.parse import unquote
 
@@ -348,7 +349,7 @@ class TwistedWebResource(Resource):
     """
 
     def __init__(self, app, chunked=False, max_content_length=2 * 1024 * 1024,
-                                           block_length=8 * 1024, prepath=None):
+                       block_length=8 * 1024, prepath=None, thread_pools=()):
         Resource.__init__(self)
         self.app = app
 
@@ -357,6 +358,36 @@ class TwistedWebResource(Resource):
         self._wsdl = None
         self.prepath = prepath
 
+        self.thread_pools = {}
+        """A dict of pool names to :class:`MethodThreadPool` instances."""
+
+        for pool in thread_pools:
+            self.thread_pools[pool.name] = pool
+
+        # create pools with the default size for the executors that were not
+        # passed explicitly.
+        for k, v in self.app.interface.service_method_map.items():
+            for descriptor in v:
+                name = descriptor.executor
+                if name is not None and not (name in self.thread_pools):
+                    logger.info("Creating thread pool %r for %r", name, k)
+                    self.thread_pools[name] = MethodThreadPool(name)
+
+    def get_thread_pool(self, ctx):
+        """Returns the :class:`MethodThreadPool` that runs the method of the
+        given context, or None if it should run in the reactor thread."""
+
+        if ctx.descriptor is None or ctx.descriptor.executor is None:
+            return None
+
+        return self.thread_pools[ctx.descriptor.executor]
+
+    def get_thread_pool_stats(self):
+        """Returns the statistics of all thread pools as a dict of pool names
+        to the dicts returned by :func:`MethodThreadPool.get_stats`."""
+
+        return dict([(k, v.get_stats()) for k, v in self.thread_pools.items()])
+
     def getChildWithDefault(self, path, request):
         # this hack is necessary because twisted takes the slash character in
         # http requests too seriously. i.e. it insists that a leaf node can only
@@ -405,7 +436,7 @@ class TwistedWebResource(Resource):
         p_ctx.out_object = error
         self.http_transport.get_out_string(p_ctx)
 
-        retval = ''.join(p_ctx.out_string)
+        retval = b''.join(p_ctx.out_string)
 
         p_ctx.close()
 
@@ -437,6 +468,22 @@ class TwistedWebResource(Resource):
         if p_ctx.in_error:
             return self.handle_rpc_error(p_ctx, others, p_ctx.in_error, request)
 
+        pool = self.get_thread_pool(p_ctx)
+        if pool is not None:
+            if not pool.serialize:
+                self.http_transport.get_in_object(p_ctx)
+
+                if p_ctx.in_error:
+                    return self.handle_rpc_error(p_ctx, others,
+                                                       p_ctx.in_error, request)
+
+            pool.defer(_process_in_thread, self.http_transport, p_ctx,
+                                                                pool.serialize) \
+                .addCallback(_cb_thread, request, p_ctx, others, self) \
+                .addErrback(_eb_deferred, request, p_ctx, others, self)
+
+            return NOT_DONE_YET
+
         else:
             self.http_transport.get_in_object(p_ctx)
 
@@ -510,6 +557,57 @@ def _eb_request_finished(retval, request, p_ctx):
     request.finish()
 
 
+def _returns_file(p_ctx):
+    om = p_ctx.descriptor.out_message
+    if isclass(om) and issubclass(om, File):
+        return True
+
+    if issubclass(om, ComplexModelBase) and len(om._type_info) == 1:
+        single_class, = om._type_info.values()
+        return isclass(single_class) and issubclass(single_class, File)
+
+    return False
+
+
+def _process_in_thread(transport, p_ctx, serialize):
+    """Runs in a :class:`MethodThreadPool` thread. Deserializes the request
+    when ``serialize`` is True, calls the user function and serializes the
+    response if it's neither a Deferred nor a PushBase or File instance."""
+
+    if serialize:
+        transport.get_in_object(p_ctx)
+        if p_ctx.in_error:
+            return
+
+    transport.get_out_object(p_ctx)
+    if p_ctx.out_error or not serialize:
+        return
+
+    ret = p_ctx.out_object[0]
+    if isinstance(ret, (Deferred, PushBase)) or _returns_file(p_ctx):
+        return
+
+    transport.get_out_string(p_ctx)
+    p_ctx.out_string = list(p_ctx.out_string)
+
+
+def _cb_thread(_, request, p_ctx, others, resource):
+    error = p_ctx.in_error or p_ctx.out_error
+    if error:
+        request.write(resource.handle_rpc_error(p_ctx, others, error, request))
+        request.finish()
+        return
+
+    ret = p_ctx.out_object[0]
+    if isinstance(ret, Deferred):
+        ret.addCallback(_cb_deferred, request, p_ctx, others, resource)
+        ret.addErrback(_eb_deferred, request, p_ctx, others, resource)
+
+    else:
+        _cb_deferred(p_ctx.out_object, request, p_ctx, others, resource,
+                                                                      cb=False)
+
+
 def _cb_deferred(ret, request, p_ctx, others, resource, cb=True):
     resp_code = p_ctx.transport.resp_code
     # If user code set its own response code, don't touch it.
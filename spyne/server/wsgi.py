@@ -30,6 +30,8 @@ import cgi
 import threading
 import itertools
 
+from collections import OrderedDict
+
 from spyne.util.six.moves.urllib.parse import unquote, quote
 
 try:
@@ -52,7 +54,6 @@ from spyne.server.http import HttpBase
 from spyne.server.http import HttpMethodContext
 from spyne.server.http import HttpTransportContext
 from spyne.util import reconstruct_url
-from spyne.util.odict import odict
 
 from spyne.const.ansi_color import LIGHT_GREEN
 from spyne.const.ansi_color import END_COLOR
@@ -68,41 +69,50 @@ except ImportError as e:
         raise e
 
 
+def _unquote_plus(s):
+    if '+' in s:
+        s = s.replace('+', ' ')
+    if '%' in s:
+        s = unquote(s)
+    return s
+
+
 def _parse_qs(qs):
-    pairs = (s2 for s1 in qs.split('&') for s2 in s1.split(';'))
-    retval = odict()
+    """Parses the given query string into a dict in a single pass over its
+    fields. The values are lists of strings, or None for fields without an
+    equal sign. Fields without escaped characters are not passed to
+    ``unquote``."""
 
-    for name_value in pairs:
-        if name_value is None or len(name_value) == 0:
-            continue
-        nv = name_value.split('=', 1)
+    retval = OrderedDict()
 
-        if len(nv) != 2:
-            # Handle case of a control-name with no equal sign
-            nv.append(None)
+    if not qs:
+        return retval
 
-        name = unquote(nv[0].replace('+', ' '))
+    for name_value in qs.replace(';', '&').split('&'):
+        if len(name_value) == 0:
+            continue
+
+        name, eq, value = name_value.partition('=')
 
-        value = None
-        if nv[1] is not None:
-            value = unquote(nv[1].replace('+', ' '))
+        name = _unquote_plus(name)
+        if eq:
+            value = _unquote_plus(value)
+        else:
+            # Handle case of a control-name with no equal sign
+            value = None
 
         l = retval.get(name, None)
         if l is None:
-            l = retval[name] = []
-        l.append(value)
+            retval[name] = [value]
+        else:
+            l.append(value)
 
     return retval
 
 
 def _get_http_headers(req_env):
-    retval = {}
-
-    for k, v in req_env.items():
-        if k.startswith("HTTP_"):
-            retval[k[5:].lower()]= [v]
-
-    return retval
+    return dict([(k[5:].lower(), [v]) for k, v in req_env.items()
+                                                       if k.startswith("HTTP_")])
 
 
 def _gen_http_headers(headers):
@@ -132,6 +142,43 @@ class WsgiTransportContext(HttpTransportContext):
         self.req_method = req_env.get('REQUEST_METHOD', None)
         """HTTP Request verb, as a convenience to users."""
 
+        self._headers = None
+        self._query = None
+        self._cookies = None
+
+    @property
+    def headers(self):
+        """HTTP request headers as a dict of lowercase header names (with
+        underscores instead of dashes) to lists of values. Parsed from the WSGI
+        environment on first access."""
+
+        if self._headers is None:
+            self._headers = _get_http_headers(self.req_env)
+        return self._headers
+
+    @property
+    def query(self):
+        """Query string arguments as a dict of names to lists of values. Parsed
+        on first access."""
+
+        if self._query is None:
+            self._query = _parse_qs(self.req_env.get('QUERY_STRING', None))
+        return self._query
+
+    @property
+    def cookies(self):
+        """Request cookies as a :class:`SimpleCookie` instance. Parsed on first
+        access."""
+
+        if self._cookies is None:
+            self._cookies = SimpleCookie()
+
+            cookie_string = self.req_env.get('HTTP_COOKIE', None)
+            if cookie_string is not None:
+                self._cookies.load(cookie_string)
+
+        return self._cookies
+
     def get_path(self):
         return self.req_env['PATH_INFO']
 
@@ -143,14 +190,11 @@ class WsgiTransportContext(HttpTransportContext):
         return retval
 
     def get_cookie(self, key):
-        cookie_string = self.req_env.get('HTTP_COOKIE', None)
-        if cookie_string is None:
+        cookie = self.cookies.get(key, None)
+        if cookie is None:
             return
 
-        cookie = SimpleCookie()
-        cookie.load(cookie_string)
-
-        return cookie.get(key, None).value
+        return cookie.value
 
     def get_request_method(self):
         return self.req['REQUEST_METHOD'].upper()
@@ -519,11 +563,15 @@ class WsgiApplication(HttpBase):
                                     prot.app.interface.get_tns(),
                                     wsgi_env['PATH_INFO'].split('/')[-1])
 
-        logger.debug("%sMethod name: %r%s" % (LIGHT_GREEN,
-                                          ctx.method_request_string, END_COLOR))
+        logger.debug("%sMethod name: %r%s", LIGHT_GREEN,
+                                           ctx.method_request_string, END_COLOR)
 
-        ctx.in_header_doc = _get_http_headers(wsgi_env)
-        ctx.in_body_doc = _parse_qs(wsgi_env['QUERY_STRING'])
+        # copies of the parsed headers and query, as they are added to below
+        # and by the protocol.
+        ctx.in_header_doc = dict((k, list(v))
+                                   for k, v in ctx.transport.headers.items())
+        ctx.in_body_doc = OrderedDict((k, list(v))
+                                     for k, v in ctx.transport.query.items())
 
         for k, v in params.items():
              if k in ctx.in_body_doc:
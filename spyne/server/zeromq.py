@@ -16,16 +16,39 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
-"""The ``spyne.server.zeromq`` module contains a server implementation that
-uses ZeroMQ (zmq.REP) as transport.
+"""The ``spyne.server.zeromq`` module contains server implementations that
+use ZeroMQ as transport. :class:`ZeroMQServer` and its pooled variants process
+one request at a time per worker over ``zmq.REP`` sockets, whereas
+:class:`ZeroMQRouterServer` processes many requests concurrently over a
+``zmq.ROUTER`` socket.
 """
+
+import logging
+logger = logging.getLogger(__name__)
+
+import os
+import signal
+import tempfile
 import threading
 
+from collections import deque
+from multiprocessing.pool import ThreadPool
+from time import time
+
 import zmq
 
+try:
+    from twisted.internet.defer import Deferred
+except ImportError:
+    Deferred = None
+
+from spyne import BODY_STYLE_WRAPPED
+from spyne.application import get_fault_string_from_exception
 from spyne.auxproc import process_contexts
 from spyne._base import MethodContext
+from spyne.error import Fault
 from spyne.server import ServerBase
+from spyne.util.aio import asyncio, get_pending
 
 
 class ZmqMethodContext(MethodContext):
@@ -95,7 +118,7 @@ class ZeroMQServer(ServerBase):
 
             self.get_out_string(p_ctx)
 
-            process_contexts(self, others, error)
+            process_contexts(self, others, p_ctx, error=error)
 
             self.zmq_socket.send(b''.join(p_ctx.out_string))
 
@@ -157,3 +180,444 @@ class ZeroMQThreadPoolServer(object):
         # We never get here...
         self.frontend.close()
         self.backend.close()
+
+
+class ZeroMQPreforkServer(object):
+    """Create a ZeroMQ server transport with several worker processes, to make
+    use of more than one core. It's POSIX-only as it uses ``os.fork()``.
+
+    The workers are forked from the process that calls :func:`serve_forever`
+    and get the already built interface from it via copy-on-write. Each
+    worker runs a :class:`ZeroMQServer` that connects to the ``ipc://``
+    backend of the ROUTER/DEALER queue that the parent process runs. Workers
+    that exit are restarted, at most once every ``restart_delay`` seconds per
+    worker.
+
+    More details on the pattern http://zguide.zeromq.org/page:all#Shared-Queue-DEALER-and-ROUTER-sockets"""
+
+    def __init__(self, app, app_url, pool_size, wsdl_url=None, be_url=None,
+                                                             restart_delay=1.0):
+        self.app = app
+        self.app_url = app_url
+        self.pool_size = pool_size
+        self.restart_delay = restart_delay
+
+        if be_url is None:
+            be_url = 'ipc://%s' % os.path.join(tempfile.gettempdir(),
+                               'spyne-%s-%d.ipc' % (self.app.name, os.getpid()))
+        self.be_url = be_url
+        self.wsdl_url = wsdl_url
+
+        self.workers = [None] * pool_size
+        """The pids of the worker processes. None for workers that are not
+        running."""
+
+        self._started_at = [0.0] * pool_size
+        self._running = False
+
+    def create_worker(self, i):
+        """Forks the ``i``th worker process and returns its pid."""
+
+        pid = os.fork()
+        if pid != 0:
+            logger.debug("Started worker %d with pid %d", i, pid)
+            return pid
+
+        # child process: never return from here.
+        retval = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+            ctx = zmq.Context()
+            socket = ctx.socket(zmq.REP)
+            socket.connect(self.be_url)
+
+            worker = ZeroMQServer(self.app, self.be_url,
+                                        wsdl_url=self.wsdl_url, socket=socket)
+            worker.serve_forever()
+
+        except BaseException as e:
+            logger.exception(e)
+            retval = 1
+
+        finally:
+            os._exit(retval)
+
+    def supervise(self):
+        """Reaps exited workers and starts the missing ones."""
+
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except OSError:  # no child processes
+                break
+
+            if pid == 0:
+                break
+
+            if pid in self.workers:
+                i = self.workers.index(pid)
+                logger.warning("Worker %d with pid %d exited with status %d",
+                                                                  i, pid, status)
+                self.workers[i] = None
+
+        now = time()
+        for i, pid in enumerate(self.workers):
+            if pid is None and now - self._started_at[i] >= self.restart_delay:
+                self._started_at[i] = now
+                self.workers[i] = self.create_worker(i)
+
+    def stop(self):
+        """Makes :func:`serve_forever` return. Can be called from signal
+        handlers."""
+
+        self._running = False
+
+    def serve_forever(self):
+        """Starts the workers and runs the queue device until :func:`stop` is
+        called or the process receives SIGTERM. The workers are terminated
+        before returning."""
+
+        def _on_sigterm(signum, frame):
+            self.stop()
+
+        self._running = True
+        orig_handler = signal.signal(signal.SIGTERM, _on_sigterm)
+
+        # fork before creating any zmq sockets in this process.
+        self.supervise()
+
+        ctx = zmq.Context()
+        frontend = ctx.socket(zmq.ROUTER)
+        frontend.bind(self.app_url)
+        backend = ctx.socket(zmq.DEALER)
+        backend.bind(self.be_url)
+
+        poller = zmq.Poller()
+        poller.register(frontend, zmq.POLLIN)
+        poller.register(backend, zmq.POLLIN)
+
+        try:
+            while self._running:
+                try:
+                    events = dict(poller.poll(100))
+                except zmq.ZMQError as e:
+                    if e.errno != zmq.EINTR:
+                        raise
+                    continue
+
+                if events.get(frontend) == zmq.POLLIN:
+                    backend.send_multipart(frontend.recv_multipart())
+
+                if events.get(backend) == zmq.POLLIN:
+                    frontend.send_multipart(backend.recv_multipart())
+
+                self.supervise()
+
+        finally:
+            signal.signal(signal.SIGTERM, orig_handler)
+
+            for pid in self.workers:
+                if pid is not None:
+                    os.kill(pid, signal.SIGTERM)
+
+            for pid in self.workers:
+                if pid is not None:
+                    try:
+                        os.waitpid(pid, 0)
+                    except OSError:
+                        pass
+
+            self.workers = [None] * self.pool_size
+
+            frontend.close(linger=0)
+            backend.close(linger=0)
+            ctx.term()
+
+            if self.be_url.startswith('ipc://'):
+                try:
+                    os.unlink(self.be_url[len('ipc://'):])
+                except OSError:
+                    pass
+
+
+class ZeroMQRouterServer(ServerBase):
+    """A ZeroMQ server transport that processes many requests concurrently in
+    a single process. Clients can connect using ``zmq.REQ`` or ``zmq.DEALER``
+    sockets.
+
+    The ``zmq.ROUTER`` socket is only ever touched by the thread that runs
+    :func:`serve_forever`. It reads the requests and hands them to a pool of
+    ``pool_size`` threads, except for coroutine functions, which are run on an
+    asyncio event loop in a separate thread. Methods can also return a Twisted
+    ``Deferred`` (which must be fired by someone else) or an asyncio
+    coroutine. Replies are sent as soon as they are ready, along with the
+    identity frames of the request they belong to, so a slow call doesn't hold
+    up the others and an error in one request can't break the socket for the
+    rest.
+
+    :param app: The :class:`spyne.application.Application` instance.
+    :param app_url: The ZeroMQ endpoint to bind to.
+    :param pool_size: The number of threads that process requests.
+    :param ctx: The ``zmq.Context`` to use.
+    :param socket: A ``zmq.ROUTER`` socket to use instead of binding a new one
+        to ``app_url``.
+    """
+
+    transport = ZeroMQServer.transport
+
+    def __init__(self, app, app_url, pool_size=10, ctx=None, socket=None):
+        if ctx and socket and ctx is not socket.context:
+            raise ValueError("ctx should be the same as socket.context")
+        super(ZeroMQRouterServer, self).__init__(app)
+
+        self.app_url = app_url
+        self.pool_size = pool_size
+
+        if ctx:
+            self.ctx = ctx
+        elif socket:
+            self.ctx = socket.context
+        else:
+            self.ctx = zmq.Context()
+
+        if socket:
+            self.zmq_socket = socket
+        else:
+            self.zmq_socket = self.ctx.socket(zmq.ROUTER)
+            self.zmq_socket.bind(app_url)
+
+        self.pool = ThreadPool(pool_size)
+        self.loop = None
+        """The asyncio event loop that runs the coroutine functions. It's
+        created on first use."""
+
+        self.in_flight = 0
+        """The number of requests that were read from the socket but whose
+        replies are not sent yet."""
+
+        self._outbox = deque()
+        self._lock = threading.Lock()
+        self._running = False
+
+        # the worker threads wake up the poll loop through this pair.
+        wakeup_url = 'inproc://spyne-router-%x' % id(self)
+        self._wakeup_in = self.ctx.socket(zmq.PAIR)
+        self._wakeup_in.bind(wakeup_url)
+        self._wakeup_out = self.ctx.socket(zmq.PAIR)
+        self._wakeup_out.connect(wakeup_url)
+
+    # FIXME: Add suport for binary-only transports
+    def generate_contexts(self, ctx, in_string_charset='utf8'):
+        return super(ZeroMQRouterServer, self).generate_contexts(ctx,
+                                            in_string_charset=in_string_charset)
+
+    def get_loop(self):
+        """Returns the event loop for coroutine functions, starting it in a
+        daemon thread if it's not running yet."""
+
+        if self.loop is None:
+            if asyncio is None:
+                raise RuntimeError("asyncio is not available")
+
+            loop = self.loop = asyncio.new_event_loop()
+
+            def _run():
+                asyncio.set_event_loop(loop)
+                loop.run_forever()
+
+            job = threading.Thread(target=_run, name='spyne-zmq-aio')
+            job.daemon = True
+            job.start()
+
+        return self.loop
+
+    def handle_request(self, frames):
+        """Dispatches one multipart message read from the ROUTER socket. All
+        frames but the last one are the envelope that the reply is sent
+        with."""
+
+        envelope, in_string = frames[:-1], frames[-1]
+        self.in_flight += 1
+
+        initial_ctx = ZmqMethodContext(self)
+        initial_ctx.in_string = [in_string]
+
+        contexts = self.generate_contexts(initial_ctx)
+        p_ctx, others = contexts[0], contexts[1:]
+        if p_ctx.in_error:
+            self.send_reply(envelope, p_ctx, others, p_ctx.in_error)
+
+        elif asyncio is not None and \
+                               asyncio.iscoroutinefunction(p_ctx.function):
+            self.get_loop().call_soon_threadsafe(self.process_aio,
+                                                      envelope, p_ctx, others)
+
+        else:
+            self.pool.apply_async(self.process, (envelope, p_ctx, others))
+
+    def process(self, envelope, p_ctx, others):
+        """Processes the request in a worker thread."""
+
+        try:
+            self.get_in_object(p_ctx)
+            if p_ctx.in_error:
+                return self.send_reply(envelope, p_ctx, others, p_ctx.in_error)
+
+            self.get_out_object(p_ctx)
+            if p_ctx.out_error:
+                return self.send_reply(envelope, p_ctx, others, p_ctx.out_error)
+
+            ret = p_ctx.out_object[0]
+            if Deferred is not None and isinstance(ret, Deferred):
+                ret.addCallbacks(self._cb_deferred, self._eb_deferred,
+                                 callbackArgs=(envelope, p_ctx, others),
+                                 errbackArgs=(envelope, p_ctx, others))
+            else:
+                self.send_reply(envelope, p_ctx, others)
+
+        except Exception as e:
+            self._handle_exception(envelope, p_ctx, others, e)
+
+    def process_aio(self, envelope, p_ctx, others):
+        """Processes the request on the event loop thread."""
+
+        try:
+            self.get_in_object(p_ctx)
+            if p_ctx.in_error:
+                return self.send_reply(envelope, p_ctx, others, p_ctx.in_error)
+
+            self.get_out_object(p_ctx)
+
+            pending = get_pending(p_ctx)
+            if pending is None:
+                self.send_reply(envelope, p_ctx, others, p_ctx.out_error)
+            else:
+                pending.add_done_callback(lambda _: self.send_reply(
+                                       envelope, p_ctx, others, p_ctx.out_error))
+
+        except Exception as e:
+            self._handle_exception(envelope, p_ctx, others, e)
+
+    def _cb_deferred(self, ret, envelope, p_ctx, others):
+        if p_ctx.descriptor.body_style is not BODY_STYLE_WRAPPED or \
+                       len(p_ctx.descriptor.out_message._type_info) <= 1:
+            p_ctx.out_object = [ret]
+        else:
+            p_ctx.out_object = ret
+
+        self.send_reply(envelope, p_ctx, others)
+
+    def _eb_deferred(self, f, envelope, p_ctx, others):
+        try:
+            f.raiseException()
+        except Exception as e:
+            self.app.process_exception(p_ctx, e)
+
+        self.send_reply(envelope, p_ctx, others, p_ctx.out_error)
+
+    def _handle_exception(self, envelope, p_ctx, others, e):
+        logger.exception(e)
+        p_ctx.out_error = Fault('Server', get_fault_string_from_exception(e))
+        self.send_reply(envelope, p_ctx, others, p_ctx.out_error)
+
+    def send_reply(self, envelope, p_ctx, others, error=None):
+        """Serializes the response and queues it to be sent by the thread
+        that runs :func:`serve_forever`. Can be called from any thread."""
+
+        if error is not None:
+            p_ctx.out_error = error
+            p_ctx.out_object = error
+
+        try:
+            self.get_out_string(p_ctx)
+            out_string = b''.join(p_ctx.out_string)
+
+        except Exception as e:
+            logger.exception(e)
+            p_ctx.out_error = error = \
+                           Fault('Server', get_fault_string_from_exception(e))
+            p_ctx.out_object = error
+            p_ctx.out_document = p_ctx.out_string = None
+
+            self.get_out_string(p_ctx)
+            out_string = b''.join(p_ctx.out_string)
+
+        try:
+            process_contexts(self, others, p_ctx, error=error)
+        finally:
+            p_ctx.close()
+
+            with self._lock:
+                self._outbox.append(envelope + [out_string])
+                self._wakeup()
+
+    def _wakeup(self):
+        try:
+            self._wakeup_out.send(b'', zmq.NOBLOCK)
+
+        # either the poll loop will wake up anyway or it's already gone
+        except zmq.ZMQError:
+            pass
+
+    def _flush(self):
+        while True:
+            try:
+                self._wakeup_in.recv(zmq.NOBLOCK)
+            except zmq.Again:
+                break
+
+        while self._outbox:
+            self.in_flight -= 1
+            self.zmq_socket.send_multipart(self._outbox.popleft())
+
+    def stop(self):
+        """Makes :func:`serve_forever` return. Can be called from any
+        thread."""
+
+        self._running = False
+        with self._lock:
+            self._wakeup()
+
+    def serve_forever(self):
+        """Runs the ZeroMQ server until :func:`stop` is called. The pending
+        replies are discarded, the sockets are closed and the event loop is
+        stopped before returning."""
+
+        poller = zmq.Poller()
+        poller.register(self.zmq_socket, zmq.POLLIN)
+        poller.register(self._wakeup_in, zmq.POLLIN)
+
+        self._running = True
+        try:
+            while self._running:
+                try:
+                    events = dict(poller.poll())
+                except zmq.ZMQError as e:
+                    if e.errno != zmq.EINTR:
+                        raise
+                    continue
+
+                if self.zmq_socket in events:
+                    while True:
+                        try:
+                            frames = self.zmq_socket.recv_multipart(zmq.NOBLOCK)
+                        except zmq.Again:
+                            break
+
+                        self.handle_request(frames)
+
+                self._flush()
+
+        finally:
+            self.pool.terminate()
+
+            if self.loop is not None:
+                self.loop.call_soon_threadsafe(self.loop.stop)
+                self.loop = None
+
+            self.zmq_socket.close(linger=0)
+            self._wakeup_in.close(linger=0)
+            with self._lock:
+                self._wakeup_out.close(linger=0)
@@ -162,6 +162,10 @@ class ServiceBase(object):
     defined under this service is set to this value. The _aux flag in the @srpc
     decorator overrides this."""
 
+    __executor__ = None
+    """The name of the thread pool that runs the methods under this service
+    definition. The _executor flag in the @srpc decorator overrides this."""
+
     @classmethod
     def get_service_class_name(cls):
         return cls.__name__
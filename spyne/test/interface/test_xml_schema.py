@@ -505,6 +505,37 @@ class TestParseForeignXmlSchema(unittest.TestCase):
         assert ti['attr'].type is Unicode
 
 
+    def test_identical_simple_types(self):
+        tns = 'some_ns'
+
+        schema = """<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+            targetNamespace="some_ns"
+            elementFormDefault="qualified" attributeFormDefault="unqualified">
+    <xsd:simpleType name="Code">
+        <xsd:restriction base="xsd:string">
+            <xsd:maxLength value="50"/>
+        </xsd:restriction>
+    </xsd:simpleType>
+    <xsd:simpleType name="Name">
+        <xsd:restriction base="xsd:string">
+            <xsd:maxLength value="50"/>
+        </xsd:restriction>
+    </xsd:simpleType>
+</xsd:schema>"""
+
+        types = parse_schema_string(schema)[tns].types
+        Code, Name = types['Code'], types['Name']
+
+        assert Code is not Name
+        assert Code.get_type_name() == 'Code'
+        assert Name.get_type_name() == 'Name'
+        assert Code.get_namespace() == Name.get_namespace() == tns
+        assert Code.Attributes.max_len == Name.Attributes.max_len == 50
+
+        # the shared customization stays anonymous
+        assert Unicode(50).get_type_name() is Unicode.Empty
+
+
 class TestCodeGeneration(unittest.TestCase):
     def _get_schema(self, *args):
         schema_doc = get_schema_documents(args)['tns']
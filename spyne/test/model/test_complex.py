@@ -31,7 +31,7 @@ from base64 import b64encode
 from decimal import Decimal as D
 
 from spyne import Application, rpc, mrpc, ServiceBase, ByteArray, Array, \
-    ComplexModel, SelfReference, XmlData, XmlAttribute, Unicode, DateTime, \
+    ComplexModel, CompactComplexModel, SelfReference, XmlData, XmlAttribute, Unicode, DateTime, \
     Float, Integer, String
 from spyne.const import xml_ns
 from spyne.error import ResourceNotFoundError
@@ -127,6 +127,22 @@ class TestComplexModel(unittest.TestCase):
         c.i = 5
         assert c.i == 5
 
+    def test_validate_on_assignment_multiple(self):
+        class C(ComplexModel):
+            i = Integer(voa=True)
+            s = Unicode(voa=True)
+
+        c = C(i=5, s=u'a')
+        assert c.i == 5
+        assert c.s == u'a'
+
+        try:
+            c.i = u'a'
+        except ValueError:
+            pass
+        else:
+            raise Exception('must fail with ValueError')
+
     def test_simple_class(self):
         a = Address()
         a.street = '123 happy way'
@@ -609,6 +625,55 @@ class TestSelfRefence(unittest.TestCase):
         assert v.children == ['a', 'b']
         assert v.sub_category == 'aaa'
 
+    def test_ctor_defaults(self):
+        class C(ComplexModel):
+            i = Integer(default=5)
+            l = Array(Integer, default_factory=list)
+            s = Unicode
+
+            @property
+            def p(self):
+                return 42
+
+        C.append_field('p', Integer)
+
+        c1, c2 = C(), C(s=u'a', i=3)
+        assert (c1.i, c1.s, c1.p) == (5, None, 42)
+        assert (c2.i, c2.s, c2.p) == (3, u'a', 42)
+        assert c1.l == c2.l == []
+        assert c1.l is not c2.l
+
+        C.append_field('j', Integer(default=7))
+        assert C().j == 7
+
+    def test_ctor_preset_attrs(self):
+        class C(ComplexModel):
+            i = Integer(default=5)
+            s = Unicode
+
+            def __init__(self, *args, **kwargs):
+                self.s = u'a'
+                super(C, self).__init__(*args, **kwargs)
+
+        c = C()
+        assert c.i == 5
+        assert c.s == u'a'
+
+    def test_ctor_setattr_changed(self):
+        class C(ComplexModel):
+            i = Integer(default=5)
+
+        assert C().i == 5
+
+        assigned = []
+        def __setattr__(self, k, v):
+            assigned.append(k)
+            object.__setattr__(self, k, v)
+        C.__setattr__ = __setattr__
+
+        assert C().i == 5
+        assert assigned == ['i']
+
 
 class TestMemberRpc(unittest.TestCase):
     def test_simple(self):
@@ -1022,5 +1087,106 @@ class TestCustomize(unittest.TestCase):
                     "have conflicting names.")
 
 
+class TestCompactComplexModel(unittest.TestCase):
+    def test_slots(self):
+        class C(CompactComplexModel):
+            i = Integer
+            s = Unicode(default=u'x')
+
+        class D(C):
+            j = Integer
+
+        assert C.__slots__ == ('i', 's')
+        assert D.__slots__ == ('j',)
+
+        d = D(i=1, j=2)
+        assert not hasattr(d, '__dict__')
+        assert (d.i, d.s, d.j) == (1, u'x', 2)
+        assert repr(d) == "D(i=1, s='x', j=2)" or \
+               repr(d) == "D(i=1, s=u'x', j=2)"
+
+        try:
+            d.k = 5
+        except AttributeError:
+            pass
+        else:
+            raise Exception("must fail with AttributeError")
+
+    def test_customize(self):
+        class C(CompactComplexModel):
+            i = Integer
+
+        C2 = C.customize(nillable=False)
+        assert C2.__slots__ == ()
+        assert C2._type_info['i'] is Integer
+
+    def test_non_identifier_field(self):
+        class C(CompactComplexModel):
+            _type_info = [
+                ('Set-Cookie', Unicode),
+                ('i', Integer),
+            ]
+
+        c = C(i=5)
+        setattr(c, 'Set-Cookie', u'a')
+        assert c.i == 5
+        assert c.__dict__ == {'Set-Cookie': u'a'}
+
+    def test_validate_on_assignment(self):
+        class C(CompactComplexModel):
+            i = Integer(voa=True)
+
+        c = C()
+        assert c.i is None
+        c.i = 5
+        assert c.i == 5
+
+        try:
+            c.i = 'a'
+        except ValueError:
+            pass
+        else:
+            raise Exception('must fail with ValueError')
+
+    def test_xml_roundtrip(self):
+        from spyne.util.xml import get_object_as_xml, get_xml_as_object
+
+        class C(CompactComplexModel):
+            __namespace__ = 'tns'
+            i = Integer
+            s = Array(Unicode)
+
+        elt = get_object_as_xml(C(i=5, s=[u'a', u'b']), C)
+        c = get_xml_as_object(elt, C)
+
+        assert not hasattr(c, '__dict__')
+        assert c.i == 5
+        assert c.s == [u'a', u'b']
+
+    def test_add_field(self):
+        class A(CompactComplexModel):
+            a = Integer
+            b = Integer
+
+        with self.assertRaises(TypeError):
+            A.append_field('c', Integer)
+
+        with self.assertRaises(TypeError):
+            A.insert_field(0, 'c', Integer)
+
+        assert list(A._type_info) == ['a', 'b']
+        assert A(a=1, b=2).b == 2
+
+        class B(A):
+            d = Integer
+
+        with self.assertRaises(TypeError):
+            B.append_field('e', Integer)
+
+        b = B(a=1, d=2)
+        assert (b.a, b.b, b.d) == (1, None, 2)
+        assert not hasattr(b, '__dict__')
+
+
 if __name__ == '__main__':
     unittest.main()
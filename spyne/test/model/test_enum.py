@@ -159,5 +159,39 @@ class TestEnum(unittest.TestCase):
         ret = XmlDocument().from_element(None, Test, elt)
         self.assertEquals(t.days, ret.days)
 
+    def test_lookup_maps(self):
+        assert DaysOfWeekEnum.get_member('Monday') is DaysOfWeekEnum.Monday
+        assert DaysOfWeekEnum.get_member('Mon') is None
+        assert DaysOfWeekEnum.get_member(['Monday']) is None
+        assert DaysOfWeekEnum.to_unicode(DaysOfWeekEnum.Sunday) == 'Sunday'
+
+        # customized classes share the maps
+        Mandatory = DaysOfWeekEnum(min_occurs=1)
+        assert Mandatory.get_member('Sunday') is DaysOfWeekEnum.Sunday
+
+    def test_soft_validation(self):
+        from spyne.error import ValidationError
+        from spyne.protocol.json import JsonDocument
+
+        elt = etree.Element('test')
+        XmlDocument().to_parent(None, DaysOfWeekEnum, DaysOfWeekEnum.Friday,
+                                                      elt, 'test_namespace')
+
+        prot = XmlDocument(validator='soft')
+        assert prot.from_element(None, DaysOfWeekEnum, elt[0]) is \
+                                                           DaysOfWeekEnum.Friday
+
+        elt[0].text = 'Caturday'
+        self.assertRaises(ValidationError,
+                                prot.from_element, None, DaysOfWeekEnum, elt[0])
+
+        prot = JsonDocument(validator='soft')
+        assert prot.from_unicode(DaysOfWeekEnum, 'Friday') is \
+                                                           DaysOfWeekEnum.Friday
+        assert prot.to_unicode(DaysOfWeekEnum, DaysOfWeekEnum.Friday) == \
+                                                                       'Friday'
+        self.assertRaises(ValidationError,
+                               prot.from_unicode, DaysOfWeekEnum, 'Caturday')
+
 if __name__ == '__main__':
     unittest.main()
@@ -36,8 +36,11 @@ from spyne.const import xml_ns as ns
 
 from spyne import Null, AnyDict, Uuid, Array, ComplexModel, Date, Time, \
     Boolean, DateTime, Duration, Float, Integer, UnsignedInteger, Unicode, \
-    String, Decimal
+    String, Decimal, M, ByteArray, Point, ServiceBase, srpc
 from spyne.model import ModelBase
+from spyne.model import get_customization_stats
+from spyne.model import get_validators
+from spyne.error import ValidationError
 
 from spyne.protocol import ProtocolBase
 from spyne.protocol.xml import XmlDocument
@@ -88,6 +91,82 @@ class TestPrimitive(unittest.TestCase):
             pass
         assert Attributes.nullable == False
 
+    def test_customization_cache(self):
+        hits = get_customization_stats()['hits']
+
+        assert Integer(min_occurs=1, nillable=False) is \
+                                           Integer(nillable=False, min_occurs=1)
+        assert Integer(default=1) is not Integer(default=True)
+        assert Integer(default=[]) is not Integer(default=())
+        assert Unicode(5, type_name='Five') is Unicode(5, type_name='Five')
+        assert Unicode(values=['a']) is Unicode(values=['a'])
+        assert Unicode(50) is Unicode(50)
+        assert Integer(ge=0) is Integer(ge=0)
+        assert M(Unicode(50)) is M(Unicode(50))
+
+        assert get_customization_stats()['hits'] >= hits + 7
+
+        uncacheable = get_customization_stats()['uncacheable']
+        assert DateTime(default=datetime.datetime(2000, 1, 1)) is not \
+                                DateTime(default=datetime.datetime(2000, 1, 1))
+        assert get_customization_stats()['uncacheable'] == uncacheable + 2
+
+    def test_customization_cache_anonymous(self):
+        class A(ComplexModel):
+            __namespace__ = 'tns'
+            s = Unicode(50)
+            i = Integer(ge=0)
+            m = M(Unicode(50))
+
+        class B(ComplexModel):
+            __namespace__ = 'tns'
+            s = Unicode(50)
+            a = Array(Unicode(50))
+
+        A.resolve_namespace(A, 'tns')
+        B.resolve_namespace(B, 'tns')
+
+        # the shared types stay anonymous, their named copies are private
+        assert Unicode(50).get_type_name() is Unicode.Empty
+        assert Integer(ge=0).get_type_name() is Integer.Empty
+        assert A._type_info['s'].get_type_name() == 'A_sType'
+        assert B._type_info['s'].get_type_name() == 'B_sType'
+        assert A._type_info['i'].get_type_name() == 'A_iType'
+        assert A._type_info['m'].get_type_name() == 'A_mType'
+        assert A._type_info['m'].__extends__.get_type_name() is not \
+                                                                 Unicode.Empty
+        b_a, = B._type_info['a']._type_info.values()
+        assert b_a.get_type_name() == 'B_aType'
+        assert b_a.Attributes.max_len == 50
+        assert b_a.get_namespace() == 'tns'
+
+        # customizations of a class share the named copies
+        A2 = A.customize(nillable=False)
+        A2.resolve_namespace(A2, 'tns')
+        assert A2._type_info['s'] is A._type_info['s']
+
+    def test_customization_cache_changed_results(self):
+        # the classes these return are changed after customization, so they
+        # must not be the ones identical customizations share.
+        C = Point.customize(nillable=False)
+        P = Point(nillable=False)
+        assert P is not C
+        assert P.__extends__ is Unicode
+        assert P.get_namespace() == 'http://spyne.io/schema'
+        assert C.get_namespace() != 'http://spyne.io/schema'
+
+        C = ByteArray.customize(encoding='hex')
+        B = ByteArray(encoding='hex')
+        assert B.get_type_name() == 'hexBinary'
+        assert C.get_type_name() == 'base64Binary'
+
+        class SomeService(ServiceBase):
+            @srpc(_returns=Unicode(50), _body_style='bare')
+            def some_call():
+                pass
+
+        assert Unicode(50).get_type_name() is Unicode.Empty
+
     def test_nillable_inheritance_quirks(self):
         class Attributes(ModelBase.Attributes):
             nullable = False
@@ -370,6 +449,40 @@ class TestPrimitive(unittest.TestCase):
         assert attr._pattern_re.match(u"Ğ Ğ ç .-")
         assert attr._pattern_re.match(u"\t") is None
 
+    def test_unicode_pattern_shared(self):
+        a = Unicode(pattern='[A-Z]{3}[0-9]{4}').Attributes
+        b = Unicode(pattern='[A-Z]{3}[0-9]{4}', max_len=7).Attributes
+        assert a._pattern_re is b._pattern_re
+        assert a._pattern_match is b._pattern_match
+        assert a._pattern_length == 7
+
+        U = Unicode(pattern='[A-Z]{3}[0-9]{4}')
+        assert U.validate_native(U, 'ABC1234')
+        assert not U.validate_native(U, 'ABC12345')
+        assert not U.validate_native(U, 'ABC123')
+
+    def test_unicode_pattern_whole_value(self):
+        # xml schema patterns are implicitly anchored at both ends, so the
+        # second alternative has to be considered as well.
+        U = Unicode(pattern='a|ab')
+        assert U.validate_native(U, 'ab')
+        assert not U.validate_native(U, 'abc')
+
+        _, validate_native = get_validators(U)
+        assert validate_native('ab')
+        assert not validate_native('abc')
+
+    def test_fixed_length_patterns(self):
+        from spyne.model._base import _get_fixed_length
+        from spyne.model.primitive.string import UUID_PATTERN
+        from spyne.model.primitive.string import LTREE_PATTERN
+
+        assert _get_fixed_length(UUID_PATTERN) == 36
+        assert _get_fixed_length(r'\d{3}\.[^\]x]') == 5
+        assert _get_fixed_length(LTREE_PATTERN) is None
+        assert _get_fixed_length('a{1,2}') is None
+        assert _get_fixed_length('ab|c') is None
+
     def test_unicode_nullable_mult_cust_false(self):
         assert Unicode(nullable=False).Attributes.nullable == False
         assert Unicode(nullable=False)(5).Attributes.nullable == False
@@ -638,6 +751,47 @@ class TestPrimitive(unittest.TestCase):
         dt = ProtocolBase().from_unicode(DateTime, "2015-01-01 12:12:12.9999998")
         self.assertEquals(datetime.datetime(2015, 1, 1, 12, 12, 12, 999999), dt)
 
+    def test_datetime_iso_fast(self):
+        from spyne.protocol import _inbase
+
+        prot = ProtocolBase()
+        values = (
+            "2015-01-01T12:12:12", "2015-01-01 12:12:12.123",
+            "2015-01-01T12:12:12Z", "2015-01-01T12:12:12.000001Z",
+            "2015-01-01T12:12:12+02:30", "2015-01-01T12:12:12.5-05:00",
+            "2015-01-01T12:12:12+00:00",
+        )
+
+        for v in values:
+            fast = prot.from_unicode(DateTime, v)
+
+            parse = _inbase._parse_datetime_iso_fast
+            _inbase._parse_datetime_iso_fast = lambda s: None
+            try:
+                slow = prot.from_unicode(DateTime, v)
+            finally:
+                _inbase._parse_datetime_iso_fast = parse
+
+            assert fast == slow, v
+            assert fast.utcoffset() == slow.utcoffset(), v
+
+        # exotic forms go through the regexes
+        assert prot.from_unicode(DateTime, "2015-01-01T12:12:12.Z") == \
+                                         datetime.datetime(2015, 1, 1, 12, 12, 12)
+        self.assertRaises(ValidationError, prot.from_unicode, DateTime,
+                                                            "2015-01-01T12:12")
+        self.assertRaises(ValueError, prot.from_unicode, DateTime,
+                                                        "2015-13-01T12:12:12Z")
+
+        # offsets are cached
+        a = prot.from_unicode(DateTime, "2015-01-01T12:12:12+02:30")
+        b = prot.from_unicode(DateTime, "2016-01-01T12:12:12+02:30")
+        assert a.tzinfo is b.tzinfo
+
+        assert prot.from_unicode(Date, "2015-01-02") == datetime.date(2015, 1, 2)
+        assert prot.from_unicode(Time, "12:12:12.5") == \
+                                                  datetime.time(12, 12, 12, 500000)
+
 ### Duration Data Type
 ## http://www.w3schools.com/schema/schema_dtypes_date.asp
 # Duration Data type
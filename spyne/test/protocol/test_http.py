@@ -49,6 +49,7 @@ from spyne.protocol.http import HttpPattern
 from spyne.service import ServiceBase
 from spyne.server.wsgi import WsgiApplication
 from spyne.server.wsgi import WsgiMethodContext
+from spyne.server.http import HttpRouter
 from spyne.util.test import call_wsgi_app_kwargs
 
 
@@ -106,6 +107,85 @@ class TestSimpleDictDocument(unittest.TestCase):
         assert dict(_parse_qs('p=1&q=2&p=')) == {'p': ['1', ''], 'q': ['2']}
     def test_own_parse_qs_11(self):
         assert dict(_parse_qs('p=1&q=2&p=3')) == {'p': ['1', '3'], 'q': ['2']}
+    def test_own_parse_qs_12(self):
+        assert dict(_parse_qs('p+q=a%20b+c;r')) == {'p q': ['a b c'], 'r': [None]}
+
+
+class TestWsgiTransportContext(unittest.TestCase):
+    def _get_transport(self, **kwargs):
+        app = Application([], 'tns', in_protocol=HttpRpc(),
+                                                        out_protocol=HttpRpc())
+        server = WsgiApplication(app)
+
+        environ = {
+            'QUERY_STRING': 'a=1&b=2&a=3',
+            'PATH_INFO': '/some_call',
+            'REQUEST_METHOD': 'GET',
+            'SERVER_NAME': 'localhost',
+            'HTTP_USER_AGENT': 'test',
+            'HTTP_COOKIE': 'c1=v1; c2=v2',
+        }
+        environ.update(kwargs)
+        environ = dict([(k, v) for k, v in environ.items() if v is not None])
+
+        return WsgiMethodContext(server, environ, 'some-content-type').transport
+
+    def test_lazy_views(self):
+        transport = self._get_transport()
+
+        assert transport._headers is None
+        assert transport._query is None
+        assert transport._cookies is None
+
+        assert transport.headers == {'user_agent': ['test'],
+                                               'cookie': ['c1=v1; c2=v2']}
+        assert transport.headers is transport.headers
+
+        assert dict(transport.query) == {'a': ['1', '3'], 'b': ['2']}
+        assert transport.query is transport.query
+
+        assert transport.get_cookie('c1') == 'v1'
+        assert transport.get_cookie('c2') == 'v2'
+        assert transport.cookies is transport.cookies
+
+    def test_missing_cookie(self):
+        transport = self._get_transport()
+        assert transport.get_cookie('c3') is None
+
+        transport = self._get_transport(HTTP_COOKIE=None)
+        assert transport.get_cookie('c1') is None
+
+    def test_decompose_uses_lazy_views(self):
+        class SomeService(ServiceBase):
+            @srpc(Integer, Integer, _patterns=[HttpPattern('/some_call/<a>')])
+            def some_call(a, b):
+                pass
+
+        app = Application([SomeService], 'tns',
+                   in_protocol=HttpRpc(parse_cookie=True), out_protocol=HttpRpc())
+        server = WsgiApplication(app)
+
+        initial_ctx = WsgiMethodContext(server, {
+            'QUERY_STRING': 'b=2',
+            'PATH_INFO': '/some_call/1',
+            'REQUEST_METHOD': 'GET',
+            'SERVER_NAME': 'localhost',
+            'HTTP_COOKIE': 'c1=v1',
+        }, 'some-content-type')
+
+        query = initial_ctx.transport.query
+        headers = initial_ctx.transport.headers
+
+        ctx, = server.generate_contexts(initial_ctx)
+        assert ctx.transport.query is query
+        assert ctx.transport.headers is headers
+
+        # the documents are copies that the protocol adds to
+        assert dict(ctx.in_body_doc) == {'a': ['1'], 'b': ['2']}
+        assert dict(query) == {'b': ['2']}
+        assert ctx.in_header_doc['c1'] == ['v1']
+        assert not ('c1' in headers)
+
 
 def _test(services, qs, validator='soft', strict_arrays=False):
     app = Application(services, 'tns',
@@ -605,6 +685,51 @@ class Test(unittest.TestCase):
         s = b''.join(list(ctx.out_string))
         assert s == b"[CCM(i=1, c=['a', 'b'], s='s')]"
 
+    def test_nested_2_flatten_with_complex_array_out_of_order(self):
+        class CM(ComplexModel):
+            _type_info = [
+                ("i", Integer),
+                ("s", String),
+            ]
+
+        class CCM(ComplexModel):
+            _type_info = [
+                ("i", Integer),
+                ("c", Array(CM)),
+            ]
+
+        class SomeService(ServiceBase):
+            @srpc(Array(CCM), _returns=String)
+            def some_call(ccm):
+                return repr(ccm)
+
+        ctx = _test([SomeService],  'ccm[1].c[1].s=d&ccm[0].c[0].i=1'
+                                   '&ccm[1].i=2&ccm[0].c[1].s=b&ccm[0].i=1'
+                                   '&ccm[1].c[0].s=c&ccm[0].c[0].s=a'
+                                   '&ccm[0].x=discarded')
+        s = b''.join(list(ctx.out_string))
+        assert s == b"[CCM(i=1, c=[CM(i=1, s='a'), CM(s='b')]), " \
+                    b"CCM(i=2, c=[CM(s='c'), CM(s='d')])]"
+
+    def test_flatten_after_append_field(self):
+        class CM(ComplexModel):
+            _type_info = [
+                ("i", Integer),
+            ]
+
+        class SomeService(ServiceBase):
+            @srpc(CM, _returns=String)
+            def some_call(cm):
+                return repr(cm)
+
+        ctx = _test([SomeService], 'cm.i=1&cm.s=s')
+        assert b''.join(ctx.out_string) == b"CM(i=1)"
+
+        CM.append_field('s', String)
+
+        ctx = _test([SomeService], 'cm.i=1&cm.s=s')
+        assert b''.join(ctx.out_string) == b"CM(i=1, s='s')"
+
     def test_default(self):
         class CM(ComplexModel):
             _type_info = [
@@ -809,6 +934,36 @@ class TestHttpPatterns(unittest.TestCase):
         server.get_out_object(ctx)
         assert ctx.out_error is None
 
+    def test_router_same_as_linear(self):
+        patterns = [
+            HttpPattern('/a/b/c'),
+            HttpPattern('/a/b/c', verb='POST'),
+            HttpPattern('/a/b/<x>', verb='GET|PUT'),
+            HttpPattern('/a/<x>/c'),
+            HttpPattern('/a/b/c/', host='<sub>.example.com'),
+            HttpPattern('/a/?b'),
+            HttpPattern('/a/b\\.json'),
+            HttpPattern('/a/b.xml'),
+            HttpPattern('/b|/c/d'),
+            HttpPattern('/c/d', verb='<verb>'),
+            HttpPattern('/d/{path}'),
+            HttpPattern('/d/e/f/g'),
+            HttpPattern('/<x>'),
+        ]
+        patterns = list(reversed(sorted(patterns,
+                                           key=lambda x: (x.address, x.host))))
+        router = HttpRouter(patterns)
+
+        for method in ('GET', 'POST', 'PUT', 'DELETE'):
+            for host in ('localhost', 'www.example.com'):
+                for path in ('/a/b/c', '/a/b/c/', '/a/b/d', '/a/x/c', 'a/b/c',
+                             '/a/b', '/ab', '/a/b.json', '/a/bxxml', '/b',
+                             '/c/d', '/d/e', '/d/e/f/g', '/d/e/f', '/e', '/',
+                             '', '/a/b/c/d/e/f'):
+                    expected = router.match_linear(method, path, host)
+                    assert router.match(method, path, host) == expected, \
+                                                         (method, path, host)
+
 
 if __name__ == '__main__':
     unittest.main()
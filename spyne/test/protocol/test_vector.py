@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import array
+import unittest
+
+from spyne.error import ValidationError
+from spyne.model.complex import Array
+from spyne.model.complex import ComplexModel
+from spyne.model.primitive import Double
+from spyne.model.primitive import Integer
+from spyne.model.primitive import Integer8
+from spyne.model.primitive import UnsignedInteger
+from spyne.model.primitive import Unicode
+from spyne.protocol.json import JsonDocument
+from spyne.protocol.msgpack import MessagePackDocument
+from spyne.protocol.xml import XmlDocument
+from spyne.protocol._vector import numpy
+from spyne.util.dictdoc import get_object_as_dict
+from spyne.util.xml import get_object_as_xml
+
+
+class C(ComplexModel):
+    i = Array(Integer(ge=0), vectorize='ndarray')
+    d = Array(Double, vectorize='list')
+    u = Array(UnsignedInteger, vectorize='ndarray')
+    b = Array(Integer8(values=[1, 2, 3]), vectorize='ndarray')
+    s = Array(Unicode, vectorize='list')
+
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class TestVectorize(unittest.TestCase):
+    def _from_dict(self, d):
+        prot = JsonDocument(validator='soft')
+        return prot._doc_to_object(C, d, prot.validator)
+
+    def _from_xml(self, c):
+        elt = get_object_as_xml(c, C)
+        return XmlDocument(validator='soft').from_element(None, C, elt)
+
+    def test_dict(self):
+        c = self._from_dict({'i': [1, 2, 3], 'd': [1, 2.5], 'u': [4],
+                                           'b': [1, 3], 's': ['a']})
+
+        assert isinstance(c.i, numpy.ndarray)
+        assert c.i.dtype == numpy.int64
+        assert c.i.tolist() == [1, 2, 3]
+        assert c.d == [1.0, 2.5]
+        assert isinstance(c.d, list)
+        assert c.u.tolist() == [4]
+        assert c.b.tolist() == [1, 3]
+        assert c.s == ['a']
+
+    def test_xml(self):
+        c = self._from_xml(C(i=[1, 2, 3], d=[1.0, 2.5], u=[4], b=[2], s=['a']))
+
+        assert isinstance(c.i, numpy.ndarray)
+        assert c.i.tolist() == [1, 2, 3]
+        assert c.d == [1.0, 2.5]
+        assert c.u.tolist() == [4]
+        assert c.b.tolist() == [2]
+        assert c.s == ['a']
+
+    def test_fallback(self):
+        # null values are handled by the scalar code path
+        c = self._from_dict({'i': [1, None]})
+        assert c.i == [1, None]
+
+        c = self._from_xml(C(i=[1, None]))
+        assert c.i == [1, None]
+
+    def test_validation(self):
+        for d in ({'i': [1, -1]}, {'u': [-1]}, {'b': [4]}, {'i': [1.5]},
+                                                        {'d': [1.0, 'x']}):
+            self.assertRaises(ValidationError, self._from_dict, d)
+
+        for c in (C(i=[1, -1]), C(u=[-1]), C(b=[4])):
+            self.assertRaises(ValidationError, self._from_xml, c)
+
+        elt = get_object_as_xml(C(d=[1.0]), C)
+        elt.find('{*}d')[0].text = 'x'
+        self.assertRaises(ValidationError,
+                     XmlDocument(validator='soft').from_element, None, C, elt)
+
+
+class D(ComplexModel):
+    i = Array(Integer8(ge=0), vectorize='array')
+    d = Array(Double, vectorize='array')
+    u = Array(UnsignedInteger, vectorize='array')
+
+
+class TestArrayVectorize(unittest.TestCase):
+    def _from_dict(self, d):
+        prot = MessagePackDocument(validator='soft')
+        return prot._doc_to_object(D, d, prot.validator)
+
+    def _from_xml(self, d):
+        elt = get_object_as_xml(d, D)
+        return XmlDocument(validator='soft').from_element(None, D, elt)
+
+    def test_dict(self):
+        d = self._from_dict({'i': [1, 2], 'd': [1.5], 'u': [2 ** 64 - 1]})
+
+        assert d.i == array.array('b', [1, 2])
+        assert d.d == array.array('d', [1.5])
+        assert d.u == array.array('Q', [2 ** 64 - 1])
+
+    def test_xml(self):
+        d = self._from_xml(D(i=[1, 2], d=[1.5], u=[3]))
+
+        assert d.i == array.array('b', [1, 2])
+        assert d.d == array.array('d', [1.5])
+        assert d.u == array.array('Q', [3])
+
+    def test_validation(self):
+        for d in ({'i': [-1]}, {'i': [128]}, {'i': [1.5]}, {'u': [-1]},
+                                                                 {'d': ['x']}):
+            self.assertRaises(ValidationError, self._from_dict, d)
+
+        for d in (D(i=[-1]), D(i=[128]), D(u=[-1])):
+            self.assertRaises(ValidationError, self._from_xml, d)
+
+        # nulls are handled by the scalar code path
+        assert self._from_dict({'i': [1, None]}).i == [1, None]
+
+    def test_bulk_out(self):
+        d = D(i=array.array('b', [1, 2]), d=memoryview(array.array('f', [.5])),
+                                                          u=array.array('d', [1]))
+
+        # floats don't fit into integer arrays so u is serialized as usual
+        assert get_object_as_dict(d, D, protocol=MessagePackDocument) == \
+                                         {'i': [1, 2], 'd': [.5], 'u': [1.0]}
+
+        elt = get_object_as_xml(D(i=array.array('b', [1, 2])), D)
+        assert [e.text for e in elt.find('{*}i')] == ['1', '2']
+
+
+if __name__ == '__main__':
+    unittest.main()
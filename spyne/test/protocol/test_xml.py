@@ -329,6 +329,15 @@ class TestXml(unittest.TestCase):
 
         assert u'Ğ'.encode('utf8') in b''.join(resp)
 
+    def test_fragmented_input(self):
+        ctx = FakeContext(in_string=[b'<a xmlns="tns"><b>x', b'y</b', b'></a>'])
+
+        XmlDocument().create_in_document(ctx)
+        assert ctx.in_document.findtext('{tns}b') == 'xy'
+
+        ctx = FakeContext(in_string=[b'<a><b>', b'</a>'])
+        self.assertRaises(Fault, XmlDocument().create_in_document, ctx)
+
     def test_mandatory_subelements(self):
         class C(ComplexModel):
             foo = M(Unicode)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""Tests for coroutine service methods. Python 3.5+ only."""
+
+import asyncio
+import unittest
+
+from spyne.application import Application
+from spyne.decorator import rpc, srpc
+from spyne.error import Fault, ResourceNotFoundError
+from spyne.model.primitive import Integer, Unicode
+from spyne.protocol.xml import XmlDocument
+from spyne.service import ServiceBase
+from spyne.server.null import NullServer
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestNullServerAio(unittest.TestCase):
+    def setUp(self):
+        events = self.events = []
+
+        class SomeService(ServiceBase):
+            @srpc(Integer, Integer, _returns=Integer)
+            async def add(a, b):
+                events.append('body')
+                await asyncio.sleep(0)
+                return a + b
+
+            @srpc(Unicode, _returns=Unicode)
+            def echo(s):
+                return s
+
+            @srpc(Unicode)
+            async def fail(s):
+                await asyncio.sleep(0)
+                raise ResourceNotFoundError(s)
+
+            @srpc()
+            async def crash():
+                raise Exception("boom")
+
+            @rpc(_returns=Unicode)
+            def call_a_coroutine(ctx):
+                async def _coro():
+                    return "from a coroutine"
+                return _coro()
+
+        def _on_return(ctx):
+            events.append(('return', list(ctx.out_object)))
+
+        def _on_exception(ctx):
+            events.append(('exception', ctx.out_error.faultcode))
+
+        SomeService.event_manager.add_listener('method_return_object',
+                                                                    _on_return)
+        SomeService.event_manager.add_listener('method_exception_object',
+                                                                 _on_exception)
+
+        self.app = Application([SomeService], 'tns',
+                          in_protocol=XmlDocument(), out_protocol=XmlDocument())
+
+    def test_coroutine(self):
+        server = NullServer(self.app)
+
+        assert _run(server.aio.add(2, 3)) == 5
+        assert self.events == ['body', ('return', [5])]
+
+    def test_sync_method(self):
+        server = NullServer(self.app)
+
+        assert _run(server.aio.echo("hey")) == "hey"
+        assert self.events == [('return', ["hey"])]
+
+    def test_returned_coroutine(self):
+        server = NullServer(self.app)
+
+        assert _run(server.aio.call_a_coroutine()) == "from a coroutine"
+
+    def test_fault(self):
+        server = NullServer(self.app)
+
+        async def _call():
+            with self.assertRaises(ResourceNotFoundError):
+                await server.aio.fail("nope")
+
+        _run(_call())
+        assert self.events == [('exception', 'Client.ResourceNotFound')]
+
+    def test_exception(self):
+        server = NullServer(self.app)
+
+        async def _call():
+            with self.assertRaises(Fault) as cm:
+                await server.aio.crash()
+            assert cm.exception.faultcode == 'Server'
+
+        _run(_call())
+        assert self.events == [('exception', 'Server')]
+
+    def test_concurrent_calls(self):
+        server = NullServer(self.app)
+
+        async def _call():
+            return await asyncio.gather(*[server.aio.add(i, i)
+                                                           for i in range(5)])
+
+        assert _run(_call()) == [0, 2, 4, 6, 8]
+
+    def test_ostr(self):
+        server = NullServer(self.app, ostr=True)
+
+        ret = _run(server.aio.add(2, 3))
+        assert b'>5<' in b''.join(ret)
+
+    def test_no_running_loop(self):
+        server = NullServer(self.app)
+
+        with self.assertRaises(Fault) as cm:
+            server.service.add(2, 3)
+
+        assert cm.exception.faultcode == 'Server'
+
+
+if __name__ == '__main__':
+    unittest.main()
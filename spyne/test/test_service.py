@@ -24,6 +24,9 @@
 import logging
 logging.basicConfig(level=logging.DEBUG)
 
+import multiprocessing
+import os
+import time
 import unittest
 
 from spyne.util.six import BytesIO
@@ -33,17 +36,20 @@ from lxml import etree
 from spyne.const import RESPONSE_SUFFIX
 from spyne.model.primitive import NATIVE_MAP
 
+from spyne import EventManager
 from spyne.service import ServiceBase
 from spyne.decorator import rpc, srpc
 from spyne.application import Application
 from spyne.auxproc.sync import SyncAuxProc
 from spyne.auxproc.thread import ThreadAuxProc
+from spyne.auxproc.process import ProcessAuxProc, QueueFullError, WorkerError
 from spyne.protocol.http import HttpRpc
+from spyne.protocol.json import JsonDocument
 from spyne.protocol.soap import Soap11
 from spyne.server.null import NullServer
 from spyne.server.wsgi import WsgiApplication
 from spyne.model import Array, SelfReference, Iterable, ComplexModel, String, \
-    Unicode
+    Unicode, Float
 
 
 Application.transport = 'test'
@@ -168,6 +174,149 @@ class TestMultipleMethods(unittest.TestCase):
 
         assert data == set(['hey', 'heyaux'])
 
+    def __run_aux(self, aux, body, calls=1):
+        class Service(ServiceBase):
+            @srpc(String, Float, _returns=String)
+            def call(s, n):
+                return s
+
+        class AuxService(ServiceBase):
+            __aux__ = aux
+
+            @srpc(String, Float, _returns=String)
+            def call(s, n):
+                if s == 'fail':
+                    raise Exception("boom")
+                if s == 'die':
+                    os._exit(1)
+                time.sleep(n)
+                queue.put((os.getpid(), s))
+
+        queue = multiprocessing.Queue()
+        app = Application([Service, AuxService], 'tns',
+                          in_protocol=JsonDocument(), out_protocol=JsonDocument())
+        server = WsgiApplication(app)
+        try:
+            for _ in range(calls):
+                server({
+                    'QUERY_STRING': '',
+                    'PATH_INFO': '/',
+                    'REQUEST_METHOD': 'POST',
+                    'CONTENT_TYPE': 'application/json',
+                    'CONTENT_LENGTH': str(len(body)),
+                    'SERVER_NAME': 'localhost',
+                    'wsgi.input': BytesIO(body),
+                }, start_response, "http://null")
+
+        finally:
+            aux.close()
+
+        retval = []
+        while not queue.empty():
+            retval.append(queue.get())
+        return retval
+
+    def test_process_aux_wsgi(self):
+        data = self.__run_aux(ProcessAuxProc(pool_size=2),
+                                         b'{"call": {"s": "hey", "n": 0}}', 3)
+
+        assert [s for _, s in data] == ['hey'] * 3
+        assert not (os.getpid() in [pid for pid, _ in data])
+
+    def test_process_aux_failure(self):
+        errors = []
+        aux = ProcessAuxProc(pool_size=1,
+                                   on_failure=lambda ctx, e: errors.append(e))
+        self.__run_aux(aux, b'{"call": {"s": "fail", "n": 0}}')
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], WorkerError)
+        assert aux.pending == 0
+
+    def test_process_aux_worker_death(self):
+        errors = []
+        aux = ProcessAuxProc(pool_size=1,
+                                   on_failure=lambda ctx, e: errors.append(e))
+        self.__run_aux(aux, b'{"call": {"s": "die", "n": 0}}')
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], WorkerError)
+        assert aux.pending == 0
+
+    def test_process_aux_queue_full(self):
+        errors = []
+        aux = ProcessAuxProc(pool_size=1, max_pending=1, block=False,
+                                   on_failure=lambda ctx, e: errors.append(e))
+        data = self.__run_aux(aux,
+                                   b'{"call": {"s": "hey", "n": 0.5}}', 2)
+
+        assert len(data) == 1
+        assert len(errors) == 1
+        assert isinstance(errors[0], QueueFullError)
+
+    def test_process_aux_httprpc(self):
+        class Service(ServiceBase):
+            @srpc(String)
+            def call(s):
+                pass
+
+        class AuxService(ServiceBase):
+            __aux__ = ProcessAuxProc(pool_size=1)
+
+            @srpc(String)
+            def call(s):
+                pass
+
+        app = Application([Service, AuxService], 'tns', in_protocol=HttpRpc(),
+                                                         out_protocol=HttpRpc())
+        self.assertRaises(ValueError, WsgiApplication, app)
+
+    def test_thread_aux_stats(self):
+        aux = ThreadAuxProc(pool_size=2)
+        self.__run_aux(aux, b'{"call": {"s": "hey", "n": 0}}', 3)
+        self.__run_aux(aux, b'{"call": {"s": "fail", "n": 0}}')
+
+        stats = aux.get_stats()
+        assert stats['queued'] == 0
+        assert stats['running'] == 0
+
+        method_stats, = stats['methods'].values()
+        assert method_stats['calls'] == 4
+        assert method_stats['errors'] == 1
+        assert method_stats['dropped'] == 0
+        assert sum(method_stats['histogram']) == 4
+        assert len(method_stats['histogram']) == \
+                                            len(stats['latency_buckets']) + 1
+
+    def test_thread_aux_drain(self):
+        aux = ThreadAuxProc(pool_size=1, max_queued=1)
+        data = self.__run_aux(aux, b'{"call": {"s": "hey", "n": 0.1}}', 3)
+
+        assert len(data) == 3
+        assert aux.get_stats()['queued'] == 0
+
+    def test_thread_aux_drop_oldest(self):
+        # no threads, so nothing leaves the queue
+        aux = ThreadAuxProc(pool_size=0, max_queued=1,
+                                           overflow=ThreadAuxProc.DROP_OLDEST)
+        data = self.__run_aux(aux, b'{"call": {"s": "hey", "n": 0}}', 3)
+
+        assert data == []
+        stats = aux.get_stats()
+        assert stats['queued'] == 1
+        method_stats, = stats['methods'].values()
+        assert method_stats['dropped'] == 2
+
+    def test_thread_aux_run_inline(self):
+        aux = ThreadAuxProc(pool_size=0, max_queued=1,
+                                            overflow=ThreadAuxProc.RUN_INLINE)
+        data = self.__run_aux(aux, b'{"call": {"s": "hey", "n": 0}}', 3)
+
+        assert len(data) == 2
+        method_stats, = aux.get_stats()['methods'].values()
+        assert method_stats['inline'] == 2
+        assert method_stats['calls'] == 2
+
     def test_mixing_primary_and_aux_methods(self):
         try:
             class Service(ServiceBase):
@@ -425,5 +574,64 @@ class TestBodyStyle(unittest.TestCase):
         else:
             raise Exception("Must fail with: "
                         "'SelfReference can't be used inside @rpc and its ilk'")
+
+
+class TestEventManager(unittest.TestCase):
+    def test_add_listener_after_fire(self):
+        calls = []
+        evmgr = EventManager(None)
+
+        evmgr.fire_event('some_event', None)
+        assert evmgr.handlers == {}
+
+        def handler(ctx):
+            calls.append(ctx)
+
+        evmgr.add_listener('some_event', handler)
+        evmgr.add_listener('some_event', handler)
+        evmgr.fire_event('some_event', 1)
+        assert calls == [1]
+
+    def test_inherited_handlers(self):
+        calls = []
+
+        class SomeService(ServiceBase):
+            @srpc()
+            def some_call():
+                pass
+
+        SomeService.event_manager.add_listener('method_call',
+                                                   lambda ctx: calls.append(1))
+
+        class SomeOtherService(SomeService):
+            pass
+
+        SomeOtherService.event_manager.fire_event('method_call', None)
+        assert calls == [1]
+
+    def test_timed(self):
+        class SomeService(ServiceBase):
+            @srpc(_returns=Unicode)
+            def some_call():
+                return 'abc'
+
+        contexts = []
+        def _on_method_call(ctx):
+            contexts.append(ctx)
+
+        app = Application([SomeService], 'tns', in_protocol=Soap11(),
+                                                         out_protocol=Soap11())
+        app.event_manager.add_listener('method_call', _on_method_call)
+        server = NullServer(app)
+
+        server.service.some_call()
+        ctx, = contexts
+        assert ctx.event_handler_times is None
+
+        app.event_manager.timed = True
+        server.service.some_call()
+        ctx = contexts[-1]
+        assert list(ctx.event_handler_times.keys()) == ['method_call']
+        assert ctx.event_handler_times['method_call'] >= 0
 if __name__ == '__main__':
     unittest.main()
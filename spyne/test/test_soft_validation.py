@@ -21,16 +21,30 @@
 # Most of the service tests are performed through the interop tests.
 #
 
+import gc
+import uuid
+import weakref
+import datetime
 import unittest
 
+import pytz
+
 from spyne.application import Application
 from spyne.decorator import srpc
 from spyne.error import ValidationError
 from spyne.service import ServiceBase
 from spyne.protocol.http import HttpRpc
 from spyne.protocol.soap import Soap11
+from spyne.model import get_validators
 from spyne.model.primitive import Integer
 from spyne.model.primitive import String
+from spyne.model.primitive import Unicode
+from spyne.model.primitive import UnsignedInteger
+from spyne.model.primitive import Integer8
+from spyne.model.primitive import Double
+from spyne.model.primitive import Uuid
+from spyne.model.primitive import DateTime
+from spyne.model.primitive import Date
 from spyne.server import ServerBase
 from spyne.server.wsgi import WsgiApplication
 
@@ -90,6 +104,98 @@ class TestValidationInteger(unittest.TestCase):
         self.assertEquals(StrictType.validate_native(StrictType, 3), True)
         self.assertEquals(StrictType.validate_native(StrictType, 2), False)
 
+
+class TestCompiledValidators(unittest.TestCase):
+    def _assert_same(self, cls, strings, natives):
+        validate_string, validate_native = get_validators(cls)
+
+        for s in strings:
+            assert validate_string(s) == cls.validate_string(cls, s), (cls, s)
+
+        for n in natives:
+            assert validate_native(n) == cls.validate_native(cls, n), (cls, n)
+
+    def test_unicode(self):
+        strings = [None, u'', u'a', u'abc', u'abcd']
+        natives = [None, u'', u'a', u'a1', u'abcd']
+
+        self._assert_same(Unicode, strings, natives)
+        self._assert_same(Unicode(3), strings, natives)
+        self._assert_same(Unicode(min_len=2, nillable=False), strings, natives)
+        self._assert_same(Unicode(pattern='[a-z]+'), strings, natives)
+        self._assert_same(Unicode(values=[u'a', u'abcd']), strings, natives)
+
+    def test_numbers(self):
+        strings = [None, u'1', u'1' * 2000]
+        natives = [None, -300, -1, 0, 1, 3, 300, 1.5]
+
+        self._assert_same(Integer, strings, natives)
+        self._assert_same(Integer(ge=0, lt=3), strings, natives)
+        self._assert_same(Integer(nullable=False), strings, natives)
+        self._assert_same(Integer(values=[1, 3]), strings, natives)
+        self._assert_same(UnsignedInteger, strings, natives)
+        self._assert_same(Integer8, strings, natives)
+        self._assert_same(Double(gt=0), strings, natives)
+
+    def test_non_finite_numbers(self):
+        natives = [float('inf'), float('-inf'), 1.0]
+
+        self._assert_same(Double, [], natives)
+        self._assert_same(Double(gt=0), [], natives)
+        self._assert_same(Integer, [], natives)
+        self._assert_same(UnsignedInteger, [], natives)
+
+        _, validate_native = get_validators(Double)
+        assert not validate_native(float('inf'))
+        assert not validate_native(float('-inf'))
+        assert not validate_native(float('nan'))
+
+    def test_uuid(self):
+        strings = [None, u'a', str(uuid.uuid4())]
+
+        self._assert_same(Uuid, strings, [None, uuid.uuid4()])
+        self._assert_same(Uuid(serialize_as='hex'), [uuid.uuid4().hex], [])
+
+    def test_datetime(self):
+        dt = datetime.datetime(2000, 1, 1)
+        natives = [None, dt, dt.replace(year=2010)]
+
+        self._assert_same(DateTime, [], natives)
+        self._assert_same(DateTime(lt=datetime.datetime(2005, 1, 1,
+                                               tzinfo=pytz.utc)), [], natives)
+        self._assert_same(Date, [], [None, dt.date(), datetime.date(1, 1, 1)])
+
+    def test_override(self):
+        class SomeUnicode(Unicode):
+            @staticmethod
+            def validate_native(cls, value):
+                return value == u'a'
+
+        validate_string, validate_native = get_validators(SomeUnicode(3))
+        assert validate_string(u'aaa')
+        assert not validate_string(u'aaaa')
+        assert validate_native(u'a')
+        assert not validate_native(u'b')
+
+    def test_classes_not_kept_alive(self):
+        class SomeUnicode(Unicode):
+            @staticmethod
+            def validate_native(cls, value):
+                return value == u'a'
+
+        get_validators(SomeUnicode(3))
+        get_validators(SomeUnicode)
+
+        ref = weakref.ref(SomeUnicode)
+        del SomeUnicode
+
+        # the first pass drops the cache entries, which frees more cycles
+        gc.collect()
+        gc.collect()
+
+        assert ref() is None
+
+
 class TestHttpRpcSoftValidation(unittest.TestCase):
     def setUp(self):
         class SomeService(ServiceBase):
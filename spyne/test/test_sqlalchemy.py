@@ -309,6 +309,23 @@ class TestSqlAlchemySchema(unittest.TestCase):
 
         self.session.close()
 
+    def test_mapped_after_instantiation(self):
+        class SomeClass(ComplexModel):
+            id = Integer32
+            s = Unicode(default=u'x')
+
+        SomeClass()
+
+        table = Table('some_class', self.metadata,
+            Column('id', sqlalchemy.Integer, primary_key=True),
+            Column('s', sqlalchemy.String(10)),
+        )
+        mapper(SomeClass, table, properties={'id': table.c.id, 's': table.c.s})
+
+        # the default must go through the instrumented attribute.
+        sc = SomeClass(id=1)
+        assert sqlalchemy.inspect(sc).attrs.s.history.added == [u'x']
+
     def test_sqlalchemy_inheritance(self):
         # no spyne code is involved here.
         # this is just to test test the sqlalchemy behavior that we rely on.
@@ -2,6 +2,8 @@
 
 from __future__ import print_function
 
+import gc
+import weakref
 import unittest
 import pytz
 import decimal
@@ -21,6 +23,7 @@ from spyne.application import Application
 from spyne.model.complex import XmlAttribute
 from spyne.model.complex import ComplexModel
 from spyne.model.complex import Iterable
+from spyne.model.complex import SelfReference
 from spyne.model.complex import Array
 from spyne.model.primitive import Decimal
 from spyne.model.primitive import DateTime
@@ -30,6 +33,8 @@ from spyne.model.primitive import Unicode
 from spyne.service import ServiceBase
 
 from spyne.util import AttrDict, AttrDictColl
+from spyne.util import memoize, memoize_id, memoize_class, \
+    get_memoize_stats
 
 from spyne.util.protocol import deserialize_request_string
 
@@ -339,6 +344,157 @@ class TestAttrDict(unittest.TestCase):
         assert AttrDictColl('SomeDict').SomeDict(a=1)['a'] == 1
         assert AttrDictColl('SomeDict').SomeDict(a=1).NAME == 'SomeDict'
 
+class TestMemoize(unittest.TestCase):
+    def test_memoize(self):
+        calls = []
+
+        @memoize
+        def f(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        assert f(1) == f(1) == 1
+        assert f(1, b=2) == 3
+        assert calls == [(1, 0), (1, 2)]
+
+        stats = f.get_stats()
+        assert (stats['hits'], stats['misses'], stats['size']) == (1, 2, 2)
+        assert stats['name'] in [s['name'] for s in get_memoize_stats()]
+
+        f.clear()
+        assert len(f.memo) == 0 and f.misses == 2
+        f.reset()
+        assert f.misses == 0
+
+    def test_memoize_bounded(self):
+        @memoize.bounded(2)
+        def f(a):
+            return object()
+
+        a = f(1)
+        f(2)
+        assert f(1) is a  # 1 is now the most recently used
+        f(3)
+        assert len(f.memo) == 2
+        assert f(1) is a
+        assert f.get_stats()['misses'] == 3
+
+    def test_memoize_class_gc(self):
+        @memoize
+        def f(cls):
+            return cls.__name__
+
+        @memoize_id
+        def g(cls):
+            return cls.__name__
+
+        class C(object):
+            pass
+
+        assert f(C) == g(C) == 'C'
+        assert len(f.memo) == len(g.memo) == 1
+
+        del C
+        gc.collect()
+        assert len(f.memo) == len(g.memo) == 0
+
+    def test_memoize_dynamic_models(self):
+        get_size = lambda: ComplexModel.get_flat_type_info.get_stats()['size']
+        flat_memo_size = get_size()
+
+        C = type(ComplexModel)('C', (ComplexModel,), {'a': Integer})
+        C.get_flat_type_info(C)
+        assert get_size() == flat_memo_size + 1
+
+        del C
+        gc.collect()
+        assert get_size() == flat_memo_size
+
+    def test_memoize_class(self):
+        calls = []
+
+        @memoize_class
+        def f(cls, a=0):
+            calls.append(cls)
+            return cls, a
+
+        class C(object):
+            pass
+
+        class D(C):
+            pass
+
+        assert f(C) == f(C) == (C, 0)
+        assert f(D) == (D, 0)
+        assert f(C, a=1) == (C, 1)
+        assert calls == [C, D, C]
+        assert f.get_stats()['size'] == 3
+
+        f.clear()
+        assert f.get_stats()['size'] == 0
+        assert f(C) == (C, 0)
+        assert calls == [C, D, C, C]
+
+    def test_memoize_self_referencing_models(self):
+        C = type(ComplexModel)('C', (ComplexModel,), {
+            'a': Integer,
+            'c': SelfReference,
+        })
+
+        assert C.get_flat_type_info(C)['c'].__orig__ is C
+        assert C.get_simple_type_info(C)['a'].parent is C
+        C(a=1)
+
+        ref = weakref.ref(C)
+        del C
+
+        # the first pass drops the cache entries, which frees more cycles
+        gc.collect()
+        gc.collect()
+
+        assert ref() is None
+
+    def test_dynamic_models_not_kept_alive(self):
+        from spyne.model import get_validators
+        from spyne.protocol.dictdoc import SimpleDictDocument
+
+        D = type(ComplexModel)('D', (ComplexModel,), {'s': Unicode(5)})
+        C = type(ComplexModel)('C', (ComplexModel,), {
+            'a': Integer(default=1),
+            'd': D,
+            'ds': Array(D),
+        })
+
+        assert C.get_simple_type_info(C)['d.s'].parent is D
+        assert C().a == 1
+        get_validators(C)
+        get_validators(D)
+
+        prot = SimpleDictDocument()
+        inst = prot.simple_dict_to_object({'a': ['2'], 'd.s': ['x'],
+                                          'ds[0].s': ['y']}, C)
+        assert (inst.a, inst.d.s, inst.ds[0].s) == (2, 'x', 'y')
+
+        refs = [weakref.ref(C), weakref.ref(D)]
+        del C, D, inst
+
+        # the first pass drops the cache entries, which frees more cycles
+        gc.collect()
+        gc.collect()
+
+        assert [r() for r in refs] == [None, None]
+
+    def test_memoize_id_keeps_args(self):
+        @memoize_id
+        def f(a):
+            return list(a)
+
+        # tuples can't be weakly referenced so the entry keeps it alive,
+        # otherwise its id could be reused by another tuple.
+        f((1, 2))
+        assert f._watchers[next(iter(f.memo))] == [(1, 2)]
+
+
 class TestYaml(unittest.TestCase):
     def test_deser(self):
         class C(ComplexModel):
@@ -0,0 +1,288 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import asyncio
+import json
+import threading
+import unittest
+
+from spyne import Application, ServiceBase, rpc
+from spyne.error import ResourceNotFoundError
+from spyne.model import Integer, Unicode, Iterable
+from spyne.protocol.http import HttpRpc
+from spyne.protocol.json import JsonDocument
+from spyne.protocol.soap import Soap11
+from spyne.server.asgi import AsgiApplication
+
+
+def _call_asgi_app(app, method='GET', path='/', query_string=b'',
+                                                    headers=(), chunks=(b'',)):
+    scope = {
+        'type': 'http',
+        'method': method,
+        'path': path,
+        'query_string': query_string,
+        'headers': list(headers),
+        'server': ('localhost', 8000),
+    }
+
+    messages = [{'type': 'http.request', 'body': c, 'more_body': True}
+                                                                for c in chunks]
+    messages[-1]['more_body'] = False
+
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(app(scope, receive, send))
+    finally:
+        loop.close()
+
+    start = sent[0]
+    assert start['type'] == 'http.response.start'
+    assert sent[-1] == {'type': 'http.response.body', 'body': b''}
+
+    return start['status'], dict(start['headers']), \
+                                            [m['body'] for m in sent[1:-1]]
+
+
+class TestAsgiApplication(unittest.TestCase):
+    def _get_app(self, in_protocol=None, **kwargs):
+        threads = self.threads = []
+
+        class SomeService(ServiceBase):
+            @rpc(Unicode, _returns=Unicode)
+            def some_call(ctx, s):
+                threads.append(threading.current_thread())
+                return s
+
+            @rpc(Unicode, _returns=Unicode)
+            async def some_async_call(ctx, s):
+                threads.append(threading.current_thread())
+                await asyncio.sleep(0)
+                return s
+
+            @rpc(Integer, _returns=Iterable(Integer))
+            async def some_iterable(ctx, n):
+                return range(n)
+
+            @rpc(Integer)
+            async def some_stream(ctx, n):
+                ctx.out_string = (str(i).encode('ascii') for i in range(n))
+
+            @rpc(Integer)
+            async def some_broken_stream(ctx, n):
+                def gen():
+                    raise Exception("boom")
+                    yield b''
+                ctx.out_string = gen()
+
+            @rpc(Unicode)
+            async def some_fault(ctx, s):
+                await asyncio.sleep(0)
+                raise ResourceNotFoundError(s)
+
+        if in_protocol is None:
+            in_protocol = HttpRpc()
+
+        app = Application([SomeService], 'tns', in_protocol=in_protocol,
+                                                   out_protocol=JsonDocument())
+
+        return AsgiApplication(app, **kwargs)
+
+    def test_sync_method_runs_in_executor(self):
+        server = self._get_app()
+        status, headers, body = _call_asgi_app(server, path='/some_call',
+                                                     query_string=b's=hello')
+
+        assert status == 200
+        assert json.loads(b''.join(body).decode('utf8')) == 'hello'
+        assert self.threads[0] is not threading.current_thread()
+
+    def test_async_method_runs_on_event_loop(self):
+        server = self._get_app()
+        status, headers, body = _call_asgi_app(server,
+                                 path='/some_async_call', query_string=b's=hi')
+
+        assert status == 200
+        assert json.loads(b''.join(body).decode('utf8')) == 'hi'
+        assert self.threads[0] is threading.current_thread()
+
+    def test_async_fault(self):
+        server = self._get_app()
+        status, headers, body = _call_asgi_app(server,
+                              path='/some_fault', query_string=b's=nothing')
+
+        assert status == 404
+        assert headers[b'Content-Length'] == \
+                                         str(len(b''.join(body))).encode('ascii')
+        assert b'nothing' in b''.join(body)
+
+    def test_chunked_request_and_response(self):
+        server = self._get_app(in_protocol=JsonDocument())
+        status, headers, body = _call_asgi_app(server, method='POST',
+                        chunks=[b'{"some_iterable"', b': {"n": 3}', b'}'])
+
+        assert status == 200
+        assert json.loads(b''.join(body).decode('utf8')) == [0, 1, 2]
+
+        status, headers, body = _call_asgi_app(server, method='POST',
+                                         chunks=[b'{"some_stream": {"n": 3}}'])
+
+        assert status == 200
+        assert b'Content-Length' not in headers
+        assert body == [b'0', b'1', b'2']
+
+    def test_unchunked_response(self):
+        server = self._get_app(in_protocol=JsonDocument(), chunked=False)
+        status, headers, body = _call_asgi_app(server, method='POST',
+                                         chunks=[b'{"some_iterable": {"n": 3}}'])
+
+        assert status == 200
+        assert len(body) == 1
+        assert headers[b'Content-Length'] == str(len(body[0])).encode('ascii')
+
+    def test_request_too_long(self):
+        server = self._get_app(in_protocol=JsonDocument(),
+                                                         max_content_length=10)
+        status, headers, body = _call_asgi_app(server, method='POST',
+                        chunks=[b'{"some_call"', b': {"s": "0123456789"}}'])
+
+        assert status == 413
+
+        status, headers, body = _call_asgi_app(server, method='POST',
+                                   headers=[(b'content-length', b'100')])
+
+        assert status == 413
+
+    def test_invalid_content_length(self):
+        server = self._get_app(in_protocol=JsonDocument())
+        status, headers, body = _call_asgi_app(server, method='POST',
+                                   headers=[(b'content-length', b'lots')])
+
+        assert status == 400
+
+    def test_serialization_error(self):
+        server = self._get_app(in_protocol=JsonDocument())
+
+        events = []
+        server.event_manager.add_listener('wsgi_close',
+                                            lambda ctx: events.append('close'))
+
+        status, headers, body = _call_asgi_app(server, method='POST',
+                                 chunks=[b'{"some_broken_stream": {"n": 3}}'])
+
+        assert status == 500
+        assert b'Server' in b''.join(body)
+        assert headers[b'Content-Length'] == \
+                                         str(len(b''.join(body))).encode('ascii')
+        assert events == ['close']
+
+    def test_events(self):
+        server = self._get_app()
+        events = []
+
+        for name in ('wsgi_call', 'wsgi_return', 'wsgi_exception',
+                                                                  'wsgi_close'):
+            server.event_manager.add_listener(name,
+                                        lambda ctx, name=name: events.append(name))
+
+        _call_asgi_app(server, path='/some_async_call', query_string=b's=a')
+        assert events == ['wsgi_call', 'wsgi_return', 'wsgi_close']
+
+        del events[:]
+        _call_asgi_app(server, path='/some_fault', query_string=b's=a')
+        assert events == ['wsgi_call', 'wsgi_exception', 'wsgi_close']
+
+    def test_headers_and_cookies(self):
+        seen = []
+
+        class SomeService(ServiceBase):
+            @rpc(_returns=Unicode)
+            async def some_call(ctx):
+                seen.append(ctx.transport.headers)
+                seen.append(ctx.transport.get_cookie('a'))
+                ctx.transport.resp_headers['X-Something'] = 'else'
+                return ctx.transport.get_path()
+
+        app = Application([SomeService], 'tns', in_protocol=HttpRpc(),
+                                                   out_protocol=JsonDocument())
+
+        status, headers, body = _call_asgi_app(AsgiApplication(app),
+                                path='/some_call', headers=[
+                                    (b'x-custom-header', b'1'),
+                                    (b'cookie', b'a=b'),
+                                ])
+
+        assert status == 200
+        assert seen[0]['x_custom_header'] == ['1']
+        assert seen[1] == 'b'
+        assert headers[b'X-Something'] == b'else'
+        assert json.loads(b''.join(body).decode('utf8')) == '/some_call'
+
+    def test_wsdl(self):
+        class SomeService(ServiceBase):
+            @rpc(Unicode, _returns=Unicode)
+            async def some_call(ctx, s):
+                return s
+
+        app = Application([SomeService], 'tns', in_protocol=Soap11(),
+                                                        out_protocol=Soap11())
+
+        status, headers, body = _call_asgi_app(AsgiApplication(app),
+                                                       query_string=b'wsdl')
+
+        assert status == 200
+        assert b'some_call' in b''.join(body)
+        assert b'http://localhost:8000/' in b''.join(body)
+
+    def test_lifespan(self):
+        server = self._get_app()
+        messages = [
+            {'type': 'lifespan.startup'},
+            {'type': 'lifespan.shutdown'},
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(server({'type': 'lifespan'}, receive, send))
+        finally:
+            loop.close()
+
+        assert sent == [
+            {'type': 'lifespan.startup.complete'},
+            {'type': 'lifespan.shutdown.complete'},
+        ]
+
+
+if __name__ == '__main__':
+    unittest.main()
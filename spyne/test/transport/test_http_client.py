@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import gzip
+import threading
+import unittest
+
+from time import time
+
+from spyne import Application, MethodContext, ServiceBase, srpc
+from spyne.client.http import HttpClient
+from spyne.error import Fault, ResourceNotFoundError
+from spyne.model import Integer, Iterable, Unicode
+from spyne.protocol.soap import Soap11
+from spyne.server.wsgi import WsgiApplication
+from spyne.util.six import BytesIO
+from spyne.util.six.moves import BaseHTTPServer, socketserver
+
+
+class _InFlight(object):
+    """Counts the concurrent calls to ``SomeService.slow``."""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.wait_for = 0
+        self.current = 0
+        self.peak = 0
+
+    def reset(self, wait_for):
+        self.wait_for = wait_for
+        self.current = self.peak = 0
+
+
+_in_flight = _InFlight()
+
+
+class SomeService(ServiceBase):
+    @srpc(Integer, _returns=Integer)
+    def slow(n):
+        with _in_flight.cond:
+            _in_flight.current += 1
+            _in_flight.peak = max(_in_flight.peak, _in_flight.current)
+            _in_flight.cond.notify_all()
+
+            # wait until the other calls are in flight too. the deadline is
+            # only there to make a client that sends them serially fail
+            # instead of hang.
+            deadline = time() + 5
+            while _in_flight.peak < _in_flight.wait_for and time() < deadline:
+                _in_flight.cond.wait(deadline - time())
+
+            _in_flight.current -= 1
+
+        return n
+
+    @srpc(Unicode, _returns=Unicode)
+    def echo(s):
+        return s
+
+    @srpc(Unicode)
+    def fail(s):
+        raise ResourceNotFoundError(s)
+
+    @srpc(Integer, _returns=Iterable(Integer))
+    def count(n):
+        return range(n)
+
+    @srpc(Integer, _returns=Iterable(Integer))
+    def fail_iter(n):
+        raise ResourceNotFoundError(n)
+
+
+def _get_app():
+    return Application([SomeService], 'tns',
+                               in_protocol=Soap11(), out_protocol=Soap11())
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Runs a WsgiApplication over keep-alive HTTP/1.1 connections."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.server.connections.append(self.client_address)
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        environ = {
+            'REQUEST_METHOD': 'POST',
+            'PATH_INFO': '/',
+            'QUERY_STRING': '',
+            'SERVER_NAME': 'localhost',
+            'SERVER_PORT': str(self.server.server_port),
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'CONTENT_TYPE': self.headers['Content-Type'],
+            'CONTENT_LENGTH': str(length),
+            'wsgi.input': BytesIO(self.rfile.read(length)),
+            'wsgi.url_scheme': 'http',
+        }
+
+        status = []
+        def _start_response(code, headers):
+            status.append(int(code[:3]))
+
+        body = b''.join(self.server.wsgi_app(environ, _start_response))
+
+        self.send_response(status[0])
+        gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+        self.server.gzipped.append(gzipped)
+        if gzipped:
+            out = BytesIO()
+            with gzip.GzipFile(fileobj=out, mode='wb') as f:
+                f.write(body)
+            body = out.getvalue()
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self):
+        self.server = _Server(('127.0.0.1', 0), _Handler)
+        self.server.wsgi_app = WsgiApplication(_get_app())
+        self.server.connections = []
+        self.server.gzipped = []
+        _in_flight.reset(wait_for=0)
+
+        job = threading.Thread(target=self.server.serve_forever)
+        job.daemon = True
+        job.start()
+
+        self.url = 'http://127.0.0.1:%d/' % self.server.server_port
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _get_client(self, **kwargs):
+        client = HttpClient(self.url, _get_app(), **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_keep_alive(self):
+        client = self._get_client()
+
+        for i in range(5):
+            assert client.service.echo(u'hey %d' % i) == u'hey %d' % i
+
+        assert len(self.server.connections) == 1
+
+    def test_gzip(self):
+        client = self._get_client(gzip=False)
+        assert client.service.echo(u'hey') == u'hey'
+
+        client = self._get_client(gzip=True)
+        assert client.service.echo(u'hey') == u'hey'
+
+        assert self.server.gzipped == [False, True]
+
+    def test_reconnect(self):
+        client = self._get_client()
+        assert client.service.echo(u'hey') == u'hey'
+
+        # make the server close the idle connection
+        conns = client.connection_pool._idle.values()
+        for conn, in conns:
+            conn.sock.shutdown(2)
+
+        assert client.service.echo(u'again') == u'again'
+        assert len(self.server.connections) == 2
+
+    def test_fault(self):
+        client = self._get_client()
+
+        with self.assertRaises(Fault) as cm:
+            client.service.fail(u'x')
+        assert cm.exception.faultcode.endswith('Client.ResourceNotFound')
+
+        assert client.service.echo(u'hey') == u'hey'
+
+    def test_batch(self):
+        client = self._get_client(pool_size=5)
+
+        _in_flight.reset(wait_for=5)
+        results = client.batch([('slow', (i,)) for i in range(5)] +
+                                      [('echo', (), {'s': u'hey'})])
+
+        assert results == [0, 1, 2, 3, 4, u'hey']
+        assert _in_flight.peak == 5
+
+        results = client.batch([('fail', (u'x',)), ('echo', (u'y',))],
+                                                        return_exceptions=True)
+        assert isinstance(results[0], Fault)
+        assert results[1] == u'y'
+
+        with self.assertRaises(Fault):
+            client.batch([('fail', (u'x',))])
+
+    def test_stream(self):
+        client = self._get_client(chunk_size=64)
+
+        items = client.stream.count(1000)
+        assert next(items) == 0
+
+        # the response is still being read
+        assert not any(client.connection_pool._idle.values())
+
+        assert list(items) == list(range(1, 1000))
+        assert any(client.connection_pool._idle.values())
+
+        assert list(client.stream.count(0)) == []
+
+    def test_stream_fault(self):
+        client = self._get_client()
+
+        with self.assertRaises(Fault) as cm:
+            list(client.stream.fail_iter(1))
+        assert cm.exception.faultcode.endswith('Client.ResourceNotFound')
+
+        with self.assertRaises(ValueError):
+            list(client.stream.echo(u'hey'))
+
+    def test_stream_parser_options(self):
+        client = self._get_client()
+        remote = client.service.echo
+
+        ctx = MethodContext(remote, MethodContext.CLIENT)
+        ctx.in_string = [b'<!DOCTYPE r [<!ENTITY x "expanded">]>'
+                         b'<r><echoResult><string>&x;</string></echoResult></r>']
+
+        # the parser options of the protocol apply, so entities are not resolved
+        assert list(remote._iter_xml(ctx, 'echoResult', Unicode)) == [u'']
+
+    def test_aio(self):
+        try:
+            import asyncio
+        except ImportError:
+            return
+
+        client = self._get_client()
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            results = loop.run_until_complete(asyncio.gather(
+                                       *[client.aio.slow(i) for i in range(5)]))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+        assert results == list(range(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import json
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from time import sleep, time
+
+from spyne import Application, ServiceBase, srpc
+from spyne.model import Integer
+from spyne.protocol.json import JsonDocument
+from spyne.server.prefork import TwistedPreforkServer
+from spyne.util.six.moves.urllib.request import urlopen
+
+
+# The reactor must not be imported in the supervisor process, so the server
+# runs in a fresh interpreter.
+SERVER = """
+import os, sys
+
+from spyne import Application, ServiceBase, srpc
+from spyne.model import Integer
+from spyne.protocol.json import JsonDocument
+from spyne.server.prefork import TwistedPreforkServer
+
+class SomeService(ServiceBase):
+    @srpc(_returns=Integer)
+    def get_pid():
+        return os.getpid()
+
+app = Application([SomeService], 'tns',
+                 in_protocol=JsonDocument(), out_protocol=JsonDocument())
+
+server = TwistedPreforkServer(app, 0, host='127.0.0.1', num_workers=2,
+        transport_kwargs={'prepath': '/'}, restart_delay=0,
+        stats_path=sys.argv[1], stats_interval=0.05)
+server.bind()
+
+sys.stdout.write('%d\\n' % server.port)
+sys.stdout.flush()
+
+server.serve_forever()
+"""
+
+
+class SomeService(ServiceBase):
+    @srpc(_returns=Integer)
+    def get_pid():
+        return os.getpid()
+
+
+def _get_app():
+    return Application([SomeService], 'tns',
+                     in_protocol=JsonDocument(), out_protocol=JsonDocument())
+
+
+class TestTwistedPreforkServer(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.stats_path = os.path.join(self.tmpdir, 'stats.sock')
+
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(sys.path)
+        self.process = subprocess.Popen([sys.executable, '-c', SERVER,
+                          self.stats_path], stdout=subprocess.PIPE, env=env)
+
+        self.port = int(self.process.stdout.readline())
+
+    def tearDown(self):
+        if self.process.poll() is None:
+            os.kill(self.process.pid, signal.SIGTERM)
+            self._wait()
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+        shutil.rmtree(self.tmpdir)
+
+    def _wait(self, timeout=10):
+        deadline = time() + timeout
+        while self.process.poll() is None and time() < deadline:
+            sleep(0.05)
+
+    def _call(self):
+        data = json.dumps({"get_pid": {}}).encode('utf8')
+        url = 'http://127.0.0.1:%d/' % self.port
+        return json.loads(urlopen(url, data, timeout=5).read().decode('utf8'))
+
+    def _get_stats(self):
+        s = socket.socket(socket.AF_UNIX)
+        try:
+            s.connect(self.stats_path)
+            data = b''
+            while True:
+                chunk = s.recv(0x10000)
+                if not chunk:
+                    break
+                data += chunk
+        finally:
+            s.close()
+
+        return json.loads(data.decode('utf8'))
+
+    def _get_worker_pids(self, exclude=(), timeout=5):
+        deadline = time() + timeout
+        while time() < deadline:
+            if os.path.exists(self.stats_path):
+                workers = self._get_stats()['workers']
+                pids = set([w['pid'] for w in workers.values()])
+                if len(pids) == 2 and not (pids & set(exclude)):
+                    return pids
+            sleep(0.05)
+
+        raise AssertionError("workers did not report")
+
+    def test_call(self):
+        pids = self._get_worker_pids()
+
+        for _ in range(10):
+            assert self._call() in pids
+
+        sleep(0.2)
+
+        total = self._get_stats()['total']
+        assert total['calls'] == 10
+        assert total['connections'] == 10
+        assert total['errors'] == 0
+
+    def test_restart_dead_worker(self):
+        pids = self._get_worker_pids()
+        victim = pids.pop()
+        os.kill(victim, signal.SIGKILL)
+
+        new_pids = self._get_worker_pids(exclude=[victim])
+        assert pids.issubset(new_pids)
+        assert self._call() in new_pids
+
+    def test_rolling_restart(self):
+        pids = self._get_worker_pids()
+        os.kill(self.process.pid, signal.SIGHUP)
+
+        new_pids = self._get_worker_pids(exclude=pids)
+        assert self._call() in new_pids
+
+    def test_stop(self):
+        self._get_worker_pids()
+        os.kill(self.process.pid, signal.SIGTERM)
+        self._wait()
+
+        assert self.process.returncode == 0
+        assert not os.path.exists(self.stats_path)
+
+    def test_orphaned_workers(self):
+        pids = self._get_worker_pids()
+        self.process.kill()
+        self.process.wait()
+
+        deadline = time() + 5
+        while pids and time() < deadline:
+            for pid in list(pids):
+                try:
+                    os.kill(pid, 0)
+                except OSError:
+                    pids.discard(pid)
+            sleep(0.05)
+
+        assert not pids
+
+
+class TestTwistedPreforkServerConfig(unittest.TestCase):
+    def test_invalid_transport(self):
+        with self.assertRaises(ValueError):
+            TwistedPreforkServer(_get_app(), 0, transport='smtp')
+
+    def test_reactor_imported(self):
+        from twisted.internet import reactor
+
+        server = TwistedPreforkServer(_get_app(), 0, num_workers=1)
+        with self.assertRaises(RuntimeError):
+            server.serve_forever()
+
+    def test_msgpack_factory(self):
+        from spyne.server.twisted.msgpack import \
+                                              TwistedMessagePackProtocolFactory
+
+        server = TwistedPreforkServer(_get_app(), 0, transport='msgpack')
+        assert isinstance(server.build_factory(),
+                                              TwistedMessagePackProtocolFactory)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import json
+import threading
+
+from twisted.trial import unittest
+from twisted.web.server import NOT_DONE_YET
+from twisted.web.test.requesthelper import DummyRequest
+
+from spyne import Application, ServiceBase, rpc
+from spyne.error import ResourceNotFoundError
+from spyne.model import Unicode
+from spyne.protocol.json import JsonDocument
+from spyne.server.twisted import MethodThreadPool, TwistedWebResource
+from spyne.util.six import BytesIO
+
+
+class TestMethodThreadPool(unittest.TestCase):
+    def setUp(self):
+        threads = self.threads = []
+
+        class SomeService(ServiceBase):
+            @rpc(Unicode, _returns=Unicode, _executor='db')
+            def in_pool(ctx, s):
+                threads.append(threading.current_thread())
+                return s
+
+            @rpc(Unicode, _returns=Unicode)
+            def in_reactor(ctx, s):
+                threads.append(threading.current_thread())
+                return s
+
+            @rpc(Unicode, _returns=Unicode, _executor='db')
+            def fail(ctx, s):
+                raise ResourceNotFoundError(s)
+
+        class OtherService(ServiceBase):
+            __executor__ = 'other'
+
+            @rpc(Unicode, _returns=Unicode)
+            def in_other_pool(ctx, s):
+                threads.append(threading.current_thread())
+                return s
+
+        self.app = Application([SomeService, OtherService], 'tns',
+                        in_protocol=JsonDocument(), out_protocol=JsonDocument())
+
+    def _get_resource(self, **kwargs):
+        pool = MethodThreadPool('db', size=2, **kwargs)
+        self.addCleanup(pool.pool.stop)
+
+        resource = TwistedWebResource(self.app, thread_pools=[pool])
+        self.addCleanup(resource.thread_pools['other'].pool.stop)
+
+        return resource
+
+    def _call(self, resource, body):
+        request = DummyRequest([b''])
+        request.method = b'POST'
+        request.content = BytesIO(json.dumps(body).encode('utf8'))
+
+        d = request.notifyFinish()
+        ret = resource.handle_rpc(request)
+        if ret is not NOT_DONE_YET:
+            request.write(ret)
+            request.finish()
+
+        return d.addCallback(lambda _: request)
+
+    def _get_body(self, request):
+        return json.loads(b''.join(request.written).decode('utf8'))
+
+    def test_executor(self):
+        resource = self._get_resource()
+
+        assert resource.app.interface.service_method_map[
+                          '{tns}in_other_pool'][0].executor == 'other'
+        assert resource.thread_pools['db'].size == 2
+        assert set(resource.thread_pools) == set(['db', 'other'])
+
+    def test_in_pool(self):
+        resource = self._get_resource()
+
+        def _cb(request):
+            assert self._get_body(request) == "hey"
+            assert self.threads[0] is not threading.current_thread()
+            assert 'spyne-db' in self.threads[0].name
+
+            stats = resource.get_thread_pool_stats()
+            assert stats['db']['calls'] == 1
+            assert stats['db']['queued'] == 0
+            assert stats['db']['running'] == 0
+            assert stats['db']['max_wait'] >= 0
+            assert stats['other']['calls'] == 0
+
+        return self._call(resource, {"in_pool": {"s": "hey"}}).addCallback(_cb)
+
+    def test_in_service_pool(self):
+        resource = self._get_resource()
+
+        def _cb(request):
+            assert self._get_body(request) == "hey"
+            assert 'spyne-other' in self.threads[0].name
+
+        return self._call(resource, {"in_other_pool": {"s": "hey"}}) \
+                                                             .addCallback(_cb)
+
+    def test_serialize_in_pool(self):
+        resource = self._get_resource(serialize=True)
+        serialized_in = []
+
+        def _on_return_string(ctx):
+            serialized_in.append(threading.current_thread())
+
+        self.app.services[0].event_manager.add_listener(
+                                'method_return_string', _on_return_string)
+
+        def _cb(request):
+            assert self._get_body(request) == "hey"
+            assert resource.get_thread_pool_stats()['db']['calls'] == 1
+            assert serialized_in == self.threads
+
+        return self._call(resource, {"in_pool": {"s": "hey"}}).addCallback(_cb)
+
+    def test_in_reactor(self):
+        resource = self._get_resource()
+
+        def _cb(request):
+            assert self._get_body(request) == "hey"
+            assert self.threads[0] is threading.current_thread()
+
+        return self._call(resource, {"in_reactor": {"s": "hey"}}) \
+                                                             .addCallback(_cb)
+
+    def test_fault(self):
+        resource = self._get_resource()
+
+        def _cb(request):
+            assert request.responseCode == 404
+            assert self._get_body(request)['faultcode'] == \
+                                                      'Client.ResourceNotFound'
+
+        return self._call(resource, {"fail": {"s": "nope"}}).addCallback(_cb)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import os
+import signal
+import tempfile
+import unittest
+
+from multiprocessing import Process
+from time import sleep
+
+import zmq
+
+from spyne import Application, ServiceBase, srpc
+from spyne.model import Integer, Unicode
+from spyne.protocol.msgpack import MessagePackDocument
+from spyne.server.zeromq import ZeroMQPreforkServer
+
+
+class SomeService(ServiceBase):
+    @srpc(_returns=Integer)
+    def get_pid():
+        return os.getpid()
+
+    @srpc(Unicode, _returns=Unicode)
+    def echo(s):
+        return s
+
+
+def _get_app():
+    return Application([SomeService], 'tns',
+          in_protocol=MessagePackDocument(), out_protocol=MessagePackDocument())
+
+
+def _get_url(name):
+    return 'ipc://%s' % os.path.join(tempfile.gettempdir(),
+                                    'spyne-test-%s-%d.ipc' % (name, os.getpid()))
+
+
+class TestZeroMQPreforkServer(unittest.TestCase):
+    def setUp(self):
+        self.url = _get_url('prefork')
+        self.server = ZeroMQPreforkServer(_get_app(), self.url, 2,
+                                  be_url=_get_url('backend'), restart_delay=0)
+
+        self.process = Process(target=self.server.serve_forever)
+        self.process.start()
+
+        self.ctx = zmq.Context()
+
+    def tearDown(self):
+        os.kill(self.process.pid, signal.SIGTERM)
+        self.process.join(5)
+        assert self.process.exitcode == 0
+
+        self.ctx.term()
+
+    def _call(self, msg):
+        import msgpack
+
+        socket = self.ctx.socket(zmq.REQ)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect(self.url)
+        try:
+            socket.send(msgpack.packb(msg))
+            assert socket.poll(5000), "no response from server"
+            return msgpack.unpackb(socket.recv())
+        finally:
+            socket.close()
+
+    def _get_pids(self, n=20):
+        return set([self._call({'get_pid': []}) for _ in range(n)])
+
+    def test_workers(self):
+        assert self._call({'echo': [u'hey']}) in (u'hey', b'hey')
+
+        pids = self._get_pids()
+        assert len(pids) == 2
+        assert not (self.process.pid in pids)
+
+    def test_restart(self):
+        pids = self._get_pids()
+        victim = pids.pop()
+        os.kill(victim, signal.SIGKILL)
+
+        sleep(0.5)
+
+        new_pids = self._get_pids()
+        assert len(new_pids) == 2
+        assert not (victim in new_pids)
+        assert pids.issubset(new_pids)
+
+
+if __name__ == '__main__':
+    unittest.main()
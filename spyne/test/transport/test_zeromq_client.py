@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""Tests for the multiplexing ZeroMQ client. Python 3.5+ only."""
+
+import asyncio
+import threading
+import unittest
+
+from time import sleep, time
+
+import zmq
+
+from spyne import Application, ServiceBase, srpc
+from spyne.client.zeromq import ZeroMQClient, ZeroMQConnection, \
+                                                            RequestTimeoutError
+from spyne.error import Fault, ResourceNotFoundError
+from spyne.model import Integer, Unicode
+from spyne.protocol.soap import Soap11
+from spyne.server.zeromq import ZeroMQRouterServer
+
+
+class SomeService(ServiceBase):
+    @srpc(Integer, _returns=Integer)
+    def slow(n):
+        sleep(0.2)
+        return n
+
+    @srpc(Unicode)
+    def fail(s):
+        raise ResourceNotFoundError(s)
+
+
+def _get_app():
+    return Application([SomeService], 'tns',
+                         in_protocol=Soap11(), out_protocol=Soap11())
+
+
+class TestZeroMQClient(unittest.TestCase):
+    def setUp(self):
+        self.ctx = zmq.Context()
+        self.addCleanup(self.ctx.term)
+        self.url = 'inproc://spyne-test-client'
+
+    def _start_server(self):
+        server = ZeroMQRouterServer(_get_app(), self.url, pool_size=10,
+                                                                  ctx=self.ctx)
+        job = threading.Thread(target=server.serve_forever)
+        job.start()
+
+        def _stop():
+            server.stop()
+            job.join(5)
+
+        self.addCleanup(_stop)
+
+    def _get_client(self, **kwargs):
+        client = ZeroMQClient(self.url, _get_app(), ctx=self.ctx, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_threads(self):
+        self._start_server()
+        client = self._get_client()
+        results = []
+
+        def _call(i):
+            results.append(client.service.slow(i))
+
+        start = time()
+        jobs = [threading.Thread(target=_call, args=(i,)) for i in range(10)]
+        for job in jobs:
+            job.start()
+        for job in jobs:
+            job.join()
+
+        assert sorted(results) == list(range(10))
+        assert time() - start < 1.5
+
+    def test_aio(self):
+        self._start_server()
+        client = self._get_client()
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            results = loop.run_until_complete(asyncio.gather(
+                                      *[client.aio.slow(i) for i in range(10)]))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+        assert results == list(range(10))
+
+    def test_fault(self):
+        self._start_server()
+        client = self._get_client()
+
+        with self.assertRaises(Fault) as cm:
+            client.service.fail("x")
+        assert cm.exception.faultcode.endswith('Client.ResourceNotFound')
+
+        assert client.service.slow(1) == 1
+
+    def test_retry_on_fresh_socket(self):
+        server = self.ctx.socket(zmq.ROUTER)
+        server.bind(self.url)
+        self.addCleanup(server.close, 0)
+
+        connection = ZeroMQConnection(self.url, ctx=self.ctx, timeout=0.2,
+                                                                      retries=1)
+        self.addCleanup(connection.close)
+
+        replies = []
+        done = threading.Event()
+        connection.send(b'request', lambda r: (replies.append(r), done.set()))
+
+        # drop the first request, reply to the retry
+        assert server.poll(5000)
+        first = server.recv_multipart()
+        assert server.poll(5000)
+        second = server.recv_multipart()
+
+        assert first[0] != second[0]  # different socket identities
+        assert first[1:] == second[1:]  # same request id and payload
+        assert second[-1] == b'request'
+        server.send_multipart(second[:-1] + [b'reply'])
+
+        assert done.wait(5)
+        assert replies == [b'reply']
+
+    def test_timeout(self):
+        server = self.ctx.socket(zmq.ROUTER)
+        server.bind(self.url)
+        self.addCleanup(server.close, 0)
+
+        client = self._get_client(timeout=0.1, retries=1)
+
+        start = time()
+        with self.assertRaises(RequestTimeoutError):
+            client.service.slow(1)
+
+        assert time() - start >= 0.2
+
+    def test_unreachable_peer(self):
+        # nothing listens there, so requests pile up beyond the high-water mark
+        connection = ZeroMQConnection('tcp://127.0.0.1:1', ctx=self.ctx,
+                                                                   timeout=0.5)
+
+        # fill the wakeup pipe before the I/O thread starts to drain it
+        for _ in range(5000):
+            connection._wakeup()
+
+        num_calls = 1500
+        replies = []
+        done = threading.Event()
+
+        def _cb(reply):
+            replies.append(reply)
+            if len(replies) == num_calls:
+                done.set()
+
+        for _ in range(num_calls):
+            connection.send(b'request', _cb)
+
+        assert done.wait(10)
+        assert all(isinstance(r, RequestTimeoutError) for r in replies)
+
+        start = time()
+        connection.close()
+        assert time() - start < 1
+
+
+if __name__ == '__main__':
+    unittest.main()
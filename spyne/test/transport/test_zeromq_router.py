@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""Tests for the ROUTER-based ZeroMQ server. Python 3.5+ only."""
+
+import asyncio
+import json
+import threading
+import unittest
+
+from time import sleep, time
+
+import zmq
+
+from twisted.internet.defer import Deferred
+
+from spyne import Application, ServiceBase, srpc
+from spyne.error import ResourceNotFoundError
+from spyne.model import Integer, Unicode
+from spyne.protocol.json import JsonDocument
+from spyne.server.zeromq import ZeroMQRouterServer
+
+
+class SomeService(ServiceBase):
+    @srpc(Integer, _returns=Integer)
+    def slow(n):
+        sleep(0.2)
+        return n
+
+    @srpc(Integer, _returns=Integer)
+    async def slow_async(n):
+        await asyncio.sleep(0.2)
+        return n
+
+    @srpc(Integer, _returns=Integer)
+    def slow_deferred(n):
+        d = Deferred()
+        threading.Timer(0.2, d.callback, (n,)).start()
+        return d
+
+    @srpc(Unicode, _returns=Unicode)
+    def failing_deferred(s):
+        d = Deferred()
+        threading.Timer(0.01, d.errback, (ResourceNotFoundError(s),)).start()
+        return d
+
+    @srpc(Unicode)
+    def fail(s):
+        raise ResourceNotFoundError(s)
+
+    @srpc(_returns=Unicode)
+    def crash():
+        raise Exception("boom")
+
+
+class TestZeroMQRouterServer(unittest.TestCase):
+    def setUp(self):
+        app = Application([SomeService], 'tns',
+                          in_protocol=JsonDocument(), out_protocol=JsonDocument())
+
+        self.ctx = zmq.Context()
+        self.url = 'inproc://spyne-test-router'
+        self.server = ZeroMQRouterServer(app, self.url, pool_size=5,
+                                                                  ctx=self.ctx)
+
+        self.job = threading.Thread(target=self.server.serve_forever)
+        self.job.start()
+
+        self.socket = self.ctx.socket(zmq.DEALER)
+        self.socket.setsockopt(zmq.LINGER, 0)
+        self.socket.connect(self.url)
+
+    def tearDown(self):
+        self.socket.close()
+        self.server.stop()
+        self.job.join(5)
+        assert not self.job.is_alive()
+        self.ctx.term()
+
+    def _send(self, body):
+        self.socket.send_multipart([b'', json.dumps(body).encode('utf8')])
+
+    def _recv(self):
+        assert self.socket.poll(5000), "no response from server"
+        delim, data = self.socket.recv_multipart()
+        assert delim == b''
+        return json.loads(data.decode('utf8'))
+
+    def _check_concurrent(self, method):
+        start = time()
+        for i in range(5):
+            self._send({method: {"n": i}})
+
+        results = [self._recv() for _ in range(5)]
+        assert sorted(results) == list(range(5))
+        assert time() - start < 1.0  # 5 x 0.2s if serial
+
+    def test_concurrent(self):
+        self._check_concurrent('slow')
+
+    def test_concurrent_async(self):
+        self._check_concurrent('slow_async')
+
+    def test_concurrent_deferred(self):
+        self._check_concurrent('slow_deferred')
+
+    def test_replies_as_they_complete(self):
+        self._send({"slow": {"n": 1}})
+        self._send({"fail": {"s": "x"}})
+
+        assert self._recv()['faultcode'] == 'Client.ResourceNotFound'
+        assert self._recv() == 1
+
+    def test_faults(self):
+        self._send({"failing_deferred": {"s": "x"}})
+        assert self._recv()['faultcode'] == 'Client.ResourceNotFound'
+
+        self._send({"crash": {}})
+        assert self._recv()['faultcode'] == 'Server'
+
+        self._send({"nonexistent": {}})
+        assert self._recv()['faultcode'].startswith('Client')
+
+        assert self.server.in_flight == 0
+
+    def test_req_client(self):
+        socket = self.ctx.socket(zmq.REQ)
+        socket.setsockopt(zmq.LINGER, 0)
+        socket.connect(self.url)
+        try:
+            for i in range(2):
+                socket.send(json.dumps({"slow": {"n": i}}).encode('utf8'))
+                assert socket.poll(5000), "no response from server"
+                assert json.loads(socket.recv().decode('utf8')) == i
+        finally:
+            socket.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,6 +18,7 @@
 #
 
 import logging
+import weakref
 import functools
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ logger = logging.getLogger(__name__)
 import sys
 import datetime
 
+from collections import OrderedDict
 from inspect import isgeneratorfunction
 from spyne.util.six import PY3
 
@@ -130,34 +132,147 @@ def coroutine(func):
     return start
 
 
+_memoize_registry = weakref.WeakSet()
+
+
 class memoize(object):
-    """A memoization decorator that keeps caching until reset."""
+    """A memoization decorator that keeps caching until reset.
+
+    Classes among the arguments are only weakly referenced, so the entries for
+    a class go away when the class is garbage collected. This only works if
+    the cached results don't hold strong references to the class. Use
+    :meth:`memoize.bounded` to keep only a number of the most recently used
+    entries instead of all of them. See :func:`get_memoize_stats` to inspect
+    all memoize caches at once.
+    """
 
-    def __init__(self, func):
+    def __init__(self, func, maxsize=None):
         self.func = func
-        self.memo = {}
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.memo = self._new_memo()
+        self._watchers = {}
+
+        _memoize_registry.add(self)
+
+    @classmethod
+    def bounded(cls, maxsize):
+        """Returns a decorator that memoizes at most ``maxsize`` entries,
+        evicting the least recently used ones first."""
+
+        return lambda func: cls(func, maxsize=maxsize)
+
+    @property
+    def name(self):
+        return "%s.%s" % (self.func.__module__,
+                   getattr(self.func, '__qualname__', self.func.__name__))
 
     def __call__(self, *args, **kwargs):
         key = self.get_key(args, kwargs)
-        if not key in self.memo:
-            self.memo[key] = self.func(*args, **kwargs)
-        return self.memo[key]
+
+        try:
+            retval = self.memo[key]
+
+        except KeyError:
+            self.misses += 1
+            retval = self.memo[key] = self.func(*args, **kwargs)
+            self._watch(key, args, kwargs)
+
+            if self.maxsize is not None and len(self.memo) > self.maxsize:
+                old_key, _ = self.memo.popitem(last=False)
+                self._watchers.pop(old_key, None)
+
+        else:
+            self.hits += 1
+            if self.maxsize is not None:
+                self.memo.pop(key, None)
+                self.memo[key] = retval
+
+        return retval
 
     def get_key(self, args, kwargs):
-        return tuple(args), tuple(kwargs.items())
+        if len(kwargs) == 0:
+            if len(args) == 1:  # the most common case by far
+                a, = args
+                if isinstance(a, type):
+                    return (weakref.ref(a),), ()
+                return args, ()
+
+            return tuple([_weak_if_class(a) for a in args]), ()
+
+        return tuple([_weak_if_class(a) for a in args]), \
+                tuple([(k, _weak_if_class(v)) for k, v in kwargs.items()])
+
+    def _watch(self, key, args, kwargs):
+        """Arranges for the entry with the given key to be dropped when any of
+        the classes among the given arguments is garbage collected."""
+
+        refs = []
+        callback = functools.partial(self._evict, key)
+        for a in _iter_args(args, kwargs):
+            if isinstance(a, type):
+                refs.append(weakref.ref(a, callback))
+
+        if len(refs) > 0:
+            self._watchers[key] = refs
+
+    def _evict(self, key, _):
+        self.memo.pop(key, None)
+        self._watchers.pop(key, None)
+
+    def _new_memo(self):
+        if self.maxsize is None:
+            return {}
+        return OrderedDict()
+
+    def clear(self):
+        """Drops all entries but keeps the statistics."""
+
+        self.memo = self._new_memo()
+        self._watchers = {}
 
     def reset(self):
-        self.memo = {}
+        """Drops all entries and resets the statistics."""
+
+        self.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        return {
+            'name': self.name,
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.memo),
+            'maxsize': self.maxsize,
+        }
 
 
 class memoize_id(memoize):
     """A memoization decorator that keeps caching until reset for unhashable
-    types. It works on id()'s of objects instead."""
+    types. It works on id()'s of objects instead.
+
+    Entries are dropped when any of their arguments are garbage collected.
+    Arguments that can't be weakly referenced are kept alive by the entry, so
+    that their id()'s can't be reused while the entry is there.
+    """
 
     def get_key(self, args, kwargs):
         return tuple([id(a) for a in args]), \
                                   tuple([(k, id(v)) for k, v in kwargs.items()])
 
+    def _watch(self, key, args, kwargs):
+        refs = []
+        callback = functools.partial(self._evict, key)
+        for a in _iter_args(args, kwargs):
+            try:
+                refs.append(weakref.ref(a, callback))
+            except TypeError:
+                refs.append(a)
+
+        self._watchers[key] = refs
+
 
 class memoize_id_method(memoize_id):
     """A memoization decorator that keeps caching until reset for unhashable
@@ -167,9 +282,104 @@ class memoize_id_method(memoize_id):
         """Support instance methods."""
         fn = functools.partial(self.__call__, obj)
         fn.reset = self.reset
+        fn.clear = self.clear
         return fn
 
 
+class memoize_class(memoize):
+    """A memoization decorator for functions whose first argument is a class.
+
+    The entries are stored in the ``__dict__`` of that class instead of in the
+    decorator, so they die with the class even when the cached results refer
+    back to it, e.g. the type info of a class with a ``SelfReference`` field.
+    Subclasses don't see the entries of their parents. Calls whose first
+    argument is not a class are cached like :class:`memoize` does.
+    """
+
+    def __init__(self, func):
+        super(memoize_class, self).__init__(func)
+        self._classes = weakref.WeakSet()
+
+    def __call__(self, *args, **kwargs):
+        if len(args) == 0 or not isinstance(args[0], type):
+            return super(memoize_class, self).__call__(*args, **kwargs)
+
+        memo = self._get_class_memo(args[0])
+        key = args[1:], tuple(kwargs.items())
+
+        try:
+            retval = memo[key]
+
+        except KeyError:
+            self.misses += 1
+            retval = memo[key] = self.func(*args, **kwargs)
+
+        else:
+            self.hits += 1
+
+        return retval
+
+    def _get_class_memo(self, cls):
+        memos = cls.__dict__.get('_memoize_class_memos', None)
+        if memos is None:
+            memos = {}
+            # skips metaclass hooks, e.g. sqlalchemy's declarative __setattr__
+            type.__setattr__(cls, '_memoize_class_memos', memos)
+
+        memo = memos.get(self, None)
+        if memo is None:
+            memo = memos[self] = {}
+            self._classes.add(cls)
+
+        return memo
+
+    def _iter_class_memos(self):
+        for cls in list(self._classes):
+            memos = cls.__dict__.get('_memoize_class_memos', None)
+            if memos is not None and self in memos:
+                yield memos, memos[self]
+
+    def clear(self):
+        super(memoize_class, self).clear()
+
+        for memos, _ in self._iter_class_memos():
+            del memos[self]
+        self._classes = weakref.WeakSet()
+
+    def get_stats(self):
+        retval = super(memoize_class, self).get_stats()
+        retval['size'] += sum(len(m) for _, m in self._iter_class_memos())
+        return retval
+
+
+def _weak_if_class(obj):
+    if isinstance(obj, type):
+        return weakref.ref(obj)
+    return obj
+
+
+def _iter_args(args, kwargs):
+    for a in args:
+        yield a
+    for v in kwargs.values():
+        yield v
+
+
+def get_memoize_stats():
+    """Returns a list of dicts with the name, hit and miss counts, size and
+    maximum size of every live memoize cache."""
+
+    return sorted((m.get_stats() for m in list(_memoize_registry)),
+                                                       key=lambda d: d['name'])
+
+
+def reset_memoize_caches():
+    """Empties every live memoize cache."""
+
+    for m in list(_memoize_registry):
+        m.reset()
+
+
 def sanitize_args(a):
     try:
         args, kwargs = a
@@ -0,0 +1,68 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""Helpers for working with asyncio coroutines and futures. These are safe to
+import on Python versions without asyncio, where nothing is awaitable."""
+
+try:
+    import asyncio
+    from collections.abc import Coroutine
+except ImportError:
+    asyncio = None
+
+
+def is_awaitable(obj):
+    """Returns True when ``obj`` is a coroutine or an asyncio future.
+
+    Plain generators are not coroutines here, as they are valid return values
+    for ``Iterable`` types. Other awaitables like Twisted's ``Deferred`` are
+    left out as well, as they are handled by their own transports."""
+
+    if asyncio is None:
+        return False
+
+    return isinstance(obj, (Coroutine, asyncio.Future))
+
+
+def get_running_loop():
+    """Returns the running asyncio event loop, or None if there isn't one."""
+
+    if asyncio is None:
+        return None
+
+    get = getattr(asyncio, 'get_running_loop', None)
+    if get is None:
+        # Python < 3.7
+        return asyncio._get_running_loop()
+
+    try:
+        return get()
+    except RuntimeError:
+        return None
+
+
+def get_pending(ctx):
+    """Returns the future that ``Application.process_request`` puts in
+    ``ctx.out_object`` when the user function returns an awaitable, or None
+    when the result is already there."""
+
+    oobj = ctx.out_object
+    if ctx.out_error is None and isinstance(oobj, list) and len(oobj) == 1 \
+                                                     and is_awaitable(oobj[0]):
+        return oobj[0]